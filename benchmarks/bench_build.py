@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""정적 사이트 빌드 벤치마크 (합성 카탈로그 크기별 단계 시간/메모리/파일 수 측정)
+
+사용법:
+    python benchmarks/bench_build.py                        # 10, 100, 1000, 10000 프로젝트 (표는 stderr, JSON 은 stdout)
+    python benchmarks/bench_build.py --sizes 10,100,1000 --output result.json
+    python benchmarks/bench_build.py --save baseline.json   # 기준값 저장
+    python benchmarks/bench_build.py --compare baseline.json --threshold 0.15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = "10,100,1000,10000"
+IMAGE_POOL_SIZE = 12
+TECH_POOL = [
+    "Python",
+    "Trino",
+    "Apache Kafka",
+    "Redshift",
+    "BigQuery",
+    "Terraform",
+    "AWS Lambda",
+    "DynamoDB",
+    "Snowflake",
+    "FastAPI",
+    "Docker",
+    "Prefect",
+    "ElasticSearch",
+    "Redis",
+]
+WORDS = [
+    "데이터",
+    "파이프라인",
+    "실시간",
+    "클러스터",
+    "비용",
+    "최적화",
+    "모니터링",
+    "아키텍처",
+    "pipeline",
+    "latency",
+    "throughput",
+    "warehouse",
+    "schema",
+    "partition",
+    "snapshot",
+]
+
+
+def _png_bytes(width: int, height: int, seed: int) -> bytes:
+    """Pillow 없이 만드는 노이즈 PNG (압축이 잘 되지 않는 실제 스크린샷 크기 재현)"""
+    rng = random.Random(seed)
+    rows = b"".join(b"\x00" + rng.randbytes(width * 3) for _ in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _markdown_body(
+    rng: random.Random, project_id: str, image_url: str, paragraphs: int
+) -> str:
+    """코드 블록/표/이미지를 포함한 긴 마크다운 본문 생성"""
+    parts = [f"## {project_id} 개요\n"]
+    for index in range(paragraphs):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(60))
+        parts.append(
+            f"### 섹션 {index + 1}\n\n**핵심**: {sentence}\n\n- {sentence[:80]}\n- {sentence[80:160]}\n"
+        )
+        if index % 3 == 0:
+            parts.append(
+                "```python\n"
+                + "\n".join(
+                    f"def step_{index}_{n}(rows):\n    return [row for row in rows if row['id'] % {n + 2} == 0]"
+                    for n in range(8)
+                )
+                + "\n```\n"
+            )
+        if index % 4 == 0:
+            parts.append(f"![diagram]({image_url})\n")
+    parts.append(
+        "| 항목 | 값 |\n|---|---|\n"
+        + "\n".join(f"| metric_{n} | {n * 17} |" for n in range(10))
+    )
+    return "\n".join(parts)
+
+
+def generate_workspace(
+    workspace: Path, size: int, paragraphs: int, seed: int = 42
+) -> list:
+    """합성 카탈로그 작업 공간 생성 (templates/vendor/site.yaml 복사 + content/static 생성) 후 프로젝트 목록 반환"""
+    rng = random.Random(seed)
+    shutil.copytree(ROOT_DIR / "templates", workspace / "templates")
+    shutil.copytree(ROOT_DIR / "vendor", workspace / "vendor")
+    content_dir = workspace / "content" / "projects"
+    image_dir = workspace / "static" / "images" / "projects" / "bench"
+    content_dir.mkdir(parents=True)
+    image_dir.mkdir(parents=True)
+
+    images = []
+    for index in range(IMAGE_POOL_SIZE):
+        path = image_dir / f"image_{index}.png"
+        path.write_bytes(_png_bytes(960, 540, seed + index))
+        images.append(f"/static/images/projects/bench/{path.name}")
+
+    projects = []
+    for index in range(size):
+        project_id = f"bench-project-{index:05d}"
+        start_year = 2019 + index % 6
+        image_url = images[index % len(images)]
+        projects.append(
+            {
+                "id": project_id,
+                "title": f"벤치마크 프로젝트 {index}",
+                "period": f"{start_year}.01 - {start_year + 1}.06",
+                "description": " ".join(rng.choice(WORDS) for _ in range(40)),
+                "tech_stack": rng.sample(TECH_POOL, 6),
+                "image": image_url,
+                "highlights": [f"{rng.choice(WORDS)} {n * 10}% 개선" for n in range(4)],
+            }
+        )
+        (content_dir / f"{project_id}.md").write_text(
+            _markdown_body(rng, project_id, image_url, paragraphs), encoding="utf-8"
+        )
+
+    # 콘텐츠 저장소 입력 (큰 카탈로그는 YAML보다 파싱이 빠른 JSON으로 작성)
+    shutil.copy2(
+        ROOT_DIR / "content" / "site.yaml", workspace / "content" / "site.yaml"
+    )
+    (workspace / "content" / "projects.json").write_text(
+        json.dumps(projects, ensure_ascii=False), encoding="utf-8"
+    )
+    return projects
+
+
+def run_worker(workspace: Path, jobs: int, incremental_rerun: bool) -> dict:
+    """(하위 프로세스) 작업 공간에서 빌드를 실행하고 측정값 반환"""
+    os.chdir(workspace)
+    sys.path.insert(0, str(ROOT_DIR))
+    import build_static
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = build_static.build_static_site(jobs=jobs)
+        if incremental_rerun:
+            report["incremental_rerun"] = build_static.build_static_site(
+                incremental=True, jobs=jobs
+            )
+
+    output_files = [
+        path for path in build_static.OUTPUT_DIR.rglob("*") if path.is_file()
+    ]
+    report["files_written"] = len(output_files)
+    report["output_bytes"] = sum(path.stat().st_size for path in output_files)
+    # Linux는 KB, macOS는 바이트 단위
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report["peak_rss_kb"] = max_rss // 1024 if sys.platform == "darwin" else max_rss
+    return report
+
+
+def run_scenario(
+    size: int, paragraphs: int, jobs: int, incremental_rerun: bool
+) -> dict:
+    """카탈로그 크기 1개에 대한 측정 (격리된 하위 프로세스에서 빌드)"""
+    with tempfile.TemporaryDirectory(prefix=f"bench-build-{size}-") as tmp:
+        workspace = Path(tmp)
+        generate_workspace(workspace, size, paragraphs)
+        cmd = [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--worker",
+            str(workspace),
+            "--jobs",
+            str(jobs),
+        ]
+        if incremental_rerun:
+            cmd.append("--incremental-rerun")
+        completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{size}개 프로젝트 빌드 실패:\n{completed.stderr}")
+        result = json.loads(completed.stdout)
+    result["projects"] = size
+    return result
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> list:
+    """기준값 대비 단계별 변화율 비교, 임계값을 넘는 회귀 목록 반환"""
+    regressions = []
+    baseline_by_size = {result["projects"]: result for result in baseline["results"]}
+    print(f"\n📊 기준값 비교 (회귀 임계값 +{threshold:.0%})", file=sys.stderr)
+    for result in current["results"]:
+        base = baseline_by_size.get(result["projects"])
+        if base is None:
+            continue
+        print(f"  [{result['projects']} projects]", file=sys.stderr)
+        pairs = list(result["stages"].items()) + [
+            ("total", result["total"]),
+            ("peak_rss_kb", result["peak_rss_kb"]),
+        ]
+        for name, value in pairs:
+            base_value = (
+                base["stages"].get(name) if name in result["stages"] else base.get(name)
+            )
+            if not base_value:
+                continue
+            change = (value - base_value) / base_value
+            # 아주 짧은 단계(5ms 미만)는 측정 잡음이 커서 회귀 판정에서 제외
+            regressed = change > threshold and (
+                name == "peak_rss_kb" or base_value >= 0.005
+            )
+            marker = "❌" if regressed else "  "
+            print(
+                f"   {marker} {name:<15} {base_value:>12.4f} → {value:>12.4f} ({change:+.1%})",
+                file=sys.stderr,
+            )
+            if regressed:
+                regressions.append(
+                    f"{result['projects']} projects / {name}: {change:+.1%}"
+                )
+    return regressions
+
+
+def print_results(results: dict):
+    """측정 결과 표 출력 (표준 출력은 JSON 전용이므로 stderr)"""
+    for result in results["results"]:
+        print(
+            f"\n🏗️  {result['projects']} projects - total {result['total'] * 1000:.1f}ms, "
+            f"peak RSS {result['peak_rss_kb'] / 1024:.1f}MB, files {result['files_written']}",
+            file=sys.stderr,
+        )
+        for name, seconds in result["stages"].items():
+            print(f"   {name:<15} {seconds * 1000:10.1f}ms", file=sys.stderr)
+        if "incremental_rerun" in result:
+            print(
+                f"   (변경 없는 증분 재빌드: {result['incremental_rerun']['total'] * 1000:.1f}ms)",
+                file=sys.stderr,
+            )
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="build_static 단계별 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"쉼표로 구분한 카탈로그 크기 (기본: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=20, help="프로젝트당 마크다운 섹션 수"
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="build_static --jobs 값")
+    parser.add_argument(
+        "--incremental-rerun", action="store_true", help="변경 없는 증분 재빌드도 측정"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    parser.add_argument("--save", help="결과를 기준값(baseline) JSON으로 저장")
+    parser.add_argument("--compare", help="기준값 JSON과 비교 (회귀 시 종료 코드 1)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="회귀 판정 임계값 (기본 0.10 = 10%%)",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    if args.worker:
+        print(
+            json.dumps(run_worker(Path(args.worker), args.jobs, args.incremental_rerun))
+        )
+        return
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": args.jobs,
+        "paragraphs": args.paragraphs,
+        "results": [],
+    }
+    for size in (int(value) for value in args.sizes.split(",") if value.strip()):
+        print(f"⏳ {size}개 프로젝트 빌드 측정 중...", file=sys.stderr)
+        results["results"].append(
+            run_scenario(size, args.paragraphs, args.jobs, args.incremental_rerun)
+        )
+
+    print_results(results)
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    if args.save:
+        Path(args.save).write_text(payload, encoding="utf-8")
+        print(f"\n💾 기준값 저장: {args.save}", file=sys.stderr)
+    if not args.output and not args.save:
+        print(payload)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(
+                "\n❌ 성능 회귀 감지:\n  " + "\n  ".join(regressions), file=sys.stderr
+            )
+            sys.exit(1)
+        print("\n✅ 회귀 없음", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""FastAPI 앱 HTTP 부하/지연 시간 벤치마크
+
+모드:
+    http  - uvicorn으로 localhost에 앱을 띄우고(또는 --url 대상) keep-alive 연결로 부하 발생
+    asgi  - 네트워크 없이 프로세스 내에서 ASGI 앱을 직접 호출 (요청당 메모리 할당량 측정 포함)
+
+사용법:
+    python benchmarks/bench_http.py --concurrency 32 --requests 2000
+    python benchmarks/bench_http.py --mode asgi --requests 500 --output result.json
+    python benchmarks/bench_http.py --url http://127.0.0.1:8000 --routes home,project
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_ACCEPT_ENCODING = "gzip, br"
+
+
+def default_routes() -> Dict[str, str]:
+    """측정 대상 라우트 (이름: 경로)"""
+    sys.path.insert(0, str(ROOT_DIR))
+    from data.portfolio_data import get_projects
+
+    project = get_projects()[0]
+    return {
+        "home": "/",
+        "project": f"/project/{project['id']}",
+        "project_404": "/project/does-not-exist",
+        "not_found": "/no-such-page",
+        "static_image": project["image"],
+        "search": "/search?q=%EC%8B%A4%EC%8B%9C%EA%B0%84%20Redshift",
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """정렬된 값의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def summarize(
+    latencies: List[float], elapsed: float, errors: int, statuses: Dict[int, int]
+) -> Dict:
+    """지연 시간 목록을 처리량/백분위수 요약으로 변환"""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "throughput_rps": len(ordered) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "mean": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+            "p50": percentile(ordered, 0.50) * 1000,
+            "p95": percentile(ordered, 0.95) * 1000,
+            "p99": percentile(ordered, 0.99) * 1000,
+            "max": ordered[-1] * 1000 if ordered else 0.0,
+        },
+    }
+
+
+# ---------------------------------------------------------------- http 모드
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """HTTP/1.1 응답 1개를 끝까지 읽고 상태 코드 반환 (Content-Length / chunked 지원)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status
+
+
+async def _http_client(
+    host: str,
+    port: int,
+    path: str,
+    accept_encoding: str,
+    queue: asyncio.Queue,
+    latencies: List[float],
+    statuses: Dict[int, int],
+    counters: Dict[str, int],
+):
+    """keep-alive 연결 1개로 큐가 빌 때까지 요청 반복"""
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+        f"Accept-Encoding: {accept_encoding}\r\nConnection: keep-alive\r\n\r\n"
+    ).encode()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            start = time.perf_counter()
+            try:
+                writer.write(request)
+                await writer.drain()
+                status = await _read_response(reader)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                counters["errors"] += 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def bench_http_route(
+    host: str,
+    port: int,
+    path: str,
+    requests: int,
+    concurrency: int,
+    accept_encoding: str,
+) -> Dict:
+    """라우트 1개에 대한 HTTP 부하 측정"""
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    counters = {"errors": 0}
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _http_client(
+                host, port, path, accept_encoding, queue, latencies, statuses, counters
+            )
+            for _ in range(min(concurrency, requests))
+        )
+    )
+    return summarize(
+        latencies, time.perf_counter() - start, counters["errors"], statuses
+    )
+
+
+def _free_port() -> int:
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, server_args: List[str]) -> subprocess.Popen:
+    """uvicorn으로 앱 실행 후 포트가 열릴 때까지 대기"""
+    cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+        *server_args,
+    ]
+    process = subprocess.Popen(cmd, cwd=ROOT_DIR)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("서버가 시작 직후 종료되었습니다.")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("서버 시작 대기 시간 초과")
+
+
+def run_http_mode(args, routes: Dict[str, str]) -> Dict:
+    """http 모드 전체 측정"""
+    process = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", _free_port()
+        process = start_server(port, args.server_arg)
+    try:
+        results = {}
+        for name, path in routes.items():
+            # 예열 (캐시 채우기) 후 측정
+            asyncio.run(
+                bench_http_route(host, port, path, args.warmup, 1, args.accept_encoding)
+            )
+            print(f"⏳ {name} ({path}) 측정 중...", file=sys.stderr)
+            results[name] = {
+                "path": path,
+                **asyncio.run(
+                    bench_http_route(
+                        host,
+                        port,
+                        path,
+                        args.requests,
+                        args.concurrency,
+                        args.accept_encoding,
+                    )
+                ),
+            }
+        return results
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+# ---------------------------------------------------------------- asgi 모드
+
+
+async def _asgi_request(app, path: str, accept_encoding: str) -> int:
+    """ASGI 앱을 직접 호출해 응답 상태 코드 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "server": ("127.0.0.1", 8000),
+        "client": ("127.0.0.1", 50000),
+        "headers": [
+            (b"host", b"127.0.0.1:8000"),
+            (b"accept-encoding", accept_encoding.encode()),
+        ],
+    }
+    status = 0
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            await asyncio.sleep(3600)
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def bench_asgi_route(
+    app,
+    path: str,
+    requests: int,
+    concurrency: int,
+    accept_encoding: str,
+    alloc_samples: int,
+) -> Dict:
+    """라우트 1개에 대한 프로세스 내 측정 (처리량/지연 + 요청당 최대 할당량)"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                status = await _asgi_request(app, path, accept_encoding)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    result = summarize(latencies, time.perf_counter() - start, errors, statuses)
+
+    # 요청 1개 처리 중 늘어난 최대 할당 메모리 (tracemalloc은 느리므로 별도 샘플로 측정)
+    peaks, blocks = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            blocks_before = sys.getallocatedblocks()
+            await _asgi_request(app, path, accept_encoding)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+    finally:
+        tracemalloc.stop()
+    result["alloc"] = {
+        "peak_kb_per_request": statistics.median(peaks) / 1024 if peaks else 0.0,
+        "retained_blocks_per_request": statistics.median(blocks) if blocks else 0,
+    }
+    return result
+
+
+def run_asgi_mode(args, routes: Dict[str, str]) -> Dict:
+    """asgi 모드 전체 측정"""
+    os.chdir(ROOT_DIR)
+    from main import app
+
+    async def run_all():
+        results = {}
+        async with app.router.lifespan_context(app):
+            for name, path in routes.items():
+                for _ in range(args.warmup):
+                    await _asgi_request(app, path, args.accept_encoding)
+                print(f"⏳ {name} ({path}) 측정 중...", file=sys.stderr)
+                results[name] = {
+                    "path": path,
+                    **await bench_asgi_route(
+                        app,
+                        path,
+                        args.requests,
+                        args.concurrency,
+                        args.accept_encoding,
+                        args.alloc_samples,
+                    ),
+                }
+        return results
+
+    return asyncio.run(run_all())
+
+
+# ---------------------------------------------------------------- CLI
+
+
+def print_table(results: Dict):
+    """측정 결과 표 출력"""
+    print(
+        f"\n{'route':<14} {'req':>6} {'err':>4} {'rps':>10} {'p50':>8} {'p95':>8} {'p99':>8} {'alloc':>10}",
+        file=sys.stderr,
+    )
+    for name, result in results["routes"].items():
+        latency = result["latency_ms"]
+        alloc = (
+            f"{result['alloc']['peak_kb_per_request']:.1f}KB"
+            if "alloc" in result
+            else "-"
+        )
+        print(
+            f"{name:<14} {result['requests']:>6} {result['errors']:>4} {result['throughput_rps']:>10.1f} "
+            f"{latency['p50']:>7.2f}ms {latency['p95']:>7.2f}ms {latency['p99']:>7.2f}ms {alloc:>10}",
+            file=sys.stderr,
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="FastAPI 앱 HTTP 부하/지연 시간 벤치마크"
+    )
+    parser.add_argument("--mode", choices=["http", "asgi"], default="http")
+    parser.add_argument(
+        "--url", help="이미 실행 중인 서버 주소 (지정하면 서버를 띄우지 않음)"
+    )
+    parser.add_argument("--routes", help="측정할 라우트 이름 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--concurrency", "-c", type=int, default=16)
+    parser.add_argument(
+        "--requests", "-n", type=int, default=1000, help="라우트당 요청 수"
+    )
+    parser.add_argument("--warmup", type=int, default=20, help="라우트당 예열 요청 수")
+    parser.add_argument(
+        "--alloc-samples", type=int, default=50, help="asgi 모드 할당량 측정 요청 수"
+    )
+    parser.add_argument("--accept-encoding", default=DEFAULT_ACCEPT_ENCODING)
+    parser.add_argument(
+        "--server-arg",
+        action="append",
+        default=[],
+        help="uvicorn 추가 인자 (예: --server-arg=--workers=4)",
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    return parser.parse_args(argv)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    routes = default_routes()
+    if args.routes:
+        selected = [name.strip() for name in args.routes.split(",")]
+        unknown = [name for name in selected if name not in routes]
+        if unknown:
+            sys.exit(
+                f"❌ 알 수 없는 라우트: {', '.join(unknown)} (사용 가능: {', '.join(routes)})"
+            )
+        routes = {name: routes[name] for name in selected}
+
+    runner = run_asgi_mode if args.mode == "asgi" else run_http_mode
+    results = {
+        "mode": args.mode,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "concurrency": args.concurrency,
+        "requests_per_route": args.requests,
+        "accept_encoding": args.accept_encoding,
+        "routes": runner(args, routes),
+    }
+    print_table(results)
+
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""마크다운 렌더링 벤치마크 (기존 markdown.markdown 호출 vs 인스턴스 풀 + 하이라이트 캐시 엔진)
+
+측정 방식:
+    baseline   - 문서마다 markdown.markdown(text, extensions=['codehilite', 'fenced_code']) (기존 방식)
+    cold       - 빈 하이라이트 캐시로 시작한 엔진 (첫 렌더링 = 하이라이트 후 저장)
+    warm_disk  - 새 프로세스처럼 메모리는 비어 있고 디스크 캐시만 있는 엔진
+    warm       - 메모리 캐시까지 채워진 엔진 (서버 정상 상태)
+
+사용법:
+    python benchmarks/bench_markdown.py
+    python benchmarks/bench_markdown.py --repeat 50 --files content/projects/streaming-data-collection.md
+    python benchmarks/bench_markdown.py --output markdown.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_FILES = "content/projects/*.md"
+
+
+def load_documents(pattern: str) -> Dict[str, str]:
+    """frontmatter 를 제외한 마크다운 본문 (파일 이름: 본문)"""
+    import frontmatter
+
+    paths = []
+    for item in pattern.split(","):
+        item = item.strip()
+        paths.extend(sorted(ROOT_DIR.glob(item)) if "*" in item else [ROOT_DIR / item])
+    return {
+        path.name: frontmatter.loads(path.read_text(encoding="utf-8")).content
+        for path in paths
+    }
+
+
+def measure(render: Callable[[str], str], text: str, repeat: int) -> Dict[str, float]:
+    """repeat 회 렌더링 시간 (ms) 요약"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "mean_ms": round(statistics.mean(timings), 3),
+        "min_ms": round(min(timings), 3),
+    }
+
+
+def run(documents: Dict[str, str], repeat: int) -> Dict:
+    """문서별 방식별 측정 (엔진 결과가 기존 방식과 같은지도 확인)"""
+    import markdown
+
+    from data.markdown_engine import HighlightCache, MarkdownEngine
+
+    def baseline(text: str) -> str:
+        return markdown.markdown(text, extensions=["codehilite", "fenced_code"])
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-highlight-") as cache_dir:
+        for name, text in documents.items():
+            expected = baseline(text)
+            cold_timings = []
+            for index in range(repeat):
+                # 매번 빈 캐시 디렉토리로 새 엔진을 만들어 첫 렌더링 비용 측정 (인스턴스 생성 제외)
+                engine = MarkdownEngine(
+                    highlight_cache=HighlightCache(Path(cache_dir) / f"{name}-{index}")
+                )
+                with engine.acquire():
+                    pass
+                start = time.perf_counter()
+                engine.render(text)
+                cold_timings.append((time.perf_counter() - start) * 1000)
+
+            shared = HighlightCache(Path(cache_dir) / f"{name}-shared")
+            MarkdownEngine(highlight_cache=shared).render(text)
+            warm_engine = MarkdownEngine(highlight_cache=shared)
+            if warm_engine.render(text) != expected:
+                raise RuntimeError(f"{name}: 엔진 출력이 기존 방식과 다릅니다")
+
+            def warm_disk(text: str) -> str:
+                return MarkdownEngine(
+                    highlight_cache=HighlightCache(shared.directory)
+                ).render(text)
+
+            results[name] = {
+                "bytes": len(text.encode("utf-8")),
+                "code_blocks": text.count("```") // 2,
+                "baseline": measure(baseline, text, repeat),
+                "cold": {
+                    "mean_ms": round(statistics.mean(cold_timings), 3),
+                    "min_ms": round(min(cold_timings), 3),
+                },
+                "warm_disk": measure(warm_disk, text, repeat),
+                "warm": measure(warm_engine.render, text, repeat),
+            }
+    return results
+
+
+def print_table(results: Dict):
+    """측정 결과 표 출력 (평균 ms, 기존 방식 대비 배수)"""
+    print(
+        f"\n{'document':<46} {'code':>4} {'baseline':>10} {'cold':>10} {'warm_disk':>10} {'warm':>10} {'speedup':>8}",
+        file=sys.stderr,
+    )
+    for name, result in results["documents"].items():
+        baseline = result["baseline"]["mean_ms"]
+        warm = result["warm"]["mean_ms"]
+        print(
+            f"{name:<46} {result['code_blocks']:>4} {baseline:>8.2f}ms {result['cold']['mean_ms']:>8.2f}ms "
+            f"{result['warm_disk']['mean_ms']:>8.2f}ms {warm:>8.2f}ms {baseline / warm:>7.1f}x",
+            file=sys.stderr,
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="마크다운 렌더링 벤치마크")
+    parser.add_argument(
+        "--files", default=DEFAULT_FILES, help="측정할 마크다운 파일 (glob, 쉼표 구분)"
+    )
+    parser.add_argument(
+        "--repeat", "-n", type=int, default=20, help="문서/방식별 반복 횟수"
+    )
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    return parser.parse_args(argv)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    sys.path.insert(0, str(ROOT_DIR))
+    documents = load_documents(args.files)
+    if not documents:
+        sys.exit(f"❌ 측정할 마크다운 파일이 없습니다: {args.files}")
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "documents": run(documents, args.repeat),
+    }
+    print_table(results)
+
+    payload = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""빠른 시작용 의존성 확인/설치 모듈 (import 없이 메타데이터로 확인 + 결과 캐시)
+
+사용법:
+    python bootstrap.py                 # 의존성 확인 (필요할 때만 설치)
+    python bootstrap.py importtime      # main 모듈 import 시간 분석 (-X importtime)
+    python bootstrap.py importtime build_static --top 15
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import sysconfig
+import time
+from collections import defaultdict
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REQUIREMENTS_FILE = Path("requirements.txt")
+LOCK_FILES = (Path("uv.lock"), REQUIREMENTS_FILE, Path("pyproject.toml"))
+CACHE_PATH = Path(".cache/deps.json")
+
+# 'uvicorn[standard]>=0.24.0' → ('uvicorn', '0.24.0')
+REQUIREMENT_PATTERN = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(?:>=\s*([\w.]+))?")
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def read_requirements(path: Path = REQUIREMENTS_FILE) -> List[str]:
+    """requirements.txt 의 요구사항 목록 (주석/빈 줄 제외)"""
+    if not path.exists():
+        return []
+    lines = (line.split("#", 1)[0].strip() for line in path.read_text(encoding="utf-8").splitlines())
+    return [line for line in lines if line]
+
+
+def _release(version: str) -> Tuple[int, ...]:
+    """'0.104.1' → (0, 104, 1) (숫자가 아닌 접미사는 무시)"""
+    parts = []
+    for part in version.split("."):
+        digits = re.match(r"\d+", part)
+        if digits is None:
+            break
+        parts.append(int(digits.group()))
+    return tuple(parts)
+
+
+def is_satisfied(requirement: str) -> bool:
+    """설치된 배포판 메타데이터로 요구사항 충족 여부 확인 (패키지를 import 하지 않음)"""
+    match = REQUIREMENT_PATTERN.match(requirement)
+    if match is None:
+        return True
+    name, minimum = match.groups()
+    try:
+        installed = metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return False
+    return minimum is None or _release(installed) >= _release(minimum)
+
+
+def environment_key() -> str:
+    """의존성 확인 결과 캐시 키 (락/요구사항 파일 내용 + 인터프리터 + site-packages 변경 시각)"""
+    digest = hashlib.sha256()
+    for path in LOCK_FILES:
+        if path.exists():
+            digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    digest.update(sys.executable.encode())
+    site_packages = Path(sysconfig.get_paths()["purelib"])
+    if site_packages.exists():
+        # 패키지 설치/삭제 시 디렉토리 mtime이 바뀌므로 캐시가 자동 무효화됨
+        digest.update(str(site_packages.stat().st_mtime_ns).encode())
+    return digest.hexdigest()
+
+
+def _load_cache() -> Dict:
+    try:
+        return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(key: str):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps({"key": key, "checked_at": time.time()}), encoding="utf-8")
+    except OSError:
+        pass  # 캐시는 선택 사항
+
+
+def missing_requirements(requirements: Optional[List[str]] = None, use_cache: bool = True) -> List[str]:
+    """충족되지 않은 요구사항 목록 (이전 확인 이후 환경이 같으면 바로 빈 목록)"""
+    key = environment_key()
+    if use_cache and _load_cache().get("key") == key:
+        return []
+    if requirements is None:
+        requirements = read_requirements()
+    missing = [requirement for requirement in requirements if not is_satisfied(requirement)]
+    if not missing:
+        _save_cache(key)
+    return missing
+
+
+def install(requirements: List[str]) -> bool:
+    """누락된 요구사항만 한 번의 명령으로 설치 (uv pip 우선, 없으면 pip)"""
+    if not requirements:
+        return True
+    print(f"📦 누락된 의존성 설치: {', '.join(requirements)}")
+    if shutil.which("uv"):
+        commands = [["uv", "pip", "install", "--python", sys.executable, *requirements]]
+    else:
+        commands = []
+    commands.append([sys.executable, "-m", "pip", "install", *requirements])
+
+    for command in commands:
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            print("✅ 의존성 설치 완료!")
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+    print("❌ 의존성 설치에 실패했습니다. 수동으로 설치해주세요:")
+    print(f"pip install -r {REQUIREMENTS_FILE}")
+    return False
+
+
+def ensure_dependencies() -> bool:
+    """의존성 확인 후 필요할 때만 설치 (소요 시간 출력)"""
+    start = time.perf_counter()
+    missing = missing_requirements()
+    if missing and not (install(missing) and not missing_requirements(use_cache=False)):
+        return False
+    print(f"✅ 모든 의존성이 준비되었습니다! ({(time.perf_counter() - start) * 1000:.0f}ms)")
+    return True
+
+
+def importtime_report(module: str, top: int = 20) -> List[Tuple[str, int, int]]:
+    """python -X importtime 결과를 최상위 패키지별 (이름, 자체 μs, 누적 μs)로 집계"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env={**os.environ, "PYTHONPATH": os.getcwd()},
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    self_times: Dict[str, int] = defaultdict(int)
+    cumulative: Dict[str, int] = defaultdict(int)
+    # importtime은 자식 모듈을 부모보다 먼저 출력하므로 역순으로 읽으며 부모 스택 유지
+    parents: List[Tuple[int, str]] = []
+    for line in reversed(completed.stderr.splitlines()):
+        match = IMPORTTIME_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth, package = len(indent), name.split(".")[0]
+        while parents and parents[-1][0] >= depth:
+            parents.pop()
+        self_times[package] += int(self_us)
+        # 같은 패키지 안에서 중첩된 import는 바깥 항목의 누적 시간에 이미 포함됨
+        if not parents or parents[-1][1] != package:
+            cumulative[package] += int(cumulative_us)
+        parents.append((depth, package))
+    rows = [(package, self_times[package], cumulative[package]) for package in self_times]
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="의존성 확인 및 import 시간 분석")
+    sub = parser.add_subparsers(dest="command")
+    report = sub.add_parser("importtime", help="모듈 import 시간 분석")
+    report.add_argument("module", nargs="?", default="main", help="분석할 모듈 (기본: main)")
+    report.add_argument("--top", type=int, default=20, help="출력할 패키지 수")
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    if args.command == "importtime":
+        rows = importtime_report(args.module, args.top)
+        total = sum(row[1] for row in rows)
+        print(f"⏱️  import {args.module} - 상위 {len(rows)}개 패키지 자체 시간 합계 {total / 1000:.1f}ms")
+        print(f"   {'package':<24} {'self':>10} {'cumulative':>12}")
+        for package, self_us, cumulative_us in rows:
+            print(f"   {package:<24} {self_us / 1000:>8.1f}ms {cumulative_us / 1000:>10.1f}ms")
+        return
+    if not ensure_dependencies():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,128 +1,718 @@
 #!/usr/bin/env python3
 """정적 HTML 파일 생성 스크립트 (GitHub Pages 배포용)"""
 
+import argparse
+import os
 import shutil
-import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from data.portfolio_data import get_portfolio_data, get_project_by_id, PROJECTS_DATA
+from typing import Dict, Optional
+
+from jinja2 import Environment
+
+from bootstrap import ensure_dependencies
+from compression import brotli, precompress_directory
+from data.portfolio_data import (
+    PROJECTS_PER_PAGE,
+    get_portfolio_data,
+    get_project_by_id,
+    get_projects,
+    get_search_index,
+    invalidate_content,
+    load_project_bodies,
+)
+from fingerprint import (
+    ASSET_MANIFEST_SUBPATH,
+    AssetFingerprints,
+    rewrite_urls,
+    write_asset_manifest,
+    write_fingerprinted,
+)
+from fonts import FONT_SOURCE_DIR, build_fonts, subset_available
+from generate_static import SNAPSHOT_PATH, load_snapshot, write_snapshot
+from icons import VENDOR_ICONS, inline_icons
+from images import MANIFEST_SUBPATH, build_image_variants, supported_formats
+from incremental import BuildState, data_digest
+from minify import minify_html
+from static_sync import sync_tree
+from styles import STYLESHEET_SUBPATH, VENDOR_CSS, build_stylesheet
+from templating import (
+    PAGE_TEMPLATES,
+    create_environment,
+    render_fragment,
+    slot,
+    template_files,
+)
+from watcher import DEFAULT_WATCH_PATHS, FileWatcher
 
 OUTPUT_DIR = Path("docs")
-TEMPLATES_DIR = "templates"
 STATIC_DIR = Path("static")
+SEARCH_INDEX_DIR = "search-index"  # 검색 샤드 출력 경로 (OUTPUT_DIR 기준)
 
-def check_uv_installed() -> bool:
-    """UV 설치 확인"""
-    try:
-        subprocess.run(["uv", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ UV가 설치되지 않았습니다. pip로 대체 실행합니다.")
-        return False
-
-def install_dependencies() -> bool:
-    """의존성 설치"""
-    # UV 사용 시도 (간단한 방법)
-    if check_uv_installed():
-        print("📦 UV로 의존성을 설치합니다...")
-        try:
-            packages = [
-                "fastapi>=0.104.1", "jinja2>=3.1.2", "uvicorn[standard]>=0.24.0",
-                "python-multipart>=0.0.6", "markdown>=3.5.1", "pyyaml>=6.0.1", 
-                "python-frontmatter>=1.0.0"
-            ]
-            for package in packages:
-                subprocess.run(["uv", "add", package], check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ UV 설치 실패, pip로 대체합니다.")
-    
-    print("📦 pip로 의존성을 설치합니다...")
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
-        return True
-    except subprocess.CalledProcessError:
-        print("❌ 의존성 설치에 실패했습니다.")
-        return False
-
-def setup_output_directory():
-    """출력 디렉토리 설정"""
-    if OUTPUT_DIR.exists():
-        shutil.rmtree(OUTPUT_DIR)
-    OUTPUT_DIR.mkdir()
-
-def create_main_page(env: Environment, data: dict):
-    """메인 페이지 생성"""
-    print("📄 메인 페이지 생성 중...")
-    template = env.get_template('index.html')
-    html_content = template.render(**data)
-    
-    with open(OUTPUT_DIR / "index.html", "w", encoding="utf-8") as f:
+# 프로세스 풀 워커별 Jinja2 환경 (init_render_worker에서 생성)
+_worker_env: Optional[Environment] = None
+
+
+def setup_output_directory(incremental: bool = False):
+    """출력 디렉토리 설정 (전체 빌드여도 정적 자산은 동기화 단계에서 비교 후 갱신)"""
+    if OUTPUT_DIR.exists() and not incremental:
+        for path in OUTPUT_DIR.iterdir():
+            if path.name == "static" and path.is_dir():
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+
+def write_output(relative: str, html_content: str):
+    """출력 디렉토리에 HTML 파일 저장"""
+    path = OUTPUT_DIR / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
         f.write(html_content)
 
-def create_project_pages(env: Environment):
-    """프로젝트 상세 페이지들 생성"""
+
+def publish_html(html: str, assets: Dict[str, str]) -> str:
+    """배포용 HTML (정적 자산 URL 을 지문 URL 로 치환한 뒤 최소화)"""
+    return minify_html(rewrite_urls(html, assets))
+
+
+def vendor_digest(state: BuildState) -> str:
+    """페이지 출력에 영향을 주는 벤더 자산(유틸리티 CSS, 아이콘 글리프, 웹폰트)의 해시"""
+    fonts = sorted(FONT_SOURCE_DIR.iterdir()) if FONT_SOURCE_DIR.is_dir() else []
+    return state.files_digest([VENDOR_CSS, VENDOR_ICONS, *fonts])
+
+
+def main_page_output(page: int) -> str:
+    """메인 페이지 출력 경로 (프로젝트 목록 2페이지부터는 page/N.html)"""
+    return "index.html" if page == 1 else f"page/{page}.html"
+
+
+def main_page_data(data: dict, page: int) -> dict:
+    """정적 사이트의 메인 페이지 템플릿 컨텍스트 (필터 폼 없이 목록 페이지 링크 사용)"""
+    page_data = data if page == 1 else {**data, **get_portfolio_data(page=page)}
+    return {**page_data, "static_pages": True, "filter_options": None}
+
+
+def create_main_page(env: Environment, data: dict, state: BuildState):
+    """메인 페이지 생성"""
+    template_digest = state.files_digest(template_files(env, "index.html"))
+    template = env.get_template("index.html")
+    pages = data["pagination"]["pages"]
+    for page in range(1, pages + 1):
+        page_data = main_page_data(data, page)
+        output = main_page_output(page)
+        inputs = {
+            "template": template_digest,
+            "styles": vendor_digest(state),
+            "data": data_digest(page_data),
+        }
+        if not state.needs_build(output, inputs):
+            continue
+        print(
+            f"📄 메인 페이지 생성 중... ({page}/{pages})"
+            if pages > 1
+            else "📄 메인 페이지 생성 중..."
+        )
+        write_output(
+            output,
+            publish_html(
+                inline_icons(template.render(**page_data)), data["asset_manifest"]
+            ),
+        )
+
+
+def init_render_worker():
+    """렌더링 워커 초기화 (부모 프로세스가 사전 컴파일한 템플릿 모듈을 불러오는 환경 생성)"""
+    global _worker_env
+    _worker_env = create_environment()
+
+
+def render_project_page(
+    project_id: str, env: Optional[Environment] = None
+) -> Optional[str]:
+    """프로젝트 상세 페이지 HTML 렌더링 (마크다운 변환 + 템플릿 렌더링)"""
+    template = (env or _worker_env).get_template("project.html")
+    project_data = get_project_by_id(project_id)
+    if not project_data:
+        return None
+    return inline_icons(template.render(project=project_data))
+
+
+def create_project_pages(
+    env: Environment, state: BuildState, assets: Dict[str, str], jobs: int = 1
+):
+    """프로젝트 상세 페이지들 생성 (jobs > 1 이면 프로세스 풀에서 병렬 렌더링)"""
     print("📁 프로젝트 페이지 생성 중...")
-    project_dir = OUTPUT_DIR / "project"
-    project_dir.mkdir()
-    
-    template = env.get_template('project.html')
-    
-    for project in PROJECTS_DATA:
-        project_data = get_project_by_id(project['id'])
-        if project_data:
-            html_content = template.render(project=project_data)
-            with open(project_dir / f"{project['id']}.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-
-def create_404_page(env: Environment):
+    template_digest = state.files_digest(template_files(env, "project.html"))
+
+    pending = []
+    for project in get_projects():
+        content_path = Path(f"content/projects/{project['id']}.md")
+        inputs = {
+            "template": template_digest,
+            "styles": vendor_digest(state),
+            "data": data_digest(project),
+            "content": state.file_digest(content_path) if content_path.exists() else "",
+            "assets": data_digest(assets),
+        }
+        if state.needs_build(f"project/{project['id']}.html", inputs):
+            pending.append(project["id"])
+
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)), initializer=init_render_worker
+        ) as executor:
+            futures = [
+                executor.submit(render_project_page, project_id)
+                for project_id in pending
+            ]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+    else:
+        results = []
+        for project_id in pending:
+            try:
+                results.append(render_project_page(project_id, env))
+            except Exception as e:
+                results.append(e)
+
+    # 결과는 카탈로그 순서대로 기록하고, 실패는 모아서 한 번에 보고
+    errors = []
+    for project_id, result in zip(pending, results):
+        if isinstance(result, Exception):
+            errors.append(f"{project_id}: {result}")
+        elif result is not None:
+            write_output(f"project/{project_id}.html", publish_html(result, assets))
+    if errors:
+        raise RuntimeError(
+            f"프로젝트 페이지 {len(errors)}개 렌더링 실패 - " + "; ".join(errors)
+        )
+
+
+def create_404_page(env: Environment, state: BuildState, assets: Dict[str, str]):
     """404 페이지 생성"""
+    inputs = {
+        "template": state.files_digest(template_files(env, "404.html")),
+        "styles": vendor_digest(state),
+        "assets": data_digest(assets),
+    }
+    if not state.needs_build("404.html", inputs):
+        return
     print("❌ 404 페이지 생성 중...")
-    template = env.get_template('404.html')
-    html_content = template.render()
-    
-    with open(OUTPUT_DIR / "404.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+    write_output(
+        "404.html",
+        publish_html(inline_icons(env.get_template("404.html").render()), assets),
+    )
+
+
+def copy_static_files(state: BuildState):
+    """정적 파일 동기화 (변경된 파일만 reflink/하드링크/복사)"""
+    if not STATIC_DIR.exists():
+        return
+    print("📂 정적 파일 동기화 중...")
+    result = sync_tree(STATIC_DIR, OUTPUT_DIR / "static", remove_orphans=False)
+    for relative in result.files:
+        stat = (STATIC_DIR / relative).stat()
+        state.record(
+            f"static/{relative}", {"source": f"{stat.st_size}:{stat.st_mtime_ns}"}
+        )
+    print(f"   {result.summary()}")
+
+
+def optimize_images(state: BuildState) -> dict:
+    """프로젝트 이미지 반응형 변환본(WebP/AVIF) 생성"""
+    formats = supported_formats()
+    if not formats:
+        print("⚠️  Pillow가 없어 이미지 최적화를 건너뜁니다. (pip install pillow)")
+        return {}
+    print(f"🖼️  이미지 최적화 중... ({', '.join(formats)})")
+    manifest = build_image_variants(STATIC_DIR, OUTPUT_DIR / "static")
+
+    # 변환본은 원본보다 최신이면 재사용되므로 출력 목록만 기록
+    state.record(
+        (Path("static") / MANIFEST_SUBPATH).as_posix(), {"data": data_digest(manifest)}
+    )
+    for url, entry in manifest.items():
+        inputs = {"source": state.file_digest(Path(url.lstrip("/")))}
+        for source in entry["sources"]:
+            for candidate in source["srcset"].split(", "):
+                state.record(candidate.split(" ")[0].lstrip("/"), inputs)
+    return manifest
+
+
+def create_stylesheet(state: BuildState) -> str:
+    """사용된 유틸리티 클래스만 담은 스타일시트 생성 (Tailwind CDN 대체)"""
+    print("🎨 스타일시트 생성 중...")
+    css = build_stylesheet(OUTPUT_DIR / "static")
+    state.record(
+        (Path("static") / STYLESHEET_SUBPATH).as_posix(), {"data": data_digest(css)}
+    )
+    print(f"   {len(css.encode('utf-8')) / 1024:.1f}KB")
+    return css
+
+
+def create_fonts(state: BuildState):
+    """사용 중인 Inter 굵기만 subset 해서 셀프 호스팅 (Google Fonts 대체)"""
+    outputs = build_fonts(OUTPUT_DIR / "static")
+    if not outputs:
+        print(f"⚠️  {FONT_SOURCE_DIR} 에 웹폰트가 없어 시스템 글꼴을 사용합니다.")
+        return
+    if not subset_available():
+        print(
+            "⚠️  fontTools/brotli가 없어 웹폰트를 subset 없이 복사합니다. (pip install fonttools brotli)"
+        )
+    print(f"🔤 웹폰트 {len(outputs)}개 생성")
+    for path in outputs:
+        state.record(
+            path.relative_to(OUTPUT_DIR).as_posix(), {"source": state.file_digest(path)}
+        )
+
+
+def create_asset_manifest(state: BuildState) -> Dict[str, str]:
+    """정적 자산 지문 사본 + asset-manifest.json 생성 후 {원본 URL: 지문 URL} 반환"""
+    print("🔖 정적 자산 지문 생성 중...")
+    static_root = OUTPUT_DIR / "static"
+    # 이번 빌드가 기록한 정적 파일만 (원본이 사라진 이전 출력은 finalize 에서 삭제되므로 지문을 만들지 않음)
+    manifest = {
+        url: fingerprinted
+        for url, fingerprinted in AssetFingerprints(static_root).manifest().items()
+        if state.recorded(url.lstrip("/"))
+    }
+    write_fingerprinted(static_root, manifest)
+    write_asset_manifest(static_root, manifest)
+    for url, fingerprinted in manifest.items():
+        state.record(fingerprinted.lstrip("/"), {"source": url})
+    state.record(
+        (Path("static") / ASSET_MANIFEST_SUBPATH).as_posix(),
+        {"data": data_digest(manifest)},
+    )
+    print(f"   파일 {len(manifest)}개")
+    return manifest
+
+
+def create_search_index(state: BuildState) -> str:
+    """검색 인덱스 샤드(meta.json + shard-N.json) 생성 후 클라이언트용 URL 반환"""
+    projects = get_projects()
+    content_paths = [
+        Path(f"content/projects/{project['id']}.md") for project in projects
+    ]
+    inputs = {
+        "data": data_digest(projects),
+        "content": state.files_digest(path for path in content_paths if path.exists()),
+    }
+    directory = OUTPUT_DIR / SEARCH_INDEX_DIR
+    if state.needs_build(f"{SEARCH_INDEX_DIR}/meta.json", inputs):
+        print("🔎 검색 인덱스 생성 중...")
+        index = get_search_index()
+        paths = index.write_shards(directory)
+        print(
+            f"   프로젝트 {len(index)}개, 용어 {index.term_count}개, 샤드 {len(paths) - 1}개"
+        )
+    else:
+        paths = list(directory.glob("shard-*.json"))
+    for path in paths:
+        state.record(path.relative_to(OUTPUT_DIR).as_posix(), inputs)
+    return f"/{SEARCH_INDEX_DIR}/"
+
+
+def page_fragments(env: Environment, data: dict) -> Dict[str, str]:
+    """generate_static 용 string.Template 조각 (templates/*.html 의 페이지/블록을 자리 표시 값으로 렌더링)
+
+    반복/조건 블록은 ${블록 이름} 으로 남기고 generate_static 이 데이터로 채워 다시 조립합니다.
+    """
+    index = env.get_template("index.html")
+    project_page = env.get_template("project.html")
+    card = {
+        "id": slot("id"),
+        "title": slot("title"),
+        "period": slot("period"),
+        "description": slot("description"),
+        "image": slot("image"),
+        "highlights": [None],
+        "tech_stack": [None],
+        "tech_count": 1,
+    }
+    picture = {"sources": [None], "width": slot("width"), "height": slot("height")}
+    pagination = {
+        "pagination": {"page": 2, "pages": 3},
+        "page_href": lambda number: slot("href"),
+    }
+
+    fragments = {
+        "index": render_fragment(
+            index,
+            context={
+                "personal_info": {
+                    key: slot(f"info_{key}") for key in data["personal_info"]
+                },
+                "about": slot("about"),
+                "search_index_url": data["search_index_url"],
+                "static_pages": True,
+                "filter_options": None,
+            },
+            slots=("experience", "projects", "pagination", "skills"),
+        ),
+        "experience_item": render_fragment(
+            index,
+            "experience_item",
+            {
+                "exp": {
+                    "position": slot("position"),
+                    "company": slot("company"),
+                    "period": slot("period"),
+                    "description": slot("description"),
+                    "achievements": [None],
+                }
+            },
+            slots=("achievement",),
+        ),
+        "achievement": render_fragment(
+            index, "achievement", {"achievement": slot("text")}
+        ),
+        "projects_empty": render_fragment(index, "projects", {"projects": []}),
+        "project_card": render_fragment(
+            index,
+            "project_card",
+            {"project": card},
+            slots=(
+                "project_media",
+                "project_highlights",
+                "project_tech",
+                "project_more_techs",
+            ),
+        ),
+        "project_picture": render_fragment(
+            index,
+            "project_media",
+            {"project": card, "image_manifest": {slot("image"): picture}},
+            slots=("project_image_source",),
+        ),
+        "project_image": render_fragment(
+            index, "project_media", {"project": card, "image_manifest": {}}
+        ),
+        "project_image_source": render_fragment(
+            index,
+            "project_image_source",
+            {"source": {"type": slot("type"), "srcset": slot("srcset")}},
+        ),
+        "project_highlights": render_fragment(
+            index, "project_highlights", {"project": card}, slots=("project_highlight",)
+        ),
+        "project_highlight": render_fragment(
+            index, "project_highlight", {"highlight": slot("text")}
+        ),
+        "project_tech": render_fragment(index, "project_tech", {"tech": slot("tech")}),
+        "project_more_techs": render_fragment(
+            index, "project_more_techs", {"hidden_techs": slot("count")}
+        ),
+        "pagination": render_fragment(
+            index,
+            "pagination",
+            pagination,
+            slots=("page_previous", "page_numbers", "page_next"),
+        ),
+        "page_previous": render_fragment(index, "page_previous", pagination),
+        "page_next": render_fragment(index, "page_next", pagination),
+        "page_number": render_fragment(
+            index,
+            "page_number",
+            {**pagination, "number": slot("number"), "current": False},
+            slots=("page_gap",),
+        ),
+        "page_current": render_fragment(
+            index,
+            "page_number",
+            {**pagination, "number": slot("number"), "current": True},
+            slots=("page_gap",),
+        ),
+        "page_gap": render_fragment(index, "page_gap", {"gap": True}),
+        "skill_category": render_fragment(
+            index,
+            "skill_category",
+            {"skill_list": [None]},
+            slots=("skill_heading", "skill"),
+        ),
+        # 분류별 제목은 템플릿의 조건문으로 정해지므로 분류마다 렌더링 (목록에 없는 분류는 기본 조각)
+        "skill_heading": render_fragment(index, "skill_heading", {"category": None}),
+        "skill": render_fragment(index, "skill", {"skill": slot("text")}),
+        "project_page": render_fragment(
+            project_page,
+            context={
+                "project": {
+                    "title": slot("title"),
+                    "description": slot("description"),
+                    "period": slot("period"),
+                    "content": slot("content"),
+                    "tech_stack": [None],
+                }
+            },
+            slots=("tech",),
+        ),
+        "project_page_tech": render_fragment(
+            project_page, "tech", {"tech": slot("tech")}
+        ),
+        "404": render_fragment(env.get_template("404.html")),
+    }
+    for category in data["skills"]:
+        fragments[f"skill_heading:{category}"] = render_fragment(
+            index, "skill_heading", {"category": category}
+        )
+    return fragments
+
+
+def create_site_snapshot(env: Environment, data: dict, state: BuildState):
+    """generate_static.py 용 사이트 스냅샷 저장 (포트폴리오 데이터 + 렌더링한 마크다운 + 템플릿 조각)"""
+    projects = get_projects()
+    content_paths = [
+        Path(f"content/projects/{project['id']}.md") for project in projects
+    ]
+    site = {
+        key: data[key] for key in ("personal_info", "about", "experience", "skills")
+    }
+    inputs = data_digest(
+        {
+            "templates": state.files_digest(
+                path for name in PAGE_TEMPLATES for path in template_files(env, name)
+            ),
+            "styles": vendor_digest(state),
+            "data": data_digest(
+                [
+                    site,
+                    projects,
+                    data["image_manifest"],
+                    data["stylesheet"],
+                    data["asset_manifest"],
+                ]
+            ),
+            "content": state.files_digest(
+                path for path in content_paths if path.exists()
+            ),
+        }
+    )
+    try:
+        if load_snapshot(SNAPSHOT_PATH).get("inputs") == inputs:
+            return
+    except ValueError:
+        pass
+    print("📸 사이트 스냅샷 저장 중...")
+    write_snapshot(
+        SNAPSHOT_PATH,
+        {
+            "inputs": inputs,
+            "site": site,
+            "projects": projects,
+            "per_page": PROJECTS_PER_PAGE,
+            "contents": {
+                project["id"]: get_project_by_id(project["id"])["content"]
+                for project in projects
+            },
+            "bodies": load_project_bodies(),
+            "image_manifest": data["image_manifest"],
+            "search_index_url": data["search_index_url"],
+            "stylesheet": data["stylesheet"],
+            "assets": data["asset_manifest"],
+            "fragments": page_fragments(env, data),
+        },
+    )
+
+
+def render_site_pages(
+    image_manifest: dict, asset_manifest: Dict[str, str]
+) -> Dict[str, str]:
+    """배포용 전체 페이지를 현재 콘텐츠와 Jinja2 로 렌더링해 {상대 경로: HTML} 반환 (generate_static --check 기준)"""
+    env = create_environment()
+    data = {
+        **get_portfolio_data(),
+        "image_manifest": image_manifest,
+        "asset_manifest": asset_manifest,
+        "search_index_url": f"/{SEARCH_INDEX_DIR}/",
+    }
+    template = env.get_template("index.html")
+    pages = {
+        main_page_output(page): publish_html(
+            inline_icons(template.render(**main_page_data(data, page))), asset_manifest
+        )
+        for page in range(1, data["pagination"]["pages"] + 1)
+    }
+    for project in get_projects():
+        pages[f"project/{project['id']}.html"] = publish_html(
+            render_project_page(project["id"], env), asset_manifest
+        )
+    pages["404.html"] = publish_html(
+        inline_icons(env.get_template("404.html").render()), asset_manifest
+    )
+    return pages
+
+
+def precompress_output_files():
+    """HTML/CSS/JS/SVG/마크다운 출력물의 .gz/.br 사본 생성"""
+    print("🗜️  사전 압축 파일 생성 중...")
+    if brotli is None:
+        print("⚠️  brotli 모듈이 없어 gzip 사본만 생성합니다.")
+    written = precompress_directory(OUTPUT_DIR)
+    print(f"   압축 파일 {len(written)}개 생성")
+
+
+class StageTimer:
+    """빌드 단계별 소요 시간 기록"""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+
+def build_static_site(incremental: bool = False, jobs: int = 1) -> dict:
+    """정적 사이트 빌드 (incremental=True 면 입력이 바뀐 출력만, jobs는 병렬 렌더링 프로세스 수)
+
+    단계별 소요 시간(초)과 생성/건너뜀/삭제 개수를 담은 리포트를 반환합니다.
+    """
+    timer = StageTimer()
+    with timer.stage("setup"):
+        setup_output_directory(incremental)
+        state = BuildState(OUTPUT_DIR, incremental=incremental)
+
+    # Jinja2 환경 설정 (템플릿이 바뀌지 않았으면 사전 컴파일 결과 재사용)
+    with timer.stage("load_templates"):
+        env = create_environment()
+        for name in PAGE_TEMPLATES:
+            env.get_template(name)
+    with timer.stage("portfolio_data"):
+        data = get_portfolio_data()
 
-def copy_static_files():
-    """정적 파일 복사"""
-    if STATIC_DIR.exists():
-        print("📂 정적 파일 복사 중...")
-        shutil.copytree(STATIC_DIR, OUTPUT_DIR / "static")
-
-def build_static_site():
-    """정적 사이트 빌드"""
-    setup_output_directory()
-    
-    # Jinja2 환경 설정
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
-    data = get_portfolio_data()
-    
     print("🚀 정적 사이트 빌드 시작...")
-    
-    create_main_page(env, data)
-    create_project_pages(env)
-    create_404_page(env)
-    copy_static_files()
-    
+
+    with timer.stage("static_sync"):
+        copy_static_files(state)
+    with timer.stage("images"):
+        data["image_manifest"] = optimize_images(state)
+    with timer.stage("stylesheet"):
+        data["stylesheet"] = create_stylesheet(state)
+    with timer.stage("fonts"):
+        create_fonts(state)
+    with timer.stage("fingerprint"):
+        data["asset_manifest"] = create_asset_manifest(state)
+    with timer.stage("search_index"):
+        data["search_index_url"] = create_search_index(state)
+    with timer.stage("main_page"):
+        create_main_page(env, data, state)
+    with timer.stage("project_pages"):
+        create_project_pages(env, state, data["asset_manifest"], jobs)
+    with timer.stage("404_page"):
+        create_404_page(env, state, data["asset_manifest"])
+    with timer.stage("snapshot"):
+        create_site_snapshot(env, data, state)
+    with timer.stage("finalize"):
+        state.finalize()
+    with timer.stage("precompress"):
+        precompress_output_files()
+
     print("✅ 정적 사이트 빌드 완료!")
+    print(f"📊 {state.summary()}")
     print(f"📁 출력 디렉토리: {OUTPUT_DIR.absolute()}")
     print("🌐 GitHub Pages에 배포하려면 docs 폴더를 커밋하고 푸시하세요.")
+    return {
+        "stages": timer.stages,
+        "total": sum(timer.stages.values()),
+        "built": state.built,
+        "skipped": state.skipped,
+        "removed": state.removed,
+    }
+
+
+def watch_and_rebuild(jobs: int = 1):
+    """소스 변경을 감시하며 바뀐 출력만 증분 빌드"""
+
+    def rebuild(changed):
+        names = ", ".join(sorted(str(path) for path in changed))
+        if any(path.suffix == ".py" for path in changed):
+            # 파이썬 모듈(데이터 등)이 바뀌면 새 프로세스로 다시 시작
+            print(f"🔄 {names} 변경 - 빌드 프로세스를 다시 시작합니다.")
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        print(f"🔄 {names} 변경 - 증분 빌드")
+        start = time.perf_counter()
+        invalidate_content()
+        build_static_site(incremental=True, jobs=jobs)
+        print(f"⏱️  {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    watcher = FileWatcher(DEFAULT_WATCH_PATHS, rebuild)
+    print(f"👀 변경 감시 중 ({watcher.backend}) - 종료: Ctrl+C")
+    watcher.run_forever()
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="정적 사이트 빌드 (GitHub Pages 배포용)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="입력(템플릿/데이터/마크다운/정적 파일)이 바뀐 출력만 다시 생성",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="빌드 후 content/templates/static/data 변경을 감시하며 증분 빌드",
+    )
+    parser.add_argument(
+        "--timings", action="store_true", help="빌드 단계별 소요 시간 출력"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="프로젝트 페이지 병렬 렌더링 프로세스 수 (0 = CPU 코어 수)",
+    )
+    args = parser.parse_args()
+    if args.jobs <= 0:
+        args.jobs = os.cpu_count() or 1
+    return args
+
 
 def main():
     """메인 함수"""
+    args = parse_args()
     print("🏗️  Python Portfolio - 정적 사이트 빌드")
     print("=" * 45)
-    
-    if not install_dependencies():
+
+    if not ensure_dependencies():
         sys.exit(1)
-    
+
     try:
-        build_static_site()
+        report = build_static_site(
+            incremental=args.incremental or args.watch, jobs=args.jobs
+        )
     except Exception as e:
         print(f"❌ 빌드 중 오류가 발생했습니다: {e}")
         sys.exit(1)
 
+    if args.timings:
+        print("⏱️  단계별 소요 시간")
+        for name, seconds in report["stages"].items():
+            print(f"   {name:<15} {seconds * 1000:8.1f}ms")
+        print(f"   {'total':<15} {report['total'] * 1000:8.1f}ms")
+
+    if args.watch:
+        watch_and_rebuild(jobs=args.jobs)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""정적 자산 사전 압축 (gzip + brotli) 및 Accept-Encoding 협상 모듈"""
+
+import gzip
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip만 생성)
+    brotli = None
+
+# 압축 대상 확장자 및 최소 크기
+COMPRESSIBLE_SUFFIXES = {".html", ".md", ".css", ".js", ".mjs", ".svg", ".json", ".txt", ".xml"}
+MIN_COMPRESS_SIZE = 256
+
+# 인코딩별 파일 접미사 (협상 우선순위 순서)
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def is_compressible(path: Path) -> bool:
+    """사전 압축 대상 파일인지 확인"""
+    return path.suffix.lower() in COMPRESSIBLE_SUFFIXES
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """원본보다 작은 압축 결과만 인코딩별로 반환"""
+    variants = {}
+    if len(data) < MIN_COMPRESS_SIZE:
+        return variants
+
+    gzipped = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gzipped) < len(data):
+        variants["gzip"] = gzipped
+
+    if brotli is not None:
+        brotlied = brotli.compress(data, quality=11)
+        if len(brotlied) < len(data):
+            variants["br"] = brotlied
+    return variants
+
+
+def available_encodings() -> List[str]:
+    """사전 압축본을 만들 수 있는 인코딩 (brotli 모듈이 없으면 gzip만)"""
+    return [encoding for encoding in ENCODING_SUFFIXES if encoding != "br" or brotli is not None]
+
+
+def precompress_file(path: Path) -> List[Path]:
+    """파일 옆에 .gz/.br 사본 생성 (원본보다 오래된 사본만 갱신, 더 이상 만들지 않는 사본은 삭제)"""
+    written = []
+    source_mtime = path.stat().st_mtime_ns
+    targets = {encoding: path.with_name(path.name + suffix) for encoding, suffix in ENCODING_SUFFIXES.items()}
+    stale = {encoding for encoding, target in targets.items()
+             if not (target.exists() and target.stat().st_mtime_ns >= source_mtime)}
+    available = available_encodings()
+    # 만들 수 있는 인코딩의 사본이 최신이고, 만들 수 없는 인코딩의 오래된 사본도 없으면 건너뜀
+    if not any(encoding in available or targets[encoding].exists() for encoding in stale):
+        return written
+
+    variants = compress_variants(path.read_bytes())
+    for encoding, target in targets.items():
+        if encoding in variants:
+            target.write_bytes(variants[encoding])
+            written.append(target)
+        elif encoding in available or encoding in stale:
+            # 원본이 작아졌거나 압축 효과가 없어진 경우 이전 내용의 사본이 제공되지 않도록 삭제
+            target.unlink(missing_ok=True)
+    return written
+
+
+def precompress_directory(root: Path) -> List[Path]:
+    """디렉토리 하위의 압축 대상 파일 전체를 사전 압축"""
+    written = []
+    for path in sorted(Path(root).rglob("*")):
+        if path.is_file() and is_compressible(path) and not path.name.startswith("."):
+            written.extend(precompress_file(path))
+    return written
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q값} 으로 파싱"""
+    accepted = {}
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+    return accepted
+
+
+def negotiate_encoding(header: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """사용 가능한 인코딩 중 클라이언트가 허용하는 최우선 인코딩 선택"""
+    accepted = parse_accept_encoding(header)
+    available = set(available)
+    for encoding in ENCODING_SUFFIXES:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def main():
+    """메인 함수 (사용법: python compression.py [디렉토리 ...], 기본값: static)"""
+    if brotli is None:
+        print("⚠️  brotli 모듈이 없어 gzip 사본만 생성합니다. (pip install brotli)")
+    for directory in sys.argv[1:] or ["static"]:
+        files = precompress_directory(Path(directory))
+        print(f"🗜️  {directory}: 압축 파일 {len(files)}개 생성")
+
+
+if __name__ == "__main__":
+    main()
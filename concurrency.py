@@ -0,0 +1,62 @@
+"""비동기 요청 처리용 동시성 도구 모듈 (제한된 렌더링/I/O 풀 + single-flight)
+
+- 파일 읽기는 I/O 풀, 마크다운/템플릿 렌더링과 압축은 렌더 풀에서 실행해 이벤트 루프를 막지 않음
+- 같은 키에 대한 동시 요청은 하나의 실행으로 합쳐 결과를 공유 (single-flight)
+"""
+
+import asyncio
+import contextvars
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# 풀 크기 (PORTFOLIO_RENDER_WORKERS 로 조정, 렌더링은 CPU 작업이라 코어 수 이상은 효과 없음)
+RENDER_WORKERS = int(os.getenv("PORTFOLIO_RENDER_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+IO_WORKERS = 8
+
+render_pool = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="render")
+io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+
+
+async def run_in_pool(func: Callable[..., T], *args, pool: Executor = render_pool) -> T:
+    """블로킹 함수를 풀에서 실행 (계측 span 이 요청에 기록되도록 contextvars 복사)"""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(pool, context.run, func, *args)
+
+
+async def read_text(path: Path, encoding: str = "utf-8") -> str:
+    """이벤트 루프를 막지 않고 파일 읽기"""
+    data = await run_in_pool(Path(path).read_bytes, pool=io_pool)
+    return data.decode(encoding)
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 호출을 하나의 실행으로 합치는 도우미"""
+
+    def __init__(self):
+        self.coalesced = 0  # 진행 중인 실행에 합류한 호출 수
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """진행 중인 같은 키의 실행이 있으면 그 결과를 기다리고, 없으면 factory() 실행"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        # 한 요청이 취소(연결 종료)되어도 다른 요청이 기다리는 실행은 계속되도록 shield
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 기다리던 요청이 모두 취소된 경우 경고 로그 방지
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,86 @@
+"""마크다운 렌더링 결과 캐시 모듈"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+# 캐시 기본 설정
+DEFAULT_MAX_ENTRIES = 256
+
+
+class ContentCache:
+    """파일 경로 + mtime + size 기준으로 렌더링된 HTML을 보관하는 LRU 캐시"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(path: Path) -> Tuple[int, int]:
+        """파일 변경 여부 판단용 시그니처 (mtime_ns, size)"""
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _lookup(self, key: str, signature: Tuple[int, int]) -> Optional[str]:
+        """시그니처가 같은 캐시 항목 조회 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def _store(self, key: str, signature: Tuple[int, int], html: str):
+        with self._lock:
+            self._entries[key] = (signature, html)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, path: Path, render: Callable[[Path], str]) -> str:
+        """캐시된 HTML 반환, 파일이 바뀌었거나 없으면 다시 렌더링"""
+        key = str(path.resolve())
+        signature = self._signature(path)
+        html = self._lookup(key, signature)
+        if html is None:
+            html = render(path)
+            self._store(key, signature, html)
+        return html
+
+    async def get_or_render_async(self, path: Path, render: Callable[[Path], Awaitable[str]]) -> str:
+        """get_or_render 의 비동기 버전 (render 는 코루틴 함수)"""
+        key = str(path.resolve())
+        signature = self._signature(path)
+        html = self._lookup(key, signature)
+        if html is None:
+            html = await render(path)
+            self._store(key, signature, html)
+        return html
+
+    def invalidate(self, path: Optional[Path] = None):
+        """특정 파일 또는 전체 캐시 무효화"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(path).resolve()), None)
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계 반환"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# 서버와 빌드 스크립트가 공유하는 기본 캐시
+content_cache = ContentCache()
@@ -0,0 +1,206 @@
+"""콘텐츠 저장소 모듈 (content/*.yaml|json 지연 로드 + 스키마 검증 + 스냅샷 캐시)"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CONTENT_DIR = Path("content")
+SNAPSHOT_DIR = Path(".cache/content")
+SNAPSHOT_VERSION = 1  # 스키마/형식이 바뀌면 올려서 기존 스냅샷 무효화
+SOURCE_SUFFIXES = (".yaml", ".yml", ".json")
+
+# 프로젝트 id는 content/projects/<id>.md 및 URL 경로에 쓰이므로 안전한 문자만 허용
+PROJECT_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+
+# 필드 이름: (타입, 필수 여부)
+PERSONAL_INFO_SCHEMA = {
+    "name": (str, True),
+    "title": (str, True),
+    "company": (str, False),
+    "email": (str, True),
+    "github": (str, False),
+    "linkedin": (str, False),
+    "location": (str, False),
+}
+EXPERIENCE_SCHEMA = {
+    "company": (str, True),
+    "position": (str, True),
+    "period": (str, True),
+    "description": (str, False),
+    "achievements": (list, False),
+}
+PROJECT_SCHEMA = {
+    "id": (str, True),
+    "title": (str, True),
+    "period": (str, True),
+    "description": (str, True),
+    "tech_stack": (list, True),
+    "image": (str, False),
+    "github": (str, False),
+    "highlights": (list, False),
+}
+
+
+class ContentError(ValueError):
+    """콘텐츠 파일 형식/스키마 오류"""
+
+
+def _check_fields(record: Any, schema: Dict[str, Tuple[type, bool]], where: str):
+    """딕셔너리 1개를 스키마로 검증 (알 수 없는 필드는 허용)"""
+    if not isinstance(record, dict):
+        raise ContentError(f"{where}: 매핑이어야 합니다")
+    for field, (expected, required) in schema.items():
+        if field not in record:
+            if required:
+                raise ContentError(f"{where}.{field}: 필수 필드가 없습니다")
+            continue
+        value = record[field]
+        if not isinstance(value, expected):
+            raise ContentError(f"{where}.{field}: {expected.__name__} 이어야 합니다 (현재 {type(value).__name__})")
+        if expected is list and not all(isinstance(item, str) for item in value):
+            raise ContentError(f"{where}.{field}: 문자열 목록이어야 합니다")
+
+
+def validate_site(data: Any, source: str) -> Dict:
+    """site 파일 검증 (personal_info / about / experience / skills)"""
+    if not isinstance(data, dict):
+        raise ContentError(f"{source}: 최상위는 매핑이어야 합니다")
+    _check_fields(data.get("personal_info"), PERSONAL_INFO_SCHEMA, f"{source}: personal_info")
+    if not isinstance(data.get("about", ""), str):
+        raise ContentError(f"{source}: about: 문자열이어야 합니다")
+    experience = data.get("experience", [])
+    if not isinstance(experience, list):
+        raise ContentError(f"{source}: experience: 목록이어야 합니다")
+    for index, item in enumerate(experience):
+        _check_fields(item, EXPERIENCE_SCHEMA, f"{source}: experience[{index}]")
+    skills = data.get("skills", {})
+    if not isinstance(skills, dict):
+        raise ContentError(f"{source}: skills: 매핑이어야 합니다")
+    for category, names in skills.items():
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ContentError(f"{source}: skills.{category}: 문자열 목록이어야 합니다")
+    return {
+        "personal_info": data["personal_info"],
+        "about": data.get("about", ""),
+        "experience": experience,
+        "skills": skills,
+    }
+
+
+def validate_projects(data: Any, source: str) -> List[Dict]:
+    """projects 파일 검증 (필드 타입, id 형식/중복)"""
+    if not isinstance(data, list):
+        raise ContentError(f"{source}: 최상위는 프로젝트 목록이어야 합니다")
+    seen = set()
+    for index, project in enumerate(data):
+        where = f"{source}: [{index}]"
+        _check_fields(project, PROJECT_SCHEMA, where)
+        project_id = project["id"]
+        if not PROJECT_ID_PATTERN.match(project_id):
+            raise ContentError(f"{where}.id: 소문자/숫자/하이픈만 사용할 수 있습니다 ({project_id!r})")
+        if project_id in seen:
+            raise ContentError(f"{where}.id: 중복된 id입니다 ({project_id!r})")
+        seen.add(project_id)
+    return data
+
+
+# 저장소 항목 이름: 검증 함수
+VALIDATORS = {
+    "site": validate_site,
+    "projects": validate_projects,
+}
+
+
+def parse_source(path: Path, raw: bytes) -> Any:
+    """YAML/JSON 파일 파싱 (YAML은 필요할 때만 import, 가능하면 C 로더 사용)"""
+    if path.suffix == ".json":
+        return json.loads(raw)
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+class ContentStore:
+    """content/ 아래 파일을 항목별로 처음 접근할 때 읽고, 검증된 결과를 스냅샷으로 캐시"""
+
+    def __init__(self, root: Path = CONTENT_DIR, snapshot_dir: Optional[Path] = SNAPSHOT_DIR):
+        self.root = Path(root)
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self._loaded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self.snapshot_hits = 0
+
+    def source_path(self, name: str) -> Path:
+        """항목의 원본 파일 경로 (.yaml → .yml → .json 순서로 탐색)"""
+        for suffix in SOURCE_SUFFIXES:
+            path = self.root / f"{name}{suffix}"
+            if path.exists():
+                return path
+        raise ContentError(f"{self.root / name}.yaml 파일이 없습니다")
+
+    def get(self, name: str) -> Any:
+        """항목 데이터 반환 (처음 접근 시 스냅샷 또는 원본에서 로드)"""
+        data = self._loaded.get(name)
+        if data is None:
+            with self._lock:
+                data = self._loaded.get(name)
+                if data is None:
+                    data = self._loaded[name] = self._load(name)
+        return data
+
+    def _load(self, name: str) -> Any:
+        """스냅샷 키(원본 내용 해시)가 같으면 스냅샷, 아니면 파싱 + 검증 후 스냅샷 저장"""
+        path = self.source_path(name)
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        snapshot = self.snapshot_dir / f"{name}.pickle" if self.snapshot_dir is not None else None
+
+        if snapshot is not None and snapshot.exists():
+            try:
+                with open(snapshot, "rb") as f:
+                    version, key, data = pickle.load(f)
+                if version == SNAPSHOT_VERSION and key == digest:
+                    self.snapshot_hits += 1
+                    return data
+            except Exception:
+                pass  # 손상되었거나 형식이 다른 스냅샷은 무시하고 다시 생성
+
+        try:
+            parsed = parse_source(path, raw)
+        except Exception as e:
+            raise ContentError(f"{path}: 파싱 실패 - {e}") from e
+        data = VALIDATORS[name](parsed, str(path))
+        self.parsed += 1
+
+        if snapshot is not None:
+            try:
+                snapshot.parent.mkdir(parents=True, exist_ok=True)
+                temp = snapshot.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp, "wb") as f:
+                    pickle.dump((SNAPSHOT_VERSION, digest, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp, snapshot)
+            except OSError:
+                pass  # 읽기 전용 환경에서는 스냅샷 없이 동작
+        return data
+
+    def invalidate(self, name: Optional[str] = None):
+        """메모리에 로드된 항목 폐기 (다음 접근 시 다시 로드)"""
+        with self._lock:
+            if name is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(name, None)
+
+    def stats(self) -> Dict[str, int]:
+        """파싱/스냅샷 적중 횟수"""
+        return {"loaded": len(self._loaded), "parsed": self.parsed, "snapshot_hits": self.snapshot_hits}
+
+
+# 애플리케이션 전역 콘텐츠 저장소
+content_store = ContentStore()
@@ -0,0 +1,214 @@
+"""마크다운 렌더링 엔진 모듈 (재사용 Markdown 인스턴스 풀 + 코드 하이라이트 디스크 캐시)
+
+- Markdown 인스턴스는 확장 로딩 비용이 크므로 풀에 보관하고 사용 후 reset() 해서 재사용
+- Pygments 하이라이트 결과는 (언어, 코드 해시, 스타일, 옵션) 기준으로 .cache/highlight 에 저장해
+  서버와 build_static 이 함께 사용 (코드 블록이 바뀌지 않으면 다시 하이라이트하지 않음)
+- Pygments 는 선택 의존성 (없으면 codehilite 와 같이 하이라이트 없는 <pre><code> 출력, 캐시 미사용)
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import types
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import markdown
+from markdown.extensions import Extension, codehilite, fenced_code
+
+HIGHLIGHT_CACHE_DIR = Path(".cache/highlight")
+DEFAULT_EXTENSIONS = ("codehilite", "fenced_code")
+DEFAULT_STYLE = "default"  # codehilite 기본 pygments_style
+DEFAULT_POOL_SIZE = 8
+DEFAULT_MEMORY_ENTRIES = 1024
+# fenced_code / codehilite 확장이 처리기를 등록하는 이름과 우선순위
+FENCED_PROCESSOR = ("fenced_code_block", 25)
+HILITE_PROCESSOR = ("hilite", 30)
+
+
+def pygments_version() -> str:
+    """설치된 Pygments 버전 (없으면 빈 문자열)"""
+    try:
+        import pygments
+    except ImportError:
+        return ""
+    return pygments.__version__
+
+
+class HighlightCache:
+    """하이라이트된 코드 블록 HTML 캐시 (메모리 LRU + 디스크)"""
+
+    def __init__(self, directory: Optional[Path] = HIGHLIGHT_CACHE_DIR, max_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(lang: Optional[str], code: str, style: str, options: Dict) -> str:
+        """(언어, 코드 해시, 스타일, 나머지 옵션, Pygments 버전) 캐시 키"""
+        code_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        parts = [lang or "", code_hash, style, sorted((name, repr(value)) for name, value in options.items()),
+                 pygments_version()]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:40]
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 HTML (없으면 None)"""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+        if self.directory is not None:
+            try:
+                html = (self.directory / f"{key}.html").read_text(encoding="utf-8")
+            except OSError:
+                html = None
+            if html is not None:
+                self._remember(key, html)
+                with self._lock:
+                    self.disk_hits += 1
+                return html
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, html: str):
+        """메모리와 디스크에 저장 (디스크 쓰기 실패는 무시)"""
+        self._remember(key, html)
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 병렬 빌드 워커가 같은 블록을 동시에 써도 안전하도록 임시 파일 후 교체
+            temp = self.directory / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            temp.write_text(html, encoding="utf-8")
+            os.replace(temp, self.directory / f"{key}.html")
+        except OSError:
+            pass
+
+    def _remember(self, key: str, html: str):
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계 반환"""
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "disk_hits": self.disk_hits,
+                    "misses": self.misses}
+
+
+# 현재 렌더링 중인 엔진의 하이라이트 캐시 (엔진 밖에서 쓰는 markdown 은 원래대로 동작)
+_active_cache: contextvars.ContextVar[Optional[HighlightCache]] = contextvars.ContextVar(
+    "markdown_highlight_cache", default=None)
+
+
+class CachedCodeHilite(codehilite.CodeHilite):
+    """하이라이트 결과를 캐시하는 CodeHilite (엔진 렌더링 중에만 캐시 사용)"""
+
+    def hilite(self, shebang: bool = True) -> str:
+        cache = _active_cache.get()
+        if cache is None or not (codehilite.pygments and self.use_pygments):
+            return super().hilite(shebang=shebang)
+        options = {**self.options, "shebang": shebang, "guess_lang": self.guess_lang,
+                   "lang_prefix": self.lang_prefix, "formatter": self.pygments_formatter}
+        style = options.pop("style", DEFAULT_STYLE)
+        key = cache.make_key(self.lang, self.src, style, options)
+        html = cache.get(key)
+        if html is None:
+            html = super().hilite(shebang=shebang)
+            cache.put(key, html)
+        return html
+
+
+def _with_cached_hilite(function: types.FunctionType) -> types.FunctionType:
+    """CodeHilite 이름만 CachedCodeHilite 로 바꾼 전역으로 함수 복사 (원래 모듈은 그대로 둠)"""
+    namespace = {**function.__globals__, "CodeHilite": CachedCodeHilite}
+    return types.FunctionType(function.__code__, namespace, function.__name__, function.__defaults__,
+                              function.__closure__)
+
+
+class CachedFencedBlockPreprocessor(fenced_code.FencedBlockPreprocessor):
+    """코드 블록마다 CachedCodeHilite 를 쓰는 fenced_code 전처리기"""
+
+    run = _with_cached_hilite(fenced_code.FencedBlockPreprocessor.run)
+
+
+class CachedHiliteTreeprocessor(codehilite.HiliteTreeprocessor):
+    """코드 블록마다 CachedCodeHilite 를 쓰는 codehilite 트리 처리기"""
+
+    run = _with_cached_hilite(codehilite.HiliteTreeprocessor.run)
+
+
+class HighlightCacheExtension(Extension):
+    """이미 등록된 fenced_code / codehilite 처리기를 캐시 버전으로 교체 (확장 목록 마지막에 사용)"""
+
+    def extendMarkdown(self, md: markdown.Markdown):
+        name, priority = FENCED_PROCESSOR
+        if name in md.preprocessors:
+            md.preprocessors.register(CachedFencedBlockPreprocessor(md, md.preprocessors[name].config), name, priority)
+        name, priority = HILITE_PROCESSOR
+        if name in md.treeprocessors:
+            processor = CachedHiliteTreeprocessor(md)
+            processor.config = md.treeprocessors[name].config
+            md.treeprocessors.register(processor, name, priority)
+
+
+class MarkdownEngine:
+    """Markdown 인스턴스 풀과 하이라이트 캐시를 사용하는 렌더러 (스레드 안전)"""
+
+    def __init__(self, extensions=DEFAULT_EXTENSIONS, pool_size: int = DEFAULT_POOL_SIZE,
+                 highlight_cache: Optional[HighlightCache] = None):
+        self.extensions = list(extensions)
+        self.pool_size = pool_size
+        self.highlight_cache = highlight_cache if highlight_cache is not None else HighlightCache()
+        self.created = 0
+        self._idle: List[markdown.Markdown] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[markdown.Markdown]:
+        """풀에서 Markdown 인스턴스를 빌려 사용 후 reset() 해서 반환"""
+        with self._lock:
+            instance = self._idle.pop() if self._idle else None
+        if instance is None:
+            instance = markdown.Markdown(extensions=[*self.extensions, HighlightCacheExtension()])
+            with self._lock:
+                self.created += 1
+        try:
+            yield instance
+        finally:
+            instance.reset()
+            with self._lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append(instance)
+
+    def render(self, text: str) -> str:
+        """마크다운 본문을 HTML로 변환 (markdown.markdown(text, extensions=...) 과 같은 결과)"""
+        token = _active_cache.set(self.highlight_cache)
+        try:
+            with self.acquire() as instance:
+                return instance.convert(text)
+        finally:
+            _active_cache.reset(token)
+
+    def stats(self) -> Dict:
+        """풀/하이라이트 캐시 통계"""
+        with self._lock:
+            pool = {"created": self.created, "idle": len(self._idle), "pool_size": self.pool_size}
+        return {**pool, "highlight": self.highlight_cache.stats()}
+
+
+# 서버와 빌드 스크립트가 공유하는 기본 엔진
+markdown_engine = MarkdownEngine()
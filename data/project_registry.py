@@ -0,0 +1,182 @@
+"""프로젝트 레지스트리 모듈 (id 및 보조 인덱스)"""
+
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set
+
+# 하이라이트 키워드 분리 패턴 (공백 및 구두점 기준)
+KEYWORD_SPLIT_PATTERN = re.compile(r"[^\w$%+#.,]+")
+YEAR_PATTERN = re.compile(r"(\d{4})")
+
+# 카드 목록용 요약에 포함할 하이라이트/기술 태그 수 (index.html 카드와 동일)
+SUMMARY_HIGHLIGHTS = 2
+SUMMARY_TECHS = 4
+
+
+def normalize_term(term: str) -> str:
+    """인덱스 키 정규화 (대소문자/공백 무시)"""
+    return term.strip().lower()
+
+
+def period_years(period: str) -> List[int]:
+    """'2022.12 - 2023.05' 형태의 기간을 포함된 연도 목록으로 변환 (진행 중이면 올해까지)"""
+    years = [int(year) for year in YEAR_PATTERN.findall(period)]
+    if not years:
+        return []
+    start = years[0]
+    end = years[1] if len(years) > 1 else date.today().year
+    return list(range(start, max(start, end) + 1))
+
+
+def highlight_keywords(highlights: Iterable[str]) -> Set[str]:
+    """하이라이트 문장에서 검색 키워드 추출"""
+    keywords = set()
+    for highlight in highlights:
+        for token in KEYWORD_SPLIT_PATTERN.split(highlight):
+            token = normalize_term(token).strip(".,")
+            if token:
+                keywords.add(token)
+    return keywords
+
+
+def summarize(project: Dict) -> Dict:
+    """카드 목록용 요약 (상세 페이지 전용 필드는 제외)"""
+    tech_stack = project.get("tech_stack", [])
+    return {
+        "id": project["id"],
+        "title": project.get("title", ""),
+        "period": project.get("period", ""),
+        "description": project.get("description", ""),
+        "image": project.get("image"),
+        "highlights": project.get("highlights", [])[:SUMMARY_HIGHLIGHTS],
+        "tech_stack": tech_stack[:SUMMARY_TECHS],
+        "tech_count": len(tech_stack),
+    }
+
+
+@dataclass(frozen=True)
+class ProjectPage:
+    """필터/페이지 조건에 맞는 프로젝트 요약 목록 1페이지"""
+
+    items: List[Dict]
+    page: int
+    per_page: int
+    total: int
+
+    @property
+    def pages(self) -> int:
+        """전체 페이지 수 (결과가 없어도 1)"""
+        return max(1, math.ceil(self.total / self.per_page))
+
+    def meta(self) -> Dict[str, int]:
+        """템플릿/API 응답용 페이지 정보"""
+        return {"page": self.page, "per_page": self.per_page, "total": self.total, "pages": self.pages}
+
+
+class ProjectRegistry:
+    """id 기반 조회와 기술/연도/키워드 보조 인덱스를 제공하는 레지스트리"""
+
+    def __init__(self, projects: List[Dict]):
+        self.rebuild(projects)
+
+    def rebuild(self, projects: List[Dict]):
+        """프로젝트 목록으로 인덱스 재구성"""
+        self.source = projects  # 원본 목록 (다시 로드되었는지 확인용)
+        self._projects = list(projects)
+        self._by_id: Dict[str, Dict] = {}
+        self._position: Dict[str, int] = {}
+        self._by_tech: Dict[str, List[str]] = defaultdict(list)
+        self._tech_labels: Dict[str, str] = {}
+        self._by_year: Dict[int, List[str]] = defaultdict(list)
+        self._by_keyword: Dict[str, List[str]] = defaultdict(list)
+        self._summaries: List[Dict] = []
+
+        for position, project in enumerate(self._projects):
+            project_id = project["id"]
+            self._by_id[project_id] = project
+            self._summaries.append(summarize(project))
+            self._position[project_id] = position
+            for tech in project.get("tech_stack", []):
+                self._by_tech[normalize_term(tech)].append(project_id)
+                self._tech_labels.setdefault(normalize_term(tech), tech.strip())
+            for year in period_years(project.get("period", "")):
+                self._by_year[year].append(project_id)
+            for keyword in highlight_keywords(project.get("highlights", [])):
+                self._by_keyword[keyword].append(project_id)
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def get(self, project_id: str) -> Optional[Dict]:
+        """id로 프로젝트 조회"""
+        return self._by_id.get(project_id)
+
+    def all(self) -> List[Dict]:
+        """등록 순서대로 전체 프로젝트 반환"""
+        return list(self._projects)
+
+    def techs(self) -> List[str]:
+        """인덱싱된 기술 스택 목록"""
+        return sorted(self._by_tech)
+
+    def tech_labels(self) -> Dict[str, str]:
+        """정규화된 기술 이름 → 표시 이름 (표시 이름 순)"""
+        return dict(sorted(self._tech_labels.items(), key=lambda item: item[1].lower()))
+
+    def years(self) -> List[int]:
+        """인덱싱된 연도 목록"""
+        return sorted(self._by_year)
+
+    def has_filters(self, tech: Optional[str] = None, year: Optional[int] = None,
+                    keyword: Optional[str] = None) -> bool:
+        """모든 필터 값이 인덱스에 있는지 (없는 값이 하나라도 있으면 결과는 항상 비어 있음)"""
+        return ((tech is None or normalize_term(tech) in self._by_tech)
+                and (year is None or int(year) in self._by_year)
+                and (keyword is None or normalize_term(keyword) in self._by_keyword))
+
+    def find(
+        self,
+        tech: Optional[str] = None,
+        year: Optional[int] = None,
+        keyword: Optional[str] = None,
+    ) -> List[Dict]:
+        """조건(AND)에 맞는 프로젝트를 등록 순서대로 반환"""
+        candidates: Optional[Set[str]] = None
+        filters = []
+        if tech is not None:
+            filters.append(self._by_tech.get(normalize_term(tech), []))
+        if year is not None:
+            filters.append(self._by_year.get(int(year), []))
+        if keyword is not None:
+            filters.append(self._by_keyword.get(normalize_term(keyword), []))
+
+        if not filters:
+            return self.all()
+
+        for ids in sorted(filters, key=len):
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+            if not candidates:
+                return []
+
+        return [self._by_id[project_id] for project_id in sorted(candidates, key=self._position.__getitem__)]
+
+    def page(
+        self,
+        page: int = 1,
+        per_page: int = 12,
+        tech: Optional[str] = None,
+        year: Optional[int] = None,
+        keyword: Optional[str] = None,
+    ) -> ProjectPage:
+        """조건(AND)에 맞는 프로젝트 요약을 등록 순서대로 페이지 단위로 반환"""
+        start = (page - 1) * per_page
+        if tech is None and year is None and keyword is None:
+            # 필터가 없으면 전체 목록을 만들지 않고 해당 구간만 잘라냄
+            return ProjectPage(self._summaries[start:start + per_page], page, per_page, len(self._summaries))
+
+        matches = self.find(tech=tech, year=year, keyword=keyword)
+        items = [self._summaries[self._position[project["id"]]] for project in matches[start:start + per_page]]
+        return ProjectPage(items, page, per_page, len(matches))
@@ -0,0 +1,158 @@
+"""프로젝트 전문 검색 인덱스 모듈 (한글 2-gram 토큰화 + BM25)"""
+
+import heapq
+import json
+import math
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 토큰 패턴 (한글 음절 묶음 / 영문·숫자 단어)
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+")
+# 마크다운 링크/이미지는 표시 텍스트만 남기고 URL 제거, HTML 태그 제거
+MARKDOWN_LINK_PATTERN = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+# 필드별 가중치 (제목/기술 스택 일치가 본문 일치보다 중요)
+FIELD_WEIGHTS = {"title": 3, "tech_stack": 2, "highlights": 2, "description": 1, "content": 1}
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 정적 빌드용 샤드 설정
+SHARD_TARGET_TERMS = 2000  # 샤드 1개당 목표 용어 수
+SUMMARY_LENGTH = 120  # 샤드 메타에 포함할 설명 길이
+
+
+def tokenize(text: str) -> List[str]:
+    """검색 토큰 목록 (한글은 음절 2-gram, 영문/숫자는 단어 단위)"""
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if word[0] >= "가" and len(word) > 1:
+            tokens.extend(word[index:index + 2] for index in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def markdown_text(body: str) -> str:
+    """마크다운 본문에서 검색에 불필요한 URL/태그 제거"""
+    return HTML_TAG_PATTERN.sub(" ", MARKDOWN_LINK_PATTERN.sub(r"\1", body))
+
+
+def shard_for(term: str, shard_count: int) -> int:
+    """용어가 저장될 샤드 번호 (UTF-8 바이트 FNV-1a 해시, JS 클라이언트와 동일)"""
+    value = 0x811C9DC5
+    for byte in term.encode("utf-8"):
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return value % shard_count
+
+
+class SearchIndex:
+    """프로젝트 메타데이터와 마크다운 본문에 대한 BM25 역색인"""
+
+    def __init__(self, projects: List[Dict], bodies: Optional[Dict[str, str]] = None):
+        self.rebuild(projects, bodies or {})
+
+    def rebuild(self, projects: List[Dict], bodies: Dict[str, str]):
+        """프로젝트 목록과 본문으로 인덱스 재구성"""
+        self.source = projects  # 원본 목록 (다시 로드되었는지 확인용)
+        self._docs: List[Dict] = []
+        self._lengths: List[int] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+
+        for position, project in enumerate(projects):
+            fields = {
+                "title": project.get("title", ""),
+                "tech_stack": " ".join(project.get("tech_stack", [])),
+                "highlights": " ".join(project.get("highlights", [])),
+                "description": project.get("description", ""),
+                "content": markdown_text(bodies.get(project["id"], "")),
+            }
+            frequencies: Counter = Counter()
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    frequencies[token] += FIELD_WEIGHTS[field]
+            for term, frequency in frequencies.items():
+                self._postings[term].append((position, frequency))
+            self._lengths.append(sum(frequencies.values()))
+            self._docs.append({
+                "id": project["id"],
+                "title": project.get("title", ""),
+                "description": project.get("description", ""),
+            })
+
+        count = len(self._docs)
+        self._avgdl = (sum(self._lengths) / count) if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        # 문서 길이 정규화 항은 문서마다 고정이므로 미리 계산
+        self._norms = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / self._avgdl) if self._avgdl else BM25_K1
+            for length in self._lengths
+        ]
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def term_count(self) -> int:
+        """인덱싱된 용어 수"""
+        return len(self._postings)
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """질의와 관련도가 높은 순서로 프로젝트 요약 반환"""
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for position, frequency in postings:
+                scores[position] += idf * frequency * (BM25_K1 + 1) / (frequency + self._norms[position])
+
+        # 점수가 같으면 카탈로그 순서 우선
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [{**self._docs[position], "score": round(score, 4)} for position, score in top]
+
+    def shards(self) -> Tuple[Dict, List[Dict]]:
+        """정적 사이트용 (메타, 샤드 목록) - 클라이언트가 질의 용어의 샤드만 내려받도록 분할"""
+        shard_count = max(1, math.ceil(len(self._postings) / SHARD_TARGET_TERMS))
+        shards: List[Dict] = [{} for _ in range(shard_count)]
+        for term in sorted(self._postings):
+            shards[shard_for(term, shard_count)][term] = [list(posting) for posting in self._postings[term]]
+        meta = {
+            "version": 1,
+            "k1": BM25_K1,
+            "b": BM25_B,
+            "avgdl": self._avgdl,
+            "shards": shard_count,
+            "docs": [[doc["id"], doc["title"], doc["description"][:SUMMARY_LENGTH]] for doc in self._docs],
+            "lengths": self._lengths,
+        }
+        return meta, shards
+
+    def write_shards(self, directory: Path) -> List[Path]:
+        """메타(meta.json)와 샤드(shard-N.json) 파일 저장, 내용이 같은 파일은 다시 쓰지 않고 남은 샤드는 삭제"""
+        meta, shards = self.shards()
+        directory.mkdir(parents=True, exist_ok=True)
+        payloads = {"meta.json": meta}
+        payloads.update({f"shard-{index}.json": shard for index, shard in enumerate(shards)})
+
+        written = []
+        for name, payload in payloads.items():
+            path = directory / name
+            text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                path.write_text(text, encoding="utf-8")
+            written.append(path)
+
+        # 샤드 수가 줄어든 경우 이전 빌드의 샤드(와 .gz/.br 사본)가 배포되지 않도록 삭제
+        for path in directory.glob("shard-*.json*"):
+            if path.name[:path.name.index(".json") + len(".json")] not in payloads:
+                path.unlink()
+        return written
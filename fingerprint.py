@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""정적 자산 지문(content hash) 모듈 (정적 빌드/서버 공용, 표준 라이브러리만 사용)
+
+/static/css/site.css → /static/css/site.3f2a1b9c0d.css 처럼 내용 해시를 파일 이름에 넣어
+브라우저/CDN 이 1년 동안(immutable) 캐시해도 내용이 바뀌면 URL 이 바뀌도록 합니다.
+- 정적 빌드: docs/static 에 지문 사본(하드링크)과 asset-manifest.json 을 만들고 HTML 의 /static/ URL 을 치환
+- 서버: 사본 없이 요청 경로의 해시가 현재 파일과 같으면 원본 파일을 immutable 헤더로 제공
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from compression import ENCODING_SUFFIXES
+
+ASSET_MANIFEST_SUBPATH = Path("asset-manifest.json")  # static 디렉토리 기준
+STATIC_URL_PREFIX = "/static/"
+HASH_LENGTH = 10
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 지문을 붙이지 않는 파일 (서버/빌드가 고정 경로로 읽는 manifest, 임시/압축 사본)
+EXCLUDED_NAMES = {"manifest.json", ASSET_MANIFEST_SUBPATH.name}
+EXCLUDED_SUFFIXES = {".tmp", *ENCODING_SUFFIXES.values()}
+
+FINGERPRINTED_NAME = re.compile(rf"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{{{HASH_LENGTH}}})(?P<suffix>\.[^./]+)$")
+# HTML 속성(src/href/srcset)과 인라인 CSS url() 안의 정적 자산 URL
+STATIC_URL = re.compile(r"/static/[^\"'\s()<>,?#]+")
+
+
+def fingerprinted_path(relative: str, digest: str) -> str:
+    """images/a.png + 해시 → images/a.<해시>.png"""
+    path = Path(relative)
+    return path.with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+def is_candidate(relative: str) -> bool:
+    """지문을 붙일 파일인지 (manifest/임시/압축 사본/이미 지문이 붙은 파일 제외)"""
+    path = Path(relative)
+    return (bool(path.suffix) and path.name not in EXCLUDED_NAMES and path.suffix not in EXCLUDED_SUFFIXES
+            and not FINGERPRINTED_NAME.match(path.name))
+
+
+def rewrite_urls(html: str, manifest: Dict[str, str]) -> str:
+    """HTML 의 /static/ URL 을 manifest 의 지문 URL 로 치환 (manifest 에 없으면 그대로)"""
+    if not manifest:
+        return html
+    return STATIC_URL.sub(lambda match: manifest.get(match.group(0), match.group(0)), html)
+
+
+class AssetFingerprints:
+    """static 디렉토리 파일의 내용 해시 (mtime/size 가 같으면 이전 해시 재사용, 스레드 안전)"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, relative: str) -> Optional[str]:
+        """파일 내용 해시 앞 HASH_LENGTH 자리 (지문 대상이 아니거나 파일이 없으면 None)"""
+        if not is_candidate(relative):
+            return None
+        path = self.root / relative
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        with self._lock:
+            cached = self._digests.get(relative)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()[:HASH_LENGTH]
+        with self._lock:
+            self._digests[relative] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
+
+    def url(self, url: str) -> str:
+        """/static/ URL → 지문 URL (대상이 아니면 그대로)"""
+        relative = url[len(STATIC_URL_PREFIX):]
+        digest = self.digest(relative)
+        return STATIC_URL_PREFIX + fingerprinted_path(relative, digest) if digest else url
+
+    def rewrite(self, html: str) -> str:
+        """HTML 의 /static/ URL 을 현재 파일 내용 기준 지문 URL 로 치환"""
+        return STATIC_URL.sub(lambda match: self.url(match.group(0)), html)
+
+    def resolve(self, relative: str) -> Optional[str]:
+        """지문 경로 → 원본 경로 (해시가 현재 파일 내용과 다르면 None)"""
+        path = Path(relative)
+        match = FINGERPRINTED_NAME.match(path.name)
+        if match is None:
+            return None
+        original = path.with_name(match.group("stem") + match.group("suffix")).as_posix()
+        return original if self.digest(original) == match.group("hash") else None
+
+    def manifest(self) -> Dict[str, str]:
+        """static 디렉토리 전체의 {원본 URL: 지문 URL}"""
+        manifest = {}
+        for path in sorted(self.root.rglob("*")):
+            relative = path.relative_to(self.root).as_posix()
+            digest = self.digest(relative) if path.is_file() else None
+            if digest:
+                manifest[STATIC_URL_PREFIX + relative] = STATIC_URL_PREFIX + fingerprinted_path(relative, digest)
+        return manifest
+
+
+def write_fingerprinted(static_root: Path, manifest: Dict[str, str], prune: bool = True) -> List[Path]:
+    """manifest 의 지문 사본(하드링크, 안 되면 복사) 생성 후 사본 목록 반환
+
+    사본이 이미 있으면 그대로 두고, prune=True 면 manifest 에 없는 이전 지문 사본은 삭제합니다.
+    """
+    static_root = Path(static_root)
+    written = []
+    for url, fingerprinted in manifest.items():
+        source = static_root / url[len(STATIC_URL_PREFIX):]
+        target = static_root / fingerprinted[len(STATIC_URL_PREFIX):]
+        written.append(target)
+        if target.exists() or not source.is_file():
+            continue
+        temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            os.link(source, temp)
+        except OSError:
+            shutil.copy2(source, temp)
+        os.replace(temp, target)
+
+    if not prune:
+        return written
+    current = {path.as_posix() for path in written}
+    for path in static_root.rglob("*"):
+        name = path.name
+        for suffix in ENCODING_SUFFIXES.values():
+            name = name.removesuffix(suffix)
+        if path.is_file() and FINGERPRINTED_NAME.match(name) and path.with_name(name).as_posix() not in current:
+            path.unlink()
+    return written
+
+
+def write_asset_manifest(static_root: Path, manifest: Dict[str, str]):
+    """static_root/asset-manifest.json 저장 (내용이 같으면 파일을 그대로 둠)"""
+    path = Path(static_root) / ASSET_MANIFEST_SUBPATH
+    payload = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+    try:
+        unchanged = path.read_text(encoding="utf-8") == payload
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        path.write_text(payload, encoding="utf-8")
+
+
+def main():
+    """메인 함수 (static 디렉토리의 지문 manifest 출력)"""
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("static")
+    manifest = AssetFingerprints(root).manifest()
+    for url, fingerprinted in manifest.items():
+        print(f"{url} → {fingerprinted}")
+    print(f"🔖 지문 대상 파일 {len(manifest)}개")
+
+
+if __name__ == "__main__":
+    main()
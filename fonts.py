@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""웹폰트 셀프 호스팅 모듈 (Google Fonts 대신 사용 중인 Inter 굵기만 subset 해서 static/fonts 로 제공)
+
+vendor/fonts/Inter-<굵기>.(woff2|ttf|otf) 중 템플릿에서 쓰는 굵기(font-* 클래스/font-weight, 본문 400, 강조 700)만
+라틴 범위로 subset 해 static/fonts/inter-<굵기>.woff2 로 저장합니다. 페이지에는 font-display: swap 인
+@font-face 와 본문 굵기(400)의 preload 링크만 넣습니다 (나머지 굵기는 쓰일 때 내려받음).
+벤더 폰트가 없으면 시스템 글꼴을 사용합니다.
+"""
+
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from compression import ENCODING_SUFFIXES, brotli
+from styles import TEMPLATES_DIR, source_tokens, split_variants
+
+FONT_SOURCE_DIR = Path("vendor/fonts")
+FONTS_SUBPATH = Path("fonts")  # static 디렉토리 기준
+FONT_URL_PREFIX = "/static/fonts/"
+FONT_FAMILY = "Inter"
+FONT_STYLES = {
+    100: "Thin",
+    200: "ExtraLight",
+    300: "Light",
+    400: "Regular",
+    500: "Medium",
+    600: "SemiBold",
+    700: "Bold",
+    800: "ExtraBold",
+    900: "Black",
+}
+FONT_FORMATS = {".woff2": "woff2", ".ttf": "truetype", ".otf": "opentype"}
+WEIGHT_CLASSES = {
+    "font-thin": 100,
+    "font-extralight": 200,
+    "font-light": 300,
+    "font-normal": 400,
+    "font-medium": 500,
+    "font-semibold": 600,
+    "font-bold": 700,
+    "font-extrabold": 800,
+    "font-black": 900,
+}
+WEIGHT_DECLARATION = re.compile(r"font-weight:\s*([1-9]00)\b")
+BASE_WEIGHTS = {400, 700}  # 본문, <strong>/<b> (마크다운 콘텐츠)
+PRELOAD_WEIGHT = (
+    400  # 첫 화면 대부분을 차지하는 본문 굵기만 preload (subset 후 굵기마다 약 30KB)
+)
+# Google Fonts 의 latin subset 범위 (한글은 시스템 글꼴로 표시)
+LATIN_RANGE = (
+    "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,U+0304,U+0308,U+0329,"
+    "U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD"
+)
+
+# fontTools 는 선택 의존성 (없으면 벤더 폰트를 subset 없이 그대로 복사)
+subset = None
+
+
+def _load_fonttools() -> bool:
+    """fontTools 를 처음 필요할 때 import (설치되어 있지 않으면 False)"""
+    global subset
+    if subset is None:
+        try:
+            from fontTools import subset
+        except ImportError:
+            return False
+    return True
+
+
+def subset_available() -> bool:
+    """woff2 로 subset 할 수 있는지 (fontTools + brotli)"""
+    return _load_fonttools() and brotli is not None
+
+
+def parse_unicode_range(value: str) -> List[int]:
+    """'U+0000-00FF,U+2122' → 코드 포인트 목록"""
+    codepoints = []
+    for part in value.split(","):
+        start, _, end = part.strip()[2:].partition("-")
+        codepoints.extend(range(int(start, 16), int(end or start, 16) + 1))
+    return codepoints
+
+
+def source_path(weight: int) -> Optional[Path]:
+    """굵기별 벤더 폰트 파일 (없으면 None)"""
+    for suffix in FONT_FORMATS:
+        path = FONT_SOURCE_DIR / f"{FONT_FAMILY}-{FONT_STYLES[weight]}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def output_name(weight: int, source: Path) -> str:
+    """static/fonts 의 출력 파일 이름 (subset 가능하면 항상 woff2)"""
+    suffix = (
+        ".woff2" if source.suffix == ".woff2" or subset_available() else source.suffix
+    )
+    return f"{FONT_FAMILY.lower()}-{weight}{suffix}"
+
+
+def weights_in(text: str) -> Set[int]:
+    """템플릿 소스에서 쓰인 굵기 (font-* 클래스 + <style> 의 font-weight 선언)"""
+    weights = {
+        WEIGHT_CLASSES[name]
+        for name in (split_variants(token)[-1] for token in source_tokens(text))
+        if name in WEIGHT_CLASSES
+    }
+    return weights | {int(value) for value in WEIGHT_DECLARATION.findall(text)}
+
+
+_faces_lock = threading.Lock()
+_faces: Optional[Tuple[tuple, List[Dict]]] = None
+
+
+def _signature() -> tuple:
+    """템플릿과 벤더 폰트의 (경로, 수정 시각, 크기)"""
+    paths = sorted(TEMPLATES_DIR.rglob("*.html"))
+    if FONT_SOURCE_DIR.is_dir():
+        paths += sorted(FONT_SOURCE_DIR.iterdir())
+    return tuple(
+        (str(path), path.stat().st_mtime_ns, path.stat().st_size) for path in paths
+    )
+
+
+def font_faces() -> List[Dict]:
+    """사용 중이고 벤더 폰트가 있는 굵기 [{weight, source, name, url, format}] (굵기 순)"""
+    global _faces
+    signature = _signature()
+    with _faces_lock:
+        if _faces is not None and _faces[0] == signature:
+            return _faces[1]
+    weights = set(BASE_WEIGHTS)
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")):
+        weights |= weights_in(path.read_text(encoding="utf-8"))
+    faces = []
+    for weight in sorted(weights):
+        source = source_path(weight)
+        if source is None:
+            continue
+        name = output_name(weight, source)
+        faces.append(
+            {
+                "weight": weight,
+                "source": source,
+                "name": name,
+                "url": FONT_URL_PREFIX + name,
+                "format": FONT_FORMATS[Path(name).suffix],
+            }
+        )
+    with _faces_lock:
+        _faces = (signature, faces)
+    return faces
+
+
+def font_css() -> str:
+    """@font-face 규칙 (font-display: swap, 벤더 폰트가 없으면 빈 문자열)"""
+    return "".join(
+        f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;font-weight:{face['weight']};"
+        f"font-display:swap;src:url({face['url']}) format('{face['format']}');unicode-range:{LATIN_RANGE}}}"
+        for face in font_faces()
+    )
+
+
+def font_preloads() -> str:
+    """본문 굵기 폰트의 preload 링크 (벤더 폰트가 없으면 빈 문자열)"""
+    return "".join(
+        f'<link rel="preload" href="{face["url"]}" as="font" type="font/{Path(face["name"]).suffix[1:]}" crossorigin>'
+        for face in font_faces()
+        if face["weight"] == PRELOAD_WEIGHT
+    )
+
+
+def subset_font(source: Path, target: Path):
+    """라틴 범위로 subset 해 저장 (fontTools 가 없으면 그대로 복사)"""
+    temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    if _load_fonttools() and (target.suffix != ".woff2" or brotli is not None):
+        options = subset.Options()
+        options.flavor = "woff2" if target.suffix == ".woff2" else None
+        options.layout_features = ["*"]
+        font = subset.load_font(str(source), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=parse_unicode_range(LATIN_RANGE))
+        subsetter.subset(font)
+        subset.save_font(font, str(temp), options)
+    else:
+        shutil.copyfile(source, temp)
+    # 정적 동기화가 하드링크한 파일일 수 있으므로 임시 파일에 쓰고 교체
+    os.replace(temp, target)
+
+
+def build_fonts(static_root: Path) -> List[Path]:
+    """static_root/fonts 에 사용 중인 굵기의 폰트 생성 (원본보다 최신이면 재사용), 출력 목록 반환"""
+    directory = Path(static_root) / FONTS_SUBPATH
+    outputs = []
+    for face in font_faces():
+        target = directory / face["name"]
+        outputs.append(target)
+        # subset 없이 복사해 둔 사본(원본과 크기가 같음)은 fontTools 가 생기면 다시 생성
+        if (
+            target.exists()
+            and target.stat().st_mtime_ns >= face["source"].stat().st_mtime_ns
+            and not (
+                subset_available()
+                and target.stat().st_size == face["source"].stat().st_size
+            )
+        ):
+            continue
+        directory.mkdir(parents=True, exist_ok=True)
+        subset_font(face["source"], target)
+        for suffix in ENCODING_SUFFIXES.values():
+            target.with_name(target.name + suffix).unlink(missing_ok=True)
+    # 더 이상 쓰지 않는 굵기 정리
+    if directory.is_dir():
+        names = {path.name for path in outputs}
+        for path in directory.glob(f"{FONT_FAMILY.lower()}-*"):
+            name = path.name
+            for suffix in ENCODING_SUFFIXES.values():
+                name = name.removesuffix(suffix)
+            if name not in names:
+                path.unlink()
+    return outputs
+
+
+def main():
+    """메인 함수 (개발 서버용으로 static/fonts 생성)"""
+    outputs = build_fonts(Path("static"))
+    if not outputs:
+        print(
+            f"⚠️  {FONT_SOURCE_DIR} 에 {FONT_FAMILY} 폰트가 없어 시스템 글꼴을 사용합니다."
+        )
+        return
+    if not subset_available():
+        print(
+            "⚠️  fontTools/brotli가 없어 subset 없이 복사했습니다. (pip install fonttools brotli)"
+        )
+    for path in outputs:
+        print(f"🔤 {path} ({path.stat().st_size / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,321 +1,455 @@
 #!/usr/bin/env python3
-"""의존성 없이 정적 HTML 생성"""
+"""의존성 없는 빠른 정적 사이트 생성기 (build_static 이 저장한 데이터 스냅샷 + 템플릿 조각 사용)
 
+build_static.py 가 빌드할 때 .cache/site-snapshot.json 에 포트폴리오 데이터(사이트 정보, 프로젝트 목록),
+렌더링한 프로젝트 마크다운, 검색용 본문, 이미지 변환본/자산 지문 manifest, 스타일시트와 함께
+templates/*.html 의 페이지/반복 블록을 자리 표시 값으로 렌더링한 string.Template 조각을 저장하고,
+이 스크립트는 표준 라이브러리만으로 조각을 데이터로 채워 전체 사이트(목록 페이지, 프로젝트 상세, 404, 검색 샤드)를
+생성합니다. 조각은 템플릿에서 만들어지므로 템플릿을 바꿔도 따로 고칠 곳이 없고, 스냅샷은 배포 디렉토리 밖에 둡니다.
+pip 설치 없이 CI/Pages 러너에서 빌드할 때 사용합니다.
+
+사용법:
+    python generate_static.py                       # .cache/site-snapshot.json → docs/
+    python generate_static.py --snapshot snapshot.json --output site
+    python generate_static.py --check               # 현재 콘텐츠를 Jinja2 로 렌더링한 결과와 비교 (build_static 의존성 필요)
+    python generate_static.py --no-precompress      # .gz/.br 사본 없이 HTML 만
+"""
+
+import argparse
+import json
 import os
 import shutil
+import sys
+import tempfile
+import time
 from pathlib import Path
+from string import Template
+from typing import Dict, List, Optional
+
+from compression import precompress_directory
+from data.project_registry import ProjectRegistry
+from data.search_index import SearchIndex
+from fingerprint import AssetFingerprints, rewrite_urls, write_fingerprinted
+from fonts import build_fonts
+from icons import inline_icons
+from minify import minify_html
+from static_sync import sync_tree
+
+OUTPUT_DIR = Path("docs")
+STATIC_DIR = Path("static")
+SNAPSHOT_PATH = Path(".cache/site-snapshot.json")
+SNAPSHOT_VERSION = 7
+SEARCH_INDEX_DIR = "search-index"
+STYLESHEET_PATH = "static/css/site.css"  # OUTPUT_DIR 기준
+
+
+def write_snapshot(path: Path, snapshot: Dict):
+    """스냅샷 저장 (build_static 에서 호출)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp.write_text(
+        json.dumps({"version": SNAPSHOT_VERSION, **snapshot}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    os.replace(temp, path)
+
+
+def load_snapshot(path: Path) -> Dict:
+    """스냅샷 로드 (없거나 버전이 다르면 ValueError)"""
+    if not path.exists():
+        raise ValueError(
+            f"스냅샷이 없습니다: {path} (python build_static.py 로 먼저 생성하세요)"
+        )
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"스냅샷 버전이 다릅니다: {snapshot.get('version')} (python build_static.py 로 다시 생성하세요)"
+        )
+    return snapshot
+
+
+def escape(value) -> str:
+    """Jinja2 자동 이스케이프(markupsafe)와 같은 HTML 이스케이프 (None 은 'None')"""
+    return (
+        str(value)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&#34;")
+        .replace("'", "&#39;")
+    )
+
+
+def page_href(number: int) -> str:
+    """정적 사이트 목록 페이지 링크 (templates/index.html 의 page_href 매크로, static_pages)"""
+    return ("/" if number == 1 else f"/page/{number}") + "#projects"
+
+
+def page_output(number: int) -> str:
+    """목록 페이지 출력 경로"""
+    return "index.html" if number == 1 else f"page/{number}.html"
+
+
+class PageRenderer:
+    """스냅샷 조각을 데이터로 채워 페이지 HTML 생성 (반복/조건은 templates/*.html 과 같은 규칙)"""
+
+    def __init__(self, fragments: Dict[str, str], image_manifest: Dict):
+        self.fragments = {name: Template(text) for name, text in fragments.items()}
+        self.image_manifest = image_manifest
+
+    def fill(self, name: str, **values) -> str:
+        """조각 하나 채우기"""
+        return self.fragments[name].substitute(values)
+
+    def project_card(self, project: Dict) -> str:
+        """프로젝트 카드 (반응형 이미지 변환본이 있으면 <picture>)"""
+        card = {
+            key: escape(project.get(key, ""))
+            for key in ("id", "title", "period", "description", "image")
+        }
+        variants = self.image_manifest.get(project.get("image"))
+        if variants:
+            sources = "".join(
+                self.fill(
+                    "project_image_source",
+                    type=escape(source["type"]),
+                    srcset=escape(source["srcset"]),
+                )
+                for source in variants["sources"]
+            )
+            media = self.fill(
+                "project_picture",
+                **card,
+                project_image_source=sources,
+                width=escape(variants["width"]),
+                height=escape(variants["height"]),
+            )
+        else:
+            media = self.fill("project_image", **card)
+        highlights = ""
+        if project["highlights"]:
+            highlights = self.fill(
+                "project_highlights",
+                project_highlight="".join(
+                    self.fill("project_highlight", text=escape(highlight))
+                    for highlight in project["highlights"]
+                ),
+            )
+        hidden_techs = project["tech_count"] - len(project["tech_stack"])
+        return self.fill(
+            "project_card",
+            **card,
+            project_media=media,
+            project_highlights=highlights,
+            project_tech="".join(
+                self.fill("project_tech", tech=escape(tech))
+                for tech in project["tech_stack"]
+            ),
+            project_more_techs=(
+                self.fill("project_more_techs", count=hidden_techs)
+                if hidden_techs
+                else ""
+            ),
+        )
+
+    def pagination(self, page: int, pages: int) -> str:
+        """목록 페이지 이동 (현재 페이지 ±2, 처음/마지막 페이지 표시)"""
+        if pages <= 1:
+            return ""
+        numbers, previous = [], None
+        for number in range(1, pages + 1):
+            if not (number == 1 or number == pages or abs(number - page) <= 2):
+                continue
+            gap = previous is not None and number - previous > 1
+            numbers.append(
+                self.fill(
+                    "page_current" if number == page else "page_number",
+                    page_gap=self.fill("page_gap") if gap else "",
+                    href=escape(page_href(number)),
+                    number=number,
+                )
+            )
+            previous = number
+        return self.fill(
+            "pagination",
+            page_previous=(
+                self.fill("page_previous", href=escape(page_href(page - 1)))
+                if page > 1
+                else ""
+            ),
+            page_numbers="".join(numbers),
+            page_next=(
+                self.fill("page_next", href=escape(page_href(page + 1)))
+                if page < pages
+                else ""
+            ),
+        )
+
+    def index(self, site: Dict, projects: List[Dict], page: int, pages: int) -> str:
+        """메인 페이지 (index.html / page/N.html)"""
+        experience = "".join(
+            self.fill(
+                "experience_item",
+                **{
+                    key: escape(item.get(key, ""))
+                    for key in ("position", "company", "period", "description")
+                },
+                achievement="".join(
+                    self.fill("achievement", text=escape(achievement))
+                    for achievement in item.get("achievements", [])
+                ),
+            )
+            for item in site["experience"]
+        )
+        skills = "".join(
+            self.fill(
+                "skill_category",
+                skill_heading=self.fill(
+                    f"skill_heading:{category}"
+                    if f"skill_heading:{category}" in self.fragments
+                    else "skill_heading"
+                ),
+                skill="".join(
+                    self.fill("skill", text=escape(skill)) for skill in skill_list
+                ),
+            )
+            for category, skill_list in site["skills"].items()
+        )
+        return self.fill(
+            "index",
+            **{
+                f"info_{key}": escape(value)
+                for key, value in site["personal_info"].items()
+            },
+            about=site["about"],
+            experience=experience,
+            projects="".join(self.project_card(project) for project in projects)
+            or self.fill("projects_empty"),
+            pagination=self.pagination(page, pages),
+            skills=skills,
+        )
+
+    def project(self, project: Dict, content: str) -> str:
+        """프로젝트 상세 페이지 (project.html)"""
+        return self.fill(
+            "project_page",
+            **{
+                key: escape(project.get(key, ""))
+                for key in ("title", "description", "period")
+            },
+            content=content,
+            tech="".join(
+                self.fill("project_page_tech", tech=escape(tech))
+                for tech in project.get("tech_stack", [])
+            ),
+        )
+
+
+def available_assets(asset_manifest: Dict[str, str], root: Path) -> Dict[str, str]:
+    """지문 사본이 root 에 있는 항목만"""
+    return {
+        url: fingerprinted
+        for url, fingerprinted in asset_manifest.items()
+        if (root / fingerprinted.lstrip("/")).exists()
+    }
+
+
+def available_images(image_manifest: Dict, root: Path) -> Dict:
+    """변환본 파일이 root 에 모두 있는 이미지만 (Pillow 없이 생성하므로 기존 빌드 결과 재사용)"""
+    available = {}
+    for url, entry in image_manifest.items():
+        files = [
+            candidate.split(" ")[0]
+            for source in entry["sources"]
+            for candidate in source["srcset"].split(", ")
+        ]
+        if all((root / path.lstrip("/")).exists() for path in files):
+            available[url] = entry
+    return available
+
+
+def link_assets(asset_manifest: Dict[str, str], output_dir: Path):
+    """원본 내용이 스냅샷 때와 같은 자산의 지문 사본 생성 (build_static 없이 새로 생성하는 경우)"""
+    static_root = output_dir / "static"
+    fingerprints = AssetFingerprints(static_root)
+    current = {
+        url: fingerprinted
+        for url, fingerprinted in asset_manifest.items()
+        if fingerprints.url(url) == fingerprinted
+    }
+    write_fingerprinted(static_root, current, prune=False)
+
+
+def render_pages(snapshot: Dict, image_manifest: Dict) -> Dict[str, str]:
+    """스냅샷 데이터로 전체 페이지 렌더링 (최소화/지문 치환 전) 후 {상대 경로: HTML} 반환"""
+    renderer = PageRenderer(snapshot["fragments"], image_manifest)
+    registry = ProjectRegistry(snapshot["projects"])
+    pages = {}
+    first = registry.page(page=1, per_page=snapshot["per_page"])
+    for number in range(1, first.pages + 1):
+        project_page = (
+            first
+            if number == 1
+            else registry.page(page=number, per_page=snapshot["per_page"])
+        )
+        pages[page_output(number)] = renderer.index(
+            snapshot["site"], project_page.items, number, first.pages
+        )
+    for project in snapshot["projects"]:
+        pages[f"project/{project['id']}.html"] = renderer.project(
+            project, snapshot["contents"][project["id"]]
+        )
+    pages["404.html"] = renderer.fill("404")
+    return pages
+
+
+def generate_site(
+    snapshot: Dict, output_dir: Path, assets_dir: Optional[Path] = None
+) -> Dict[str, str]:
+    """스냅샷으로 전체 페이지와 검색 샤드 생성 후 {상대 경로: 배포용 HTML} 반환
+
+    지문 사본/이미지 변환본이 있는지는 assets_dir 기준으로 판단합니다 (기본: output_dir, 이때 웹폰트/지문 사본도 생성).
+    """
+    if assets_dir is None:
+        assets_dir = output_dir
+        # 정적 동기화가 하드링크한 파일일 수 있으므로 임시 파일에 쓰고 교체
+        stylesheet = output_dir / STYLESHEET_PATH
+        stylesheet.parent.mkdir(parents=True, exist_ok=True)
+        temp = stylesheet.with_name(stylesheet.name + ".tmp")
+        temp.write_text(snapshot["stylesheet"], encoding="utf-8")
+        os.replace(temp, stylesheet)
+        build_fonts(output_dir / "static")
+        link_assets(snapshot["assets"], output_dir)
+    assets = available_assets(snapshot["assets"], assets_dir)
+
+    pages = {
+        relative: minify_html(rewrite_urls(inline_icons(html), assets))
+        for relative, html in render_pages(
+            snapshot, available_images(snapshot["image_manifest"], assets_dir)
+        ).items()
+    }
+    for relative, html in pages.items():
+        path = output_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html, encoding="utf-8")
+    SearchIndex(snapshot["projects"], snapshot["bodies"]).write_shards(
+        output_dir / SEARCH_INDEX_DIR
+    )
+    return pages
+
+
+def clean_output(output_dir: Path):
+    """이전 출력 삭제 (정적 자산은 유지)"""
+    if output_dir.exists():
+        for path in output_dir.iterdir():
+            if path.name == "static":
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+
+def check_output(snapshot: Dict, reference_dir: Path) -> List[str]:
+    """현재 콘텐츠를 Jinja2 로 렌더링한 페이지/검색 샤드와 생성 결과가 다른 파일 목록 (build_static 의존성 필요)
+
+    지문 사본/이미지 변환본 존재 여부는 reference_dir (build_static 출력) 기준으로 양쪽에 같게 적용합니다.
+    """
+    from build_static import render_site_pages
+    from data.portfolio_data import get_search_index
+
+    with tempfile.TemporaryDirectory(prefix="generate-static-") as tmp:
+        generated_dir, expected_dir = Path(tmp) / "generated", Path(tmp) / "expected"
+        generated = generate_site(snapshot, generated_dir, assets_dir=reference_dir)
+        expected = render_site_pages(
+            available_images(snapshot["image_manifest"], reference_dir),
+            available_assets(snapshot["assets"], reference_dir),
+        )
+        differences = sorted(
+            relative
+            for relative in generated.keys() | expected.keys()
+            if generated.get(relative) != expected.get(relative)
+        )
+
+        get_search_index().write_shards(expected_dir / SEARCH_INDEX_DIR)
+        shards = {
+            path.relative_to(directory).as_posix()
+            for directory in (generated_dir, expected_dir)
+            for path in (directory / SEARCH_INDEX_DIR).iterdir()
+        }
+        for relative in sorted(shards):
+            generated_path, expected_path = (
+                generated_dir / relative,
+                expected_dir / relative,
+            )
+            if not (
+                generated_path.exists()
+                and expected_path.exists()
+                and generated_path.read_bytes() == expected_path.read_bytes()
+            ):
+                differences.append(relative)
+        return differences
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="의존성 없는 정적 사이트 생성 (build_static 스냅샷 사용)"
+    )
+    parser.add_argument(
+        "--snapshot", type=Path, default=SNAPSHOT_PATH, help="스냅샷 경로"
+    )
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="출력 디렉토리")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="생성 결과를 현재 콘텐츠의 Jinja2 렌더링 결과와 비교 (자산 존재 여부는 출력 디렉토리 기준)",
+    )
+    parser.add_argument(
+        "--no-precompress", action="store_true", help=".gz/.br 사전 압축 사본 생성 생략"
+    )
+    return parser.parse_args()
 
-def create_simple_index():
-    """간단한 index.html 생성"""
-    html_content = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SeungHo Choi - Senior Data Engineer</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        body { font-family: 'Inter', sans-serif; }
-        .gradient-bg { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-        .hover-lift { transition: transform 0.3s ease, box-shadow 0.3s ease; }
-        .hover-lift:hover { transform: translateY(-5px); box-shadow: 0 20px 40px rgba(0,0,0,0.1); }
-    </style>
-</head>
-<body class="bg-gray-50">
-    <!-- Navigation -->
-    <nav class="bg-white shadow-sm border-b sticky top-0 z-50">
-        <div class="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between items-center py-4">
-                <div class="text-2xl font-bold text-gray-800">SeungHo Choi</div>
-                <div class="hidden md:flex space-x-8">
-                    <a href="#about" class="text-gray-600 hover:text-gray-800 transition-colors">About</a>
-                    <a href="#experience" class="text-gray-600 hover:text-gray-800 transition-colors">Experience</a>
-                    <a href="#projects" class="text-gray-600 hover:text-gray-800 transition-colors">Projects</a>
-                    <a href="#skills" class="text-gray-600 hover:text-gray-800 transition-colors">Skills</a>
-                    <a href="#contact" class="text-gray-600 hover:text-gray-800 transition-colors">Contact</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Hero Section -->
-    <section class="gradient-bg text-white py-20">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
-            <div class="mb-8">
-                <img src="static/images/profile.jpg" alt="SeungHo Choi" class="w-32 h-32 rounded-full mx-auto mb-6 border-4 border-white shadow-lg">
-            </div>
-            <h1 class="text-5xl md:text-6xl font-bold mb-6">Senior Data Engineer</h1>
-            <p class="text-xl md:text-2xl text-white/90 mb-8">데이터 생성부터 소비까지 End-to-End를 책임지는 4년차 시니어 데이터 엔지니어</p>
-            <div class="flex justify-center space-x-6">
-                <a href="https://github.com/smothly" class="text-white/80 hover:text-white text-2xl transition-colors">
-                    <i class="fab fa-github"></i>
-                </a>
-                <a href="https://www.linkedin.com/in/csh0911/" class="text-white/80 hover:text-white text-2xl transition-colors">
-                    <i class="fab fa-linkedin"></i>
-                </a>
-            </div>
-        </div>
-    </section>
-
-    <!-- About Section -->
-    <section id="about" class="py-20 bg-white">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-4xl font-bold text-center mb-16 text-gray-800">About Me</h2>
-            <div class="max-w-3xl mx-auto">
-                <p class="mb-6 text-lg leading-relaxed">
-                <strong>데이터 생성부터 소비까지 End-to-End를 책임지는</strong> 4년차 시니어 데이터 엔지니어입니다.<br>
-                게임 산업에서 <strong>일 4,000만 건의 데이터를 안정적으로 처리</strong>하며, 실시간 데이터 파이프라인부터 AI/ML 인프라까지 구축해왔습니다.
-                </p>
-                <p class="mb-6 text-lg leading-relaxed">
-                <strong>비용 효율성과 안정성을 동시에 추구</strong>하는 것이 저의 강점입니다.<br>
-                AWS 크레딧 $34K 확보, 월 $1,000+ 비용 절감, 99.9% 데이터 정합성 달성 등<br>
-                <strong>기술적 우수성을 비즈니스 가치로 전환</strong>하는 능력을 입증해왔습니다.
-                </p>
-                <p class="text-lg leading-relaxed">
-                단순한 데이터 파이프라인 구축을 넘어, <strong>조직의 데이터 문화를 혁신</strong>하는 것이 목표입니다.<br>
-                LLM 기반 Text-to-SQL로 데이터 추출 요청 70% 감소, 자동화를 통한 운영 리소스 90% 절감 등<br>
-                <strong>기술로 사람과 조직의 생산성을 극대화</strong>하는 데이터 엔지니어입니다.
-                </p>
-            </div>
-        </div>
-    </section>
-
-    <!-- Experience Section -->
-    <section id="experience" class="py-20 bg-gray-50">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-4xl font-bold text-center mb-16 text-gray-800">Experience</h2>
-            <div class="bg-white rounded-2xl p-8 shadow-lg">
-                <div class="flex items-start space-x-4">
-                    <div class="flex-shrink-0">
-                        <div class="w-12 h-12 bg-blue-600 rounded-full flex items-center justify-center">
-                            <i class="fas fa-building text-white"></i>
-                        </div>
-                    </div>
-                    <div class="flex-1">
-                        <h3 class="text-2xl font-bold text-gray-800">Senior Data Engineer</h3>
-                        <p class="text-blue-600 font-semibold mb-2">Neowiz • 2022.01 - Present</p>
-                        <p class="text-gray-600 mb-4">게임 데이터 플랫폼 설계 및 운영, 실시간 데이터 파이프라인 구축</p>
-                        <ul class="space-y-2">
-                            <li class="flex items-start">
-                                <i class="fas fa-check-circle text-green-500 mt-1 mr-3"></i>
-                                <span>🏗️ 멀티클라우드 실시간 데이터 파이프라인 구축 (AWS ↔ GCP, 일 4,000만 건 처리)</span>
-                            </li>
-                            <li class="flex items-start">
-                                <i class="fas fa-check-circle text-green-500 mt-1 mr-3"></i>
-                                <span>💰 인프라 비용 최적화로 월 $1,000+ 절감 및 AWS 크레딧 $34K 확보</span>
-                            </li>
-                            <li class="flex items-start">
-                                <i class="fas fa-check-circle text-green-500 mt-1 mr-3"></i>
-                                <span>🤖 LLM 기반 Text-to-SQL 시스템으로 데이터 추출 요청 70% 감소</span>
-                            </li>
-                            <li class="flex items-start">
-                                <i class="fas fa-check-circle text-green-500 mt-1 mr-3"></i>
-                                <span>📊 Redshift 멀티클러스터 아키텍처 설계로 성능 병목 해결</span>
-                            </li>
-                            <li class="flex items-start">
-                                <i class="fas fa-check-circle text-green-500 mt-1 mr-3"></i>
-                                <span>⚡ 자동화 및 모니터링 시스템으로 운영 리소스 90% 절감</span>
-                            </li>
-                        </ul>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Projects Section -->
-    <section id="projects" class="py-20 bg-white">
-        <div class="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-4xl font-bold text-center mb-16 text-gray-800">Featured Projects</h2>
-            <div class="grid md:grid-cols-2 gap-8">
-                <!-- Project 1 -->
-                <div class="bg-gradient-to-br from-white to-gray-50 rounded-2xl overflow-hidden shadow-lg hover-lift">
-                    <div class="h-48 bg-gradient-to-r from-blue-500 to-purple-600 flex items-center justify-center">
-                        <i class="fas fa-project-diagram text-4xl text-white"></i>
-                    </div>
-                    <div class="p-6">
-                        <h3 class="text-xl font-bold text-gray-800 mb-2">Multi-Cloud Real-time Pipeline</h3>
-                        <p class="text-gray-600 mb-4">AWS DMS CDC, Lambda, SQS를 활용한 멀티클라우드 실시간 데이터 파이프라인. 일 4,000만 건 데이터 처리</p>
-                        <div class="flex flex-wrap gap-2 mb-4">
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 일 4,000만 건 처리</span>
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 99.9% 정합성</span>
-                        </div>
-                        <div class="flex flex-wrap gap-2">
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">AWS DMS</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Lambda</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">BigQuery</span>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Project 2 -->
-                <div class="bg-gradient-to-br from-white to-gray-50 rounded-2xl overflow-hidden shadow-lg hover-lift">
-                    <div class="h-48 bg-gradient-to-r from-green-500 to-teal-600 flex items-center justify-center">
-                        <i class="fas fa-database text-4xl text-white"></i>
-                    </div>
-                    <div class="p-6">
-                        <h3 class="text-xl font-bold text-gray-800 mb-2">Redshift 인프라 현대화</h3>
-                        <p class="text-gray-600 mb-4">멀티클러스터 아키텍처로 전환하여 성능 병목 해결. AWS와 협업하여 $34K 크레딧 확보</p>
-                        <div class="flex flex-wrap gap-2 mb-4">
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ AWS 크레딧 $34K</span>
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ Games on AWS 발표</span>
-                        </div>
-                        <div class="flex flex-wrap gap-2">
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Redshift</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Terraform</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Grafana</span>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Project 3 -->
-                <div class="bg-gradient-to-br from-white to-gray-50 rounded-2xl overflow-hidden shadow-lg hover-lift">
-                    <div class="h-48 bg-gradient-to-r from-purple-500 to-pink-600 flex items-center justify-center">
-                        <i class="fas fa-brain text-4xl text-white"></i>
-                    </div>
-                    <div class="p-6">
-                        <h3 class="text-xl font-bold text-gray-800 mb-2">LLM Text-to-SQL 시스템</h3>
-                        <p class="text-gray-600 mb-4">LangChain과 OpenAI GPT를 활용한 자연어 쿼리 시스템. 데이터 추출 요청 70% 감소</p>
-                        <div class="flex flex-wrap gap-2 mb-4">
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 요청 70% 감소</span>
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 자연어 → SQL</span>
-                        </div>
-                        <div class="flex flex-wrap gap-2">
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">OpenAI GPT</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">LangChain</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Chainlit</span>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Project 4 -->
-                <div class="bg-gradient-to-br from-white to-gray-50 rounded-2xl overflow-hidden shadow-lg hover-lift">
-                    <div class="h-48 bg-gradient-to-r from-orange-500 to-red-600 flex items-center justify-center">
-                        <i class="fas fa-chart-line text-4xl text-white"></i>
-                    </div>
-                    <div class="p-6">
-                        <h3 class="text-xl font-bold text-gray-800 mb-2">비용 최적화 프로젝트</h3>
-                        <p class="text-gray-600 mb-4">S3 Intelligent Tiering, Graviton 등을 통한 체계적인 비용 최적화. 월 $1,000+ 절감</p>
-                        <div class="flex flex-wrap gap-2 mb-4">
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 월 $1,000+ 절감</span>
-                            <span class="px-3 py-1 bg-green-100 text-green-800 text-xs rounded-full">✨ 자동 모니터링</span>
-                        </div>
-                        <div class="flex flex-wrap gap-2">
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">S3 Lifecycle</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Graviton</span>
-                            <span class="px-3 py-1 bg-blue-100 text-blue-800 text-sm rounded-full">Lambda</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Skills Section -->
-    <section id="skills" class="py-20 bg-gray-50">
-        <div class="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
-            <h2 class="text-4xl font-bold text-center mb-16 text-gray-800">Technical Expertise</h2>
-            <div class="grid md:grid-cols-2 lg:grid-cols-3 gap-8">
-                <div class="bg-white rounded-2xl p-6 shadow-lg">
-                    <h3 class="text-xl font-bold mb-4 text-gray-800 flex items-center">
-                        <i class="fas fa-cloud mr-3 text-blue-600"></i>Cloud Platforms
-                    </h3>
-                    <div class="flex flex-wrap gap-2">
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">AWS (Expert)</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Google Cloud</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Azure</span>
-                    </div>
-                </div>
-                <div class="bg-white rounded-2xl p-6 shadow-lg">
-                    <h3 class="text-xl font-bold mb-4 text-gray-800 flex items-center">
-                        <i class="fas fa-database mr-3 text-green-600"></i>Data Engineering
-                    </h3>
-                    <div class="flex flex-wrap gap-2">
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Apache Spark</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Kafka</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Airflow</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">Trino</span>
-                    </div>
-                </div>
-                <div class="bg-white rounded-2xl p-6 shadow-lg">
-                    <h3 class="text-xl font-bold mb-4 text-gray-800 flex items-center">
-                        <i class="fas fa-brain mr-3 text-pink-600"></i>AI/ML
-                    </h3>
-                    <div class="flex flex-wrap gap-2">
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">LangChain</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">OpenAI GPT</span>
-                        <span class="px-3 py-2 bg-gray-100 text-gray-700 rounded-lg text-sm">MLflow</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Contact Section -->
-    <section id="contact" class="py-20 bg-white">
-        <div class="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
-            <h2 class="text-4xl font-bold mb-8 text-gray-800">Get In Touch</h2>
-            <p class="text-xl text-gray-600 mb-8">데이터 엔지니어링에 대한 이야기를 나누고 싶으시다면 언제든 연락주세요!</p>
-            <div class="flex justify-center space-x-8">
-                <a href="https://github.com/smothly" class="flex items-center text-gray-600 hover:text-gray-800 transition-colors">
-                    <i class="fab fa-github text-2xl mr-3"></i>
-                    <span class="text-lg">GitHub</span>
-                </a>
-                <a href="https://www.linkedin.com/in/csh0911/" class="flex items-center text-gray-600 hover:text-gray-800 transition-colors">
-                    <i class="fab fa-linkedin text-2xl mr-3"></i>
-                    <span class="text-lg">LinkedIn</span>
-                </a>
-            </div>
-        </div>
-    </section>
-
-    <!-- Footer -->
-    <footer class="bg-gray-800 text-white py-12">
-        <div class="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8 text-center">
-            <p class="text-gray-300">&copy; 2025 SeungHo Choi. All rights reserved.</p>
-        </div>
-    </footer>
-
-    <script>
-        // Smooth scrolling for navigation links
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function (e) {
-                e.preventDefault();
-                document.querySelector(this.getAttribute('href')).scrollIntoView({
-                    behavior: 'smooth'
-                });
-            });
-        });
-    </script>
-</body>
-</html>"""
-    
-    return html_content
 
 def main():
-    """정적 사이트 생성"""
+    """메인 함수"""
+    args = parse_args()
+    start = time.perf_counter()
+    try:
+        snapshot = load_snapshot(args.snapshot)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.check:
+        differences = check_output(snapshot, args.output)
+        if differences:
+            print(
+                f"❌ Jinja2 렌더링 결과와 다른 파일 {len(differences)}개: {', '.join(differences)}"
+            )
+            sys.exit(1)
+        print("✅ Jinja2 렌더링 결과와 일치합니다.")
+        return
+
     print("🏗️  정적 HTML 생성 중...")
-    
-    # docs 디렉토리 생성
-    docs_dir = Path("docs")
-    if docs_dir.exists():
-        shutil.rmtree(docs_dir)
-    docs_dir.mkdir()
-    
-    # index.html 생성
-    html_content = create_simple_index()
-    with open(docs_dir / "index.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    
-    # static 폴더 복사
-    static_dir = Path("static")
-    if static_dir.exists():
-        shutil.copytree(static_dir, docs_dir / "static")
-    
-    print("✅ 정적 사이트 생성 완료!")
-    print(f"📁 출력 디렉토리: {docs_dir.absolute()}")
+    clean_output(args.output)
+    # static 폴더 동기화 (변경된 파일만 reflink/하드링크/복사, 이미지 변환본은 유지)
+    if STATIC_DIR.exists():
+        result = sync_tree(STATIC_DIR, args.output / "static", remove_orphans=False)
+        print(f"📂 정적 파일 동기화: {result.summary()}")
+    pages = generate_site(snapshot, args.output)
+    rendered = time.perf_counter()
+    print(f"📄 페이지 {len(pages)}개 생성 ({(rendered - start) * 1000:.0f}ms)")
+    if not args.no_precompress:
+        written = precompress_directory(args.output)
+        print(
+            f"🗜️  압축 파일 {len(written)}개 생성 ({(time.perf_counter() - rendered) * 1000:.0f}ms)"
+        )
+
+    print(f"✅ 정적 사이트 생성 완료! ({(time.perf_counter() - start) * 1000:.0f}ms)")
+    print(f"📁 출력 디렉토리: {args.output.absolute()}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""아이콘 인라인 SVG 변환 모듈 (Font Awesome CDN 대신 페이지에 쓰인 글리프만 담은 SVG 스프라이트)
+
+렌더링된 HTML 의 <i class="fas fa-github ..."></i> 를 <svg class="icon ..."><use href="#fa-github"></use></svg>
+로 바꾸고, 그 페이지에 쓰인 아이콘의 <symbol> 만 모은 스프라이트를 <body> 바로 뒤에 넣습니다.
+글리프는 vendor/fontawesome/icons.json (Font Awesome Free 6 solid + brands SVG 경로)에서 가져옵니다.
+"""
+
+import json
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+VENDOR_ICONS = Path("vendor/fontawesome/icons.json")
+ICON_SOURCES = (Path("templates"), Path("data"), Path("content"), Path("static/js"))
+ICON_PREFIX = "fa-"
+# 아이콘 스타일 클래스 (SVG 에서는 의미 없으므로 제거, regular 스타일은 벤더링하지 않아 solid 글리프 사용)
+STYLE_CLASSES = {"fa", "fas", "far", "fab", "fa-solid", "fa-regular", "fa-brands"}
+
+ICON_ELEMENT = re.compile(r'<i class="([^"]*)"(?: aria-hidden="true")?></i>')
+ICON_NAME = re.compile(r"\bfa-[a-z0-9-]+")
+BODY_TAG = re.compile(r"<body[^>]*>")
+
+
+class IconSet:
+    """벤더링한 글리프 모음 (SVG 좌표: viewBox 0 0 <폭> <높이>)"""
+
+    def __init__(self, payload: Dict):
+        self.height = payload["height"]
+        self.aliases: Dict[str, str] = {ICON_PREFIX + name: ICON_PREFIX + target
+                                        for name, target in payload["aliases"].items()}
+        self.glyphs: Dict[str, Tuple[int, str]] = {ICON_PREFIX + name: (width, path)
+                                                   for name, (width, path) in payload["icons"].items()}
+
+    def resolve(self, name: str) -> Optional[str]:
+        """아이콘 이름 → 글리프 이름 (별칭 포함, 없으면 None)"""
+        name = self.aliases.get(name, name)
+        return name if name in self.glyphs else None
+
+    def subset(self, names: Iterable[str]) -> Dict:
+        """주어진 아이콘만 담은 벤더 파일 형식의 dict (스냅샷용, IconSet 으로 다시 로드 가능)"""
+        aliases, glyphs = {}, {}
+        for name in names:
+            glyph = self.resolve(name)
+            if glyph is None:
+                continue
+            if glyph != name:
+                aliases[name[len(ICON_PREFIX):]] = glyph[len(ICON_PREFIX):]
+            glyphs[glyph[len(ICON_PREFIX):]] = list(self.glyphs[glyph])
+        return {"height": self.height, "aliases": dict(sorted(aliases.items())), "icons": dict(sorted(glyphs.items()))}
+
+    def view_box(self, glyph: str) -> str:
+        """글리프 폭에 맞춘 viewBox (높이 = 1em)"""
+        return f"0 0 {self.glyphs[glyph][0]} {self.height}"
+
+    def symbol(self, glyph: str) -> str:
+        """스프라이트용 <symbol>"""
+        return f'<symbol id="{glyph}" viewBox="{self.view_box(glyph)}"><path d="{self.glyphs[glyph][1]}"/></symbol>'
+
+    def sprite(self, glyphs: Iterable[str]) -> str:
+        """주어진 글리프만 담은 숨김 SVG 스프라이트"""
+        symbols = "".join(self.symbol(glyph) for glyph in sorted(set(glyphs)))
+        return ('<svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" '
+                f'style="position:absolute;width:0;height:0;overflow:hidden">{symbols}</svg>')
+
+
+_icons_lock = threading.Lock()
+_icons: Optional[Tuple[Tuple[int, int], IconSet]] = None
+
+
+def load_icons(path: Path = VENDOR_ICONS) -> IconSet:
+    """벤더 글리프 로드 (파일이 바뀌지 않았으면 파싱 결과 재사용)"""
+    global _icons
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _icons_lock:
+        if _icons is None or _icons[0] != signature:
+            _icons = (signature, IconSet(json.loads(path.read_text(encoding="utf-8"))))
+        return _icons[1]
+
+
+def inline_icons(html: str, icons: Optional[IconSet] = None) -> str:
+    """<i class="fa-*"> 아이콘을 인라인 SVG 로 바꾸고 사용된 글리프의 스프라이트 삽입 (모르는 아이콘은 그대로)"""
+    icons = icons or load_icons()
+    used: Set[str] = set()
+
+    def replace(match: re.Match) -> str:
+        classes = [name for name in match.group(1).split() if name not in STYLE_CLASSES]
+        names = [name for name in classes if name.startswith(ICON_PREFIX)]
+        glyph = icons.resolve(names[0]) if names else None
+        if glyph is None:
+            return match.group(0)
+        used.add(glyph)
+        rest = "".join(f" {name}" for name in classes if name != names[0])
+        return (f'<svg class="icon{rest}" viewBox="{icons.view_box(glyph)}" aria-hidden="true">'
+                f'<use href="#{glyph}"></use></svg>')
+
+    html = ICON_ELEMENT.sub(replace, html)
+    if not used:
+        return html
+    body = BODY_TAG.search(html)
+    position = body.end() if body else 0
+    return html[:position] + icons.sprite(used) + html[position:]
+
+
+def collect_icons(sources: Iterable[Path] = ICON_SOURCES) -> Set[str]:
+    """템플릿/데이터/콘텐츠/JS 에 쓰인 fa-* 아이콘 이름"""
+    names = set()
+    for source in sources:
+        paths = sorted(source.rglob("*")) if source.is_dir() else [source]
+        for path in paths:
+            if path.is_file() and path.suffix in {".html", ".py", ".yaml", ".yml", ".md", ".js"}:
+                names.update(ICON_NAME.findall(path.read_text(encoding="utf-8")))
+    return names - STYLE_CLASSES
+
+
+def main():
+    """메인 함수 (사용 중인 아이콘과 벤더 글리프에 없는 아이콘 출력)"""
+    icons = load_icons()
+    names = sorted(collect_icons())
+    missing: List[str] = [name for name in names if icons.resolve(name) is None]
+    glyphs = {icons.resolve(name) for name in names} - {None}
+    size = len(icons.sprite(glyphs).encode("utf-8"))
+    print(f"🔣 아이콘 {len(names)}개 사용 중 (글리프 {len(glyphs)}개, 스프라이트 {size / 1024:.1f}KB)")
+    for name in names:
+        glyph = icons.resolve(name)
+        print(f"   {name}" + (f" → {glyph}" if glyph and glyph != name else "") + ("" if glyph else " ❌"))
+    if missing:
+        sys.exit(f"❌ 벤더 글리프에 없는 아이콘: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
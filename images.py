@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""프로젝트 이미지 최적화 (반응형 WebP/AVIF 변환본 + 매니페스트) 모듈"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Pillow는 선택 의존성 (없으면 원본 이미지만 사용) - 서버는 매니페스트만 읽으므로 변환할 때만 import
+Image = None
+features = None
+
+# 변환 설정
+SOURCE_SUBDIR = Path("images/projects")
+VARIANT_SUBDIR = Path("images/variants")
+MANIFEST_SUBPATH = Path("images/manifest.json")
+SOURCE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+VARIANT_WIDTHS = (320, 640, 960)
+# 우선순위 순서 (브라우저는 먼저 나온 <source>부터 시도)
+VARIANT_FORMATS = {
+    "avif": {"mime": "image/avif", "save": {"quality": 55, "speed": 8}},
+    "webp": {"mime": "image/webp", "save": {"quality": 80, "method": 4}},
+}
+STATIC_URL_PREFIX = "/static/"
+
+
+def _load_pillow() -> bool:
+    """Pillow를 처음 필요할 때 import (설치되어 있지 않으면 False)"""
+    global Image, features
+    if Image is None:
+        try:
+            from PIL import Image, features
+        except ImportError:
+            return False
+    return True
+
+
+def supported_formats() -> List[str]:
+    """현재 Pillow 빌드에서 인코딩 가능한 변환 포맷"""
+    if not _load_pillow():
+        return []
+    return [fmt for fmt in VARIANT_FORMATS if features.check(fmt)]
+
+
+def variant_widths(original_width: int) -> List[int]:
+    """원본보다 크지 않은 변환 너비 목록 (원본이 더 작으면 원본 너비 하나)"""
+    widths = [width for width in VARIANT_WIDTHS if width < original_width]
+    if original_width <= VARIANT_WIDTHS[-1]:
+        widths.append(original_width)
+    return widths
+
+
+def _is_fresh(target: Path, source: Path) -> bool:
+    """변환본이 원본보다 최신인지 확인"""
+    return target.exists() and target.stat().st_mtime_ns >= source.stat().st_mtime_ns
+
+
+def _decode(image):
+    """이미지를 디코딩하고 인코딩 가능한 RGB/RGBA 모드로 변환"""
+    image.load()
+    if image.mode in ("RGB", "RGBA"):
+        return image
+    has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def optimize_image(source: Path, static_root: Path, output_root: Path, formats: List[str]) -> Dict:
+    """이미지 1개의 변환본을 생성하고 매니페스트 항목 반환"""
+    relative = source.relative_to(static_root / SOURCE_SUBDIR)
+    _load_pillow()
+    with Image.open(source) as image:
+        # 헤더만 읽어 크기 확인, 실제 디코딩은 변환이 필요할 때만 수행
+        original_width, original_height = image.size
+        decoded = None
+
+        sources = []
+        for fmt in formats:
+            srcset = []
+            for width in variant_widths(original_width):
+                target_rel = VARIANT_SUBDIR / relative.parent / f"{relative.stem}-{width}w.{fmt}"
+                target = output_root / target_rel
+                if not _is_fresh(target, source):
+                    if decoded is None:
+                        decoded = _decode(image)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    height = round(original_height * width / original_width)
+                    resized = decoded if width == original_width else decoded.resize((width, height), Image.LANCZOS)
+                    resized.save(target, format=fmt.upper(), **VARIANT_FORMATS[fmt]["save"])
+                srcset.append(f"{STATIC_URL_PREFIX}{target_rel.as_posix()} {width}w")
+            sources.append({"type": VARIANT_FORMATS[fmt]["mime"], "srcset": ", ".join(srcset)})
+
+    return {"width": original_width, "height": original_height, "sources": sources}
+
+
+def build_image_variants(static_root: Path, output_root: Optional[Path] = None) -> Dict[str, Dict]:
+    """static/images/projects 이미지의 반응형 변환본 생성 후 매니페스트 저장/반환"""
+    static_root = Path(static_root)
+    output_root = Path(output_root or static_root)
+    formats = supported_formats()
+    if not formats:
+        return {}
+
+    manifest = {}
+    for source in sorted((static_root / SOURCE_SUBDIR).rglob("*")):
+        if source.suffix.lower() not in SOURCE_SUFFIXES:
+            continue
+        url = STATIC_URL_PREFIX + source.relative_to(static_root).as_posix()
+        manifest[url] = optimize_image(source, static_root, output_root, formats)
+
+    manifest_path = output_root / MANIFEST_SUBPATH
+    manifest_text = json.dumps(manifest, ensure_ascii=False, indent=1)
+    if load_image_manifest(output_root) != manifest:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(manifest_text, encoding="utf-8")
+    return manifest
+
+
+def load_image_manifest(static_root: Path) -> Dict[str, Dict]:
+    """저장된 이미지 매니페스트 로드 (없으면 빈 딕셔너리)"""
+    manifest_path = Path(static_root) / MANIFEST_SUBPATH
+    if not manifest_path.exists():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    """메인 함수 (개발 서버용으로 static/ 안에 변환본 생성)"""
+    if not _load_pillow():
+        print("❌ Pillow가 설치되지 않았습니다. (pip install pillow)")
+        return
+    manifest = build_image_variants(Path("static"))
+    print(f"🖼️  이미지 {len(manifest)}개 변환 완료 ({', '.join(supported_formats())})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""증분 빌드 상태 관리 모듈 (출력 파일별 입력 해시 기록)"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+from compression import ENCODING_SUFFIXES
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def data_digest(value) -> str:
+    """JSON 직렬화 가능한 데이터의 해시"""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BuildState:
+    """출력 파일별 입력 해시를 기록하고 변경된 출력만 다시 만들도록 판단"""
+
+    def __init__(self, output_dir: Path, incremental: bool = False):
+        self.output_dir = Path(output_dir)
+        self.incremental = incremental
+        self.manifest_path = self.output_dir / MANIFEST_NAME
+        previous = self._load_manifest() if incremental else {}
+        self._previous_outputs: Dict[str, Dict[str, str]] = previous.get("outputs", {})
+        self._file_hashes: Dict[str, list] = previous.get("files", {})
+        self._outputs: Dict[str, Dict[str, str]] = {}
+        self.built = 0
+        self.skipped = 0
+        self.removed = 0
+
+    def _load_manifest(self) -> Dict:
+        """이전 빌드 매니페스트 로드 (없거나 버전이 다르면 빈 상태)"""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest
+
+    def file_digest(self, path: Path) -> str:
+        """파일 내용 해시 (mtime/size가 같으면 이전 해시 재사용)"""
+        path = Path(path)
+        stat = path.stat()
+        key = path.as_posix()
+        cached = self._file_hashes.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._file_hashes[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def files_digest(self, paths: Iterable[Path]) -> str:
+        """여러 파일의 내용 해시를 하나로 합친 해시"""
+        return data_digest({Path(path).as_posix(): self.file_digest(path) for path in paths})
+
+    def needs_build(self, output: str, inputs: Dict[str, str]) -> bool:
+        """출력 파일의 입력을 기록하고 다시 만들어야 하는지 반환"""
+        self._outputs[output] = inputs
+        if (
+            self.incremental
+            and self._previous_outputs.get(output) == inputs
+            and (self.output_dir / output).exists()
+        ):
+            self.skipped += 1
+            return False
+        self.built += 1
+        return True
+
+    def record(self, output: str, inputs: Dict[str, str]):
+        """다른 단계에서 이미 생성/확인한 출력 파일을 기록"""
+        self._outputs[output] = inputs
+
+    def recorded(self, output: str) -> bool:
+        """이번 빌드에서 기록된 출력인지 (기록되지 않은 파일은 finalize 에서 삭제)"""
+        return output in self._outputs
+
+    def _expected_files(self) -> Set[str]:
+        """기록된 출력과 그 사전 압축 사본 목록"""
+        expected = {MANIFEST_NAME}
+        for output in self._outputs:
+            expected.add(output)
+            expected.update(output + suffix for suffix in ENCODING_SUFFIXES.values())
+        return expected
+
+    def finalize(self):
+        """기록되지 않은 오래된 출력 삭제 후 매니페스트 저장"""
+        expected = self._expected_files()
+        for path in sorted(self.output_dir.rglob("*"), reverse=True):
+            relative = path.relative_to(self.output_dir).as_posix()
+            if path.is_file() and relative not in expected:
+                path.unlink()
+                self.removed += 1
+            elif path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+
+        live_files = {key: value for key, value in self._file_hashes.items() if Path(key).exists()}
+        manifest = {"version": MANIFEST_VERSION, "outputs": self._outputs, "files": live_files}
+        self.manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+
+    def summary(self) -> str:
+        """빌드/건너뜀/삭제 개수 요약"""
+        return f"생성 {self.built}개, 건너뜀 {self.skipped}개, 삭제 {self.removed}개"
@@ -0,0 +1,225 @@
+"""요청/단계별 계측 모듈 (Server-Timing, Prometheus 메트릭, 샘플링 프로파일러)
+
+환경 변수:
+    PORTFOLIO_METRICS=1        계측 활성화 (Server-Timing 헤더, /metrics - 기본은 꺼짐, span()이 아무 일도 하지 않음)
+    PORTFOLIO_PROFILE=1        샘플링 프로파일러 시작 (collapsed stack 형식으로 덤프)
+    PORTFOLIO_PROFILE_OUTPUT   프로파일 덤프 경로 (기본: .cache/profile.collapsed)
+
+히스토그램은 프로세스 메모리에 있으므로 serve.py 멀티 워커에서는 요청을 받은 워커의 값만 보입니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+METRICS_ENABLED = os.getenv("PORTFOLIO_METRICS") == "1"
+PROFILE_ENABLED = os.getenv("PORTFOLIO_PROFILE") == "1"
+PROFILE_OUTPUT = Path(os.getenv("PORTFOLIO_PROFILE_OUTPUT", ".cache/profile.collapsed"))
+PROFILE_INTERVAL = 0.005  # 샘플링 간격 (초)
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 요청 단위 상태 (ASGI scope, 단계별 소요 시간 목록)
+_current_scope: ContextVar[Optional[dict]] = ContextVar("current_scope", default=None)
+_current_spans: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("current_spans", default=None)
+_DISABLED_SPAN = nullcontext()
+
+
+class Histogram:
+    """라벨별 누적 버킷 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float):
+        """관측값 1개 기록"""
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식 라인 목록"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: (list(series[0]), series[1], series[2]) for labels, series in self._series.items()}
+        for labels, (bucket_counts, total, count) in sorted(snapshot.items()):
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_DURATION = Histogram(
+    "portfolio_request_duration_seconds", "HTTP 요청 처리 시간", ("route", "method", "status"))
+STAGE_DURATION = Histogram(
+    "portfolio_stage_duration_seconds", "요청/빌드 내부 단계별 처리 시간", ("route", "stage"))
+
+
+@contextmanager
+def _timed_span(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        spans = _current_spans.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+        scope = _current_scope.get()
+        STAGE_DURATION.observe((route_label(scope) if scope is not None else "-", name), elapsed)
+
+
+def span(name: str):
+    """단계 소요 시간 측정 컨텍스트 (비활성화 시 비용 없는 no-op)"""
+    if not METRICS_ENABLED:
+        return _DISABLED_SPAN
+    return _timed_span(name)
+
+
+def server_timing_header(spans: List[Tuple[str, float]], total: float) -> str:
+    """Server-Timing 헤더 값 (같은 단계는 합산)"""
+    durations: Dict[str, float] = defaultdict(float)
+    for name, elapsed in spans:
+        durations[name] += elapsed
+    entries = [f"{name};dur={elapsed * 1000:.3f}" for name, elapsed in durations.items()]
+    entries.append(f"app;dur={total * 1000:.3f}")
+    return ", ".join(entries)
+
+
+def route_label(scope) -> str:
+    """메트릭 라벨용 라우트 이름 (경로 템플릿 기준, 카디널리티 제한)"""
+    route = scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+    path = scope.get("path", "")
+    if path.startswith("/static/"):
+        return "/static"
+    return "unmatched"
+
+
+class InstrumentationMiddleware:
+    """요청 처리 시간/단계 측정 후 Server-Timing 헤더와 히스토그램에 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        spans: List[Tuple[str, float]] = []
+        spans_token = _current_spans.set(spans)
+        scope_token = _current_scope.set(scope)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = server_timing_header(spans, time.perf_counter() - start)
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUEST_DURATION.observe((route_label(scope), scope["method"], str(status)), time.perf_counter() - start)
+            _current_spans.reset(spans_token)
+            _current_scope.reset(scope_token)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 노출 형식 전체"""
+    lines = REQUEST_DURATION.render() + STAGE_DURATION.render()
+    return "\n".join(lines) + "\n"
+
+
+class SamplingProfiler:
+    """주기적으로 모든 스레드의 스택을 샘플링해 collapsed stack(flamegraph 입력)으로 집계"""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                    frame = frame.f_back
+                with self._lock:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "SamplingProfiler":
+        """샘플링 시작"""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """샘플링 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def collapsed(self) -> str:
+        """collapsed stack 텍스트 ('frame;frame;frame count' 형식)"""
+        # 샘플링 스레드가 계속 갱신하므로 잠금 안에서 복사한 뒤 정렬
+        with self._lock:
+            samples = Counter(self.samples)
+        return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+    def dump(self, path: Path = PROFILE_OUTPUT) -> Path:
+        """collapsed stack 파일 저장"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed(), encoding="utf-8")
+        return path
+
+
+profiler = SamplingProfiler()
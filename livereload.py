@@ -0,0 +1,72 @@
+"""개발 서버 라이브 리로드 (Server-Sent Events) 모듈"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Set
+
+LIVERELOAD_PATH = "/__livereload"
+KEEPALIVE_SECONDS = 15
+
+# 변경 이벤트를 받으면 페이지를 다시 불러오는 클라이언트 스크립트
+LIVERELOAD_SCRIPT = f"""<script>
+(() => {{
+    const source = new EventSource("{LIVERELOAD_PATH}");
+    source.addEventListener("reload", (event) => {{
+        const changed = JSON.parse(event.data);
+        if (changed.css_only) {{
+            document.querySelectorAll('link[rel="stylesheet"]').forEach(link => {{
+                const url = new URL(link.href);
+                url.searchParams.set("_lr", Date.now());
+                link.href = url.toString();
+            }});
+        }} else {{
+            location.reload();
+        }}
+    }});
+}})();
+</script>"""
+
+
+def inject_livereload(html: str) -> str:
+    """HTML의 </body> 직전에 라이브 리로드 스크립트 삽입"""
+    marker = html.rfind("</body>")
+    if marker == -1:
+        return html + LIVERELOAD_SCRIPT
+    return html[:marker] + LIVERELOAD_SCRIPT + html[marker:]
+
+
+class LiveReloadHub:
+    """연결된 브라우저들에 리로드 이벤트를 전달하는 허브 (감시 스레드에서 호출 가능)"""
+
+    def __init__(self):
+        self._clients: Set[asyncio.Queue] = set()
+        self._loop = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        """이벤트를 전달할 서버 이벤트 루프 지정"""
+        self._loop = loop
+
+    def publish(self, paths):
+        """변경된 파일 목록으로 리로드 이벤트 발행 (스레드 안전)"""
+        if self._loop is None or not self._clients:
+            return
+        paths = sorted(str(path) for path in paths)
+        payload = {"paths": paths, "css_only": all(path.endswith(".css") for path in paths)}
+        for queue in list(self._clients):
+            self._loop.call_soon_threadsafe(queue.put_nowait, payload)
+
+    async def stream(self) -> AsyncIterator[str]:
+        """클라이언트 1개에 대한 SSE 스트림"""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._clients.add(queue)
+        try:
+            yield "retry: 500\n\n"
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: reload\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            self._clients.discard(queue)
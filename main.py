@@ -1,35 +1,521 @@
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.templating import Jinja2Templates
+import asyncio
+import mimetypes
+import os
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-import uvicorn
-from data.portfolio_data import get_portfolio_data, get_project_by_id
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+
+from compression import ENCODING_SUFFIXES, is_compressible, negotiate_encoding
+from concurrency import SingleFlight, run_in_pool
+from data.content_cache import content_cache
+from data.portfolio_data import (
+    get_portfolio_data,
+    get_project_by_id,
+    get_project_by_id_async,
+    get_project_page,
+    get_project_registry,
+    get_search_index,
+    invalidate_content,
+    invalidate_search_index,
+    search_projects,
+)
+from data.project_registry import normalize_term
+from fingerprint import IMMUTABLE_CACHE_CONTROL, AssetFingerprints
+from fonts import build_fonts
+from icons import inline_icons
+from images import load_image_manifest
+from instrumentation import (
+    METRICS_ENABLED,
+    PROFILE_ENABLED,
+    InstrumentationMiddleware,
+    profiler,
+    render_metrics,
+    span,
+)
+from livereload import LIVERELOAD_PATH, LiveReloadHub, inject_livereload
+from minify import minify_html
+from page_cache import CachedPage, PageCache, WarmupStatus, build_page, etag_matches
+from styles import build_stylesheet
+from templating import create_environment
+from watcher import DEFAULT_WATCH_PATHS, FileWatcher
+
+# 개발 모드 (run_dev.py / quick_start.py 에서 PORTFOLIO_DEV=1 로 실행)
+DEV_MODE = os.getenv("PORTFOLIO_DEV") == "1"
+
+# 템플릿별로 다시 렌더링해야 하는 페이지 캐시 키 (접두사)
+TEMPLATE_PAGE_KEYS = {
+    "index.html": "/?",
+    "project.html": "/project/",
+    "404.html": "404",
+}
+
+# 정적 자산 내용 해시 (페이지의 /static/ URL 을 지문 URL 로 바꾸고, 지문 요청을 원본 파일로 매핑)
+asset_fingerprints = AssetFingerprints(Path("static"))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """.br/.gz 사전 압축본이 있으면 Accept-Encoding에 맞춰 제공하는 정적 파일 핸들러
+
+    지문 경로(site.<해시>.css)는 해시가 현재 원본과 같을 때만 원본 파일을 1년 immutable 캐시로 제공합니다.
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        original = asset_fingerprints.resolve(path)
+        response = await self._get_response(original or path, scope)
+        if original is not None and response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    async def _get_response(self, path: str, scope) -> Response:
+        if not is_compressible(Path(path)):
+            return await super().get_response(path, scope)
+
+        request_headers = Headers(scope=scope)
+        available = {}
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            full_path, stat_result = self.lookup_path(path + suffix)
+            if stat_result is not None:
+                available[encoding] = (full_path, stat_result)
+
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"), available)
+        if encoding is None:
+            response = await super().get_response(path, scope)
+            response.headers.setdefault("vary", "Accept-Encoding")
+            return response
+
+        full_path, stat_result = available[encoding]
+        media_type = mimetypes.guess_type(path)[0] or "text/plain"
+        response = FileResponse(
+            full_path,
+            stat_result=stat_result,
+            media_type=media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+livereload_hub = LiveReloadHub()
+
+# 캐시 예열 상태 (/ready) - 예열이 끝나야 ready (serve.py 는 fork 전에 예열)
+warmup = WarmupStatus()
+
+
+def page_keys_for_changes(changed: Set[Path]) -> Optional[Set[str]]:
+    """변경된 파일에 영향받는 페이지 캐시 키 접두사 (None이면 전체)"""
+    keys = set()
+    for path in changed:
+        top = path.parts[0] if path.parts else ""
+        if top == "content" and path.suffix == ".md":
+            content_cache.invalidate(path)
+            keys.add(f"/project/{path.stem}")
+        elif top == "templates":
+            if path.name not in TEMPLATE_PAGE_KEYS:
+                return None
+            keys.add(TEMPLATE_PAGE_KEYS[path.name])
+        elif top == "static":
+            if path.name == "manifest.json":
+                keys.add("/?")
+        else:
+            return None
+    return keys
+
+
+def build_static_assets():
+    """개발 서버용 static/css/site.css 와 static/fonts 생성"""
+    build_stylesheet(Path("static"))
+    build_fonts(Path("static"))
+    # 직접 생성한 파일 때문에 (예열 중인) 페이지 캐시가 무효화되지 않도록 감시 기준 갱신
+    page_cache.rebase()
+
+
+def stylesheet_inputs_changed(changed: Set[Path]) -> bool:
+    """스타일시트/폰트 입력이 바뀌었을 수 있는지 (템플릿/콘텐츠/정적 JS/벤더 CSS·폰트)"""
+    return any(
+        path.parts[:1] in (("templates",), ("content",), ("vendor",))
+        or path.parts[:2] == ("static", "js")
+        for path in changed
+    )
+
 
-app = FastAPI(title="Portfolio", description="SeungHo Choi's Data Engineer Portfolio")
+def handle_file_changes(changed: Set[Path]):
+    """변경된 파일에 해당하는 페이지만 무효화하고 브라우저에 리로드 알림"""
+    keys = page_keys_for_changes(changed)
+    if keys is None:
+        # content/*.yaml 등 공통 입력이 바뀌면 콘텐츠 저장소부터 다시 로드
+        invalidate_content()
+        page_cache.invalidate()
+    else:
+        if any(key.startswith("/project/") for key in keys):
+            invalidate_search_index()
+        for key in keys:
+            page_cache.invalidate_prefix(key)
+    if stylesheet_inputs_changed(changed):
+        build_static_assets()
+    livereload_hub.publish(changed)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """개발 모드면 파일 감시자와 라이브 리로드 시작, PORTFOLIO_PROFILE=1 이면 샘플링 프로파일러 시작"""
+    watcher = None
+    # 첫 요청이 인덱스 구성/렌더링 비용을 떠안지 않도록 백그라운드 예열 (serve.py 워커는 이미 예열된 상태로 fork됨)
+    warmup_task = None
+    if not warmup.ready:
+        # 페이지가 참조하는 스타일시트/폰트는 요청을 받기 전에 생성
+        await run_in_pool(build_static_assets)
+        warmup_task = asyncio.create_task(warm_up())
+    if PROFILE_ENABLED:
+        profiler.start()
+        print("🔬 샘플링 프로파일러 시작 - 종료 시 collapsed stack 저장")
+    if DEV_MODE:
+        livereload_hub.bind(asyncio.get_running_loop())
+        # 감시자가 필요한 페이지만 무효화하므로 주기적 전체 확인은 하지 않음
+        watcher = FileWatcher(DEFAULT_WATCH_PATHS, handle_file_changes).start()
+        print(f"👀 파일 감시 시작 ({watcher.backend}) - 변경 시 브라우저 자동 새로고침")
+    else:
+        page_cache.start_watching()
+    yield
+    page_cache.stop_watching()
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    if watcher is not None:
+        watcher.stop()
+    if profiler.running:
+        profiler.stop()
+        print(f"🔬 프로파일 저장: {profiler.dump()}")
+
+
+app = FastAPI(
+    title="Portfolio",
+    description="SeungHo Choi's Data Engineer Portfolio",
+    lifespan=lifespan,
+)
+app.add_middleware(InstrumentationMiddleware)
 
 # 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
+# 개발 모드는 템플릿 변경 시 자동 리로드, 아니면 사전 컴파일된 템플릿 사용
+templates = create_environment(dev=DEV_MODE)
+
+# 렌더링된 페이지 캐시 (데이터/콘텐츠/템플릿 변경 시 무효화)
+# (운영 모드 페이지는 정적 자산 지문을 담으므로 static 전체가 소스)
+page_cache = PageCache(
+    sources=[
+        Path("data"),
+        Path("content"),
+        Path("templates"),
+        Path("vendor"),
+        Path("static"),
+    ]
+)
+# 같은 페이지의 동시 캐시 미스는 한 번만 렌더링
+page_flight = SingleFlight()
+
+
+def render_page(template_name: str, status_code: int = 200, **context):
+    """템플릿을 HTML 문자열로 렌더링 (아이콘은 인라인 SVG, 운영 모드면 자산 지문 URL + 최소화,
+    개발 모드면 라이브 리로드 스크립트 삽입)"""
+    with span("template"):
+        html = inline_icons(templates.get_template(template_name).render(**context))
+    if DEV_MODE:
+        html = inject_livereload(html)
+    else:
+        html = minify_html(asset_fingerprints.rewrite(html))
+    return html, status_code
+
+
+def page_response(request: Request, page: CachedPage) -> Response:
+    """캐시된 페이지 응답 (사전 압축본 선택, If-None-Match 일치 시 304)"""
+    encoding, body, etag = page.select(request.headers.get("accept-encoding"))
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    if page.status_code == 200 and etag_matches(
+        request.headers.get("if-none-match"), etag
+    ):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, status_code=page.status_code, headers=headers)
+
+
+async def not_found_response(request: Request) -> Response:
+    """캐시된 404 페이지 응답"""
+    return page_response(request, await not_found_page_async())
+
+
+def home_key(page: int, filters: dict) -> str:
+    """메인 페이지 캐시 키 (페이지 번호 + 정렬된 필터)"""
+    return "/?" + "&".join(
+        f"{name}={value}" for name, value in sorted({**filters, "page": page}.items())
+    )
+
+
+def render_home(page: int, filters: dict):
+    return render_page(
+        "index.html",
+        image_manifest=load_image_manifest(Path("static")),
+        **get_portfolio_data(page=page, **filters),
+    )
+
+
+def render_not_found():
+    return render_page("404.html", status_code=404)
+
+
+def not_found_page() -> CachedPage:
+    """404 페이지"""
+    return page_cache.get_or_render("404", render_not_found)
+
+
+def cacheable_filters(filters: dict) -> bool:
+    """캐시 키로 쓸 수 있는 필터인지 (인덱스에 있는 값만 - 임의 쿼리로 예열된 페이지가 밀려나지 않도록)"""
+    return get_project_registry().has_filters(**filters)
+
+
+def home_page(page: int = 1, filters: Optional[dict] = None) -> CachedPage:
+    """메인 페이지 (페이지 번호 + 필터 단위로 캐시, 인덱스에 없는 필터 값은 캐시/사전 압축 없이 렌더링)"""
+    filters = filters or {}
+    if not cacheable_filters(filters):
+        return build_page(*render_home(page, filters), compress=False)
+    return page_cache.get_or_render(
+        home_key(page, filters), lambda: render_home(page, filters)
+    )
+
+
+def project_page(project_id: str) -> CachedPage:
+    """프로젝트 상세 페이지 (마크다운 렌더링 결과 포함)"""
+    return page_cache.get_or_render(
+        f"/project/{project_id}",
+        lambda: render_page("project.html", project=get_project_by_id(project_id)),
+    )
+
+
+async def cached_page_async(
+    key: str, render: Callable[[], Awaitable[CachedPage]]
+) -> CachedPage:
+    """캐시된 페이지 반환, 미스면 render() 실행 (같은 키의 동시 미스는 한 번만 렌더링)"""
+    page = page_cache.get(key)
+    if page is None:
+        page = await page_flight.do(key, render)
+    return page
+
+
+async def not_found_page_async() -> CachedPage:
+    """404 페이지 (렌더 풀에서 렌더링)"""
+    return await cached_page_async(
+        "404", lambda: run_in_pool(lambda: page_cache.store("404", *render_not_found()))
+    )
+
+
+async def home_page_async(page: int = 1, filters: Optional[dict] = None) -> CachedPage:
+    """메인 페이지 (렌더 풀에서 렌더링, 인덱스에 없는 필터 값은 캐시/사전 압축 없이 렌더링)"""
+    filters = filters or {}
+    if not cacheable_filters(filters):
+        return await run_in_pool(
+            lambda: build_page(*render_home(page, filters), compress=False)
+        )
+    key = home_key(page, filters)
+    return await cached_page_async(
+        key,
+        lambda: run_in_pool(lambda: page_cache.store(key, *render_home(page, filters))),
+    )
+
+
+async def project_page_async(project_id: str) -> CachedPage:
+    """프로젝트 상세 페이지 (캐시 미스 시 이벤트 루프를 막지 않고 렌더링)"""
+    key = f"/project/{project_id}"
+    return await cached_page_async(key, lambda: render_project_page(project_id, key))
+
+
+async def render_project_page(project_id: str, key: str) -> CachedPage:
+    """마크다운은 비동기로 읽어 변환하고 템플릿 렌더링/압축은 렌더 풀에서 수행"""
+    project = await get_project_by_id_async(project_id)
+    return await run_in_pool(
+        lambda: page_cache.store(key, *render_page("project.html", project=project))
+    )
+
+
+def warmup_targets() -> (
+    List[Tuple[str, Callable[[], CachedPage], Callable[[], Awaitable[CachedPage]]]]
+):
+    """예열 대상 (이름, 동기 렌더링, 비동기 렌더링) - 필터 없는 목록 페이지, 전체 프로젝트 상세, 404"""
+    targets = [
+        (home_key(page, {}), partial(home_page, page), partial(home_page_async, page))
+        for page in range(1, get_project_page().pages + 1)
+    ]
+    targets.extend(
+        (
+            f"/project/{project['id']}",
+            partial(project_page, project["id"]),
+            partial(project_page_async, project["id"]),
+        )
+        for project in get_project_registry().all()
+    )
+    targets.append(("404", not_found_page, not_found_page_async))
+    return targets
+
+
+def warm_caches() -> dict:
+    """스타일시트/폰트, 검색 인덱스, 예열 대상 페이지를 동기로 준비 (serve.py 가 fork 전에 사용 - 스레드 풀을 만들지 않음)"""
+    build_static_assets()
+    get_search_index()
+    targets = warmup_targets()
+    warmup.start(len(targets))
+    for name, render, _ in targets:
+        try:
+            render()
+        except Exception as e:
+            warmup.advance(name, e)
+        else:
+            warmup.advance(name)
+    warmup.finish()
+    return warmup.report()
+
+
+async def warm_up() -> dict:
+    """서버 시작 후 백그라운드 예열 (요청 처리와 같은 single-flight 를 거치므로 동시 요청과 중복 렌더링 없음)"""
+    await run_in_pool(get_search_index)
+    targets = warmup_targets()
+    warmup.start(len(targets))
+
+    async def warm(name: str, render: Callable[[], Awaitable[CachedPage]]):
+        try:
+            await render()
+        except Exception as e:
+            warmup.advance(name, e)
+        else:
+            warmup.advance(name)
+
+    await asyncio.gather(*(warm(name, render) for name, _, render in targets))
+    warmup.finish()
+    print(
+        f"🔥 캐시 예열 완료: 페이지 {warmup.done}개 ({warmup.elapsed_ms}ms, 실패 {len(warmup.failed)}개)"
+    )
+    return warmup.report()
+
+
+def project_filters(
+    tech: Optional[str], year: Optional[int], highlight: Optional[str]
+) -> dict:
+    """빈 값은 제외하고 정규화한 프로젝트 필터 (페이지 캐시 키에도 사용)"""
+    filters = {
+        "tech": normalize_term(tech or ""),
+        "year": year,
+        "keyword": normalize_term(highlight or ""),
+    }
+    return {name: value for name, value in filters.items() if value}
+
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    """메인 포트폴리오 페이지"""
-    data = get_portfolio_data()
-    return templates.TemplateResponse("index.html", {"request": request, **data})
+async def home(
+    request: Request,
+    page: int = Query(1, ge=1),
+    tech: Optional[str] = None,
+    year: Optional[int] = None,
+    highlight: Optional[str] = Query(None, max_length=100),
+):
+    """메인 포트폴리오 페이지 (프로젝트 목록은 페이지/필터 단위로 렌더링)"""
+    filters = project_filters(tech, year, highlight)
+    if page > 1 and page > get_project_page(page=page, **filters).pages:
+        return await not_found_response(request)
+
+    return page_response(request, await home_page_async(page, filters))
+
+
+@app.get("/api/projects")
+async def list_projects(
+    page: int = Query(1, ge=1),
+    per_page: int = Query(12, ge=1, le=100),
+    tech: Optional[str] = None,
+    year: Optional[int] = None,
+    highlight: Optional[str] = Query(None, max_length=100),
+):
+    """프로젝트 요약 목록 API (페이지네이션 + 기술/연도/하이라이트 필터)"""
+    project_page = get_project_page(
+        page=page, per_page=per_page, **project_filters(tech, year, highlight)
+    )
+    return {**project_page.meta(), "items": project_page.items}
+
 
 @app.get("/project/{project_id}", response_class=HTMLResponse)
 async def project_detail(request: Request, project_id: str):
     """프로젝트 상세 페이지"""
-    project = get_project_by_id(project_id)
-    if not project:
-        return templates.TemplateResponse("404.html", {"request": request}, status_code=404)
-    
-    return templates.TemplateResponse("project.html", {"request": request, "project": project})
+    if get_project_registry().get(project_id) is None:
+        return await not_found_response(request)
+
+    return page_response(request, await project_page_async(project_id))
+
+
+@app.get("/search")
+async def search(
+    q: str = Query("", max_length=200), limit: int = Query(10, ge=1, le=50)
+):
+    """프로젝트 전문 검색 API (BM25 관련도 순)"""
+    results = search_projects(q, limit) if q.strip() else []
+    for result in results:
+        result["url"] = f"/project/{result['id']}"
+    return {"query": q, "results": results}
+
+
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    """준비 상태 및 캐시 예열 진행 상황 (예열이 끝나기 전에는 503)"""
+    return JSONResponse(warmup.report(), status_code=200 if warmup.ready else 503)
+
+
+if METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 메트릭 (라우트별/단계별 처리 시간 히스토그램)"""
+        return PlainTextResponse(
+            render_metrics(), media_type="text/plain; version=0.0.4"
+        )
+
+
+if PROFILE_ENABLED:
+
+    @app.get("/debug/profile", include_in_schema=False)
+    async def profile_snapshot():
+        """현재까지 수집된 샘플링 프로파일 (collapsed stack, flamegraph.pl 입력)"""
+        return PlainTextResponse(profiler.collapsed())
+
+
+if DEV_MODE:
+
+    @app.get(LIVERELOAD_PATH)
+    async def livereload_events():
+        """라이브 리로드 이벤트 스트림 (SSE)"""
+        return StreamingResponse(
+            livereload_hub.stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
 
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
     """404 에러 핸들러"""
-    return templates.TemplateResponse("404.html", {"request": request}, status_code=404)
+    return await not_found_response(request)
+
 
 if __name__ == "__main__":
+    import uvicorn
+
+    os.environ["PORTFOLIO_DEV"] = "1"
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
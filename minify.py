@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""HTML 최소화 모듈 (정적 빌드/서버 공용, 표준 라이브러리만 사용)
+
+렌더링 결과가 바뀌지 않는 범위에서만 줄입니다.
+- 주석 제거 (조건부 주석 <!--[if ...]> 은 유지)
+- 공백 연속은 공백 하나로, 화면에 그려지지 않는 문서 구조 태그(<head>, <meta>, <script> 등) 앞뒤의 공백만 제거
+  (div/li/a 등은 CSS 로 inline-block/inline-flex 가 될 수 있어 요소 사이 공백 하나를 유지)
+- <pre>/<textarea>/<script> 내용은 그대로, <style> 은 주석과 선언 사이 공백만 정리
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# 공백을 그대로 둬야 하는 요소와 주석
+PRESERVED = re.compile(r"<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->", re.S | re.I)
+STYLE_ELEMENT = re.compile(r"(<style\b[^>]*>)(.*?)(</style\s*>)", re.S | re.I)
+# 화면에 그려지지 않아 앞뒤 공백이 렌더링에 영향을 주지 않는 문서 구조 요소
+STRUCTURE_TAGS = "html|head|body|title|meta|link|base|script|style|template|!doctype"
+STRUCTURE_TAG = re.compile(rf"\s*(</?(?:{STRUCTURE_TAGS})\b[^>]*>)\s*", re.I)
+WHITESPACE = re.compile(r"\s+")
+BLOCK_MARKER, INLINE_MARKER = "\x00", "\x01"
+BLOCK_PLACEHOLDER = re.compile(r"\s*(\x00\d+\x00)\s*")
+PLACEHOLDER = re.compile(r"[\x00\x01](\d+)[\x00\x01]")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+# 빈 커스텀 속성 값(--tw-pan-x: ;)이 깨지지 않도록 ';' 앞과 값이 비어 있는 ':' 뒤 공백은 유지
+CSS_SPACING = re.compile(r"\s*([{}])\s*|([;:])\s+(?![;}])")
+
+
+def minify_css(css: str) -> str:
+    """<style> 내용 정리 (주석 제거, 공백 축약)"""
+    css = WHITESPACE.sub(" ", CSS_COMMENT.sub("", css)).strip()
+    return CSS_SPACING.sub(lambda match: match.group(1) or match.group(2), css)
+
+
+def minify_html(html: str) -> str:
+    """HTML 최소화 (같은 입력이면 항상 같은 결과)"""
+    preserved = []
+
+    def hold(match: re.Match) -> str:
+        block = match.group(0)
+        if block.startswith("<!--") and not block.startswith("<!--[if"):
+            return ""
+        tag = (match.group(1) or "").lower()
+        if tag == "style":
+            style = STYLE_ELEMENT.match(block)
+            block = style.group(1) + minify_css(style.group(2)) + style.group(3)
+        preserved.append(block)
+        # 그려지지 않는 요소(script/style)는 앞뒤 공백을 지울 수 있는 자리표시자 사용
+        marker = BLOCK_MARKER if tag in ("script", "style") else INLINE_MARKER
+        return f"{marker}{len(preserved) - 1}{marker}"
+
+    html = WHITESPACE.sub(" ", PRESERVED.sub(hold, html))
+    html = STRUCTURE_TAG.sub(r"\1", html)
+    html = BLOCK_PLACEHOLDER.sub(r"\1", html).strip()
+    return PLACEHOLDER.sub(lambda match: preserved[int(match.group(1))], html)
+
+
+def main():
+    """메인 함수 (HTML 파일 최소화 결과 크기 비교)"""
+    for name in sys.argv[1:]:
+        path = Path(name)
+        original = path.read_text(encoding="utf-8")
+        minified = minify_html(original)
+        print(f"🗜️  {path}: {len(original.encode('utf-8')) / 1024:.1f}KB → {len(minified.encode('utf-8')) / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
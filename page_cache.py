@@ -0,0 +1,216 @@
+"""렌더링된 페이지(HTML 바이트) 캐시 모듈"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from compression import compress_variants, negotiate_encoding
+
+# 캐시 기본 설정
+DEFAULT_MAX_PAGES = 512
+DEFAULT_CHECK_INTERVAL = 1.0  # 소스 변경 확인 간격 (초)
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """캐시된 페이지 (본문 바이트, 강한 ETag, 상태 코드, 사전 압축본)"""
+    body: bytes
+    etag: str
+    status_code: int = 200
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[Optional[str], bytes, str]:
+        """Accept-Encoding에 맞는 (인코딩, 본문, ETag) 선택"""
+        encoding = negotiate_encoding(accept_encoding, self.encoded)
+        if encoding is None:
+            return None, self.body, self.etag
+        return encoding, self.encoded[encoding], f'{self.etag[:-1]}-{encoding}"'
+
+
+def make_etag(body: bytes) -> str:
+    """본문 해시 기반 강한 ETag 생성"""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def build_page(html: str, status_code: int = 200, compress: bool = True) -> CachedPage:
+    """렌더링된 HTML → CachedPage (compress=False 면 사전 압축본 없이)"""
+    body = html.encode("utf-8")
+    return CachedPage(body=body, etag=make_etag(body), status_code=status_code,
+                      encoded=compress_variants(body) if compress else {})
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class PageCache:
+    """라우트별 렌더링 결과를 보관하고 소스 파일 변경 시 전체 무효화하는 캐시"""
+
+    def __init__(self, sources: Iterable[Path], max_pages: int = DEFAULT_MAX_PAGES,
+                 check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.sources = [Path(source) for source in sources]
+        self.max_pages = max_pages
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self._pages: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint = self._source_fingerprint()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    def _source_files(self) -> List[Path]:
+        """감시 대상 파일 목록 (디렉토리는 하위 파일 전체)"""
+        files = []
+        for source in self.sources:
+            if source.is_dir():
+                files.extend(path for path in source.rglob("*") if path.is_file())
+            elif source.is_file():
+                files.append(source)
+        return sorted(files)
+
+    def _source_fingerprint(self) -> Tuple:
+        """감시 대상 파일들의 (경로, mtime, size) 요약"""
+        fingerprint = []
+        for path in self._source_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
+
+    def _check_sources(self):
+        """소스 변경 여부를 확인하고 변경 시 무효화"""
+        fingerprint = self._source_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self.invalidate()
+
+    def _watch(self):
+        """check_interval 마다 소스 변경 확인 (요청 처리 경로 밖의 데몬 스레드)"""
+        while not self._stop.wait(self.check_interval):
+            self._check_sources()
+
+    def start_watching(self):
+        """백그라운드 소스 변경 확인 시작 (스레드는 fork 되지 않으므로 워커마다 호출)"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="page-cache-watch", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self):
+        """백그라운드 소스 변경 확인 중지"""
+        self._stop.set()
+
+    def rebase(self):
+        """현재 소스 상태를 기준으로 삼음 (앱이 직접 생성한 파일 때문에 무효화되지 않도록)"""
+        self._fingerprint = self._source_fingerprint()
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        """캐시된 페이지 반환 (없으면 None)"""
+        with self._lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return page
+            self.misses += 1
+            return None
+
+    def store(self, key: str, html: str, status_code: int = 200) -> CachedPage:
+        """렌더링된 HTML을 압축본과 함께 캐시에 저장"""
+        # 압축은 캐시 채울 때 한 번만 수행 (요청마다 압축하지 않음)
+        page = build_page(html, status_code)
+
+        with self._lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+
+    def get_or_render(self, key: str, render: Callable[[], Tuple[str, int]]) -> CachedPage:
+        """캐시된 페이지 반환, 없으면 render() 결과 (html, status_code)를 캐시"""
+        page = self.get(key)
+        if page is None:
+            page = self.store(key, *render())
+        return page
+
+    def invalidate(self, key: Optional[str] = None):
+        """특정 라우트 또는 전체 페이지 무효화"""
+        with self._lock:
+            if key is None:
+                self._pages.clear()
+            else:
+                self._pages.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str):
+        """접두사가 일치하는 라우트 페이지 무효화 (예: /project/)"""
+        with self._lock:
+            for key in [key for key in self._pages if key.startswith(prefix)]:
+                del self._pages[key]
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계 반환"""
+        with self._lock:
+            return {
+                "pages": len(self._pages),
+                "max_pages": self.max_pages,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class WarmupStatus:
+    """캐시 예열 진행 상황 (pending → warming → done, /ready 응답에 사용)"""
+
+    def __init__(self):
+        self.state = "pending"
+        self.total = 0
+        self.done = 0
+        self.failed: List[str] = []
+        self.elapsed_ms: Optional[float] = None
+        self._started = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "done"
+
+    def start(self, total: int):
+        """예열 시작 (다시 예열하면 진행 상황 초기화)"""
+        self.state = "warming"
+        self.total, self.done, self.failed, self.elapsed_ms = total, 0, [], None
+        self._started = time.perf_counter()
+
+    def advance(self, name: str, error: Optional[BaseException] = None):
+        """페이지 1개 예열 완료 (실패한 페이지는 첫 요청 때 다시 렌더링)"""
+        self.done += 1
+        if error is not None:
+            self.failed.append(name)
+            print(f"⚠️  예열 실패 {name}: {error}")
+
+    def finish(self):
+        self.state = "done"
+        self.elapsed_ms = round((time.perf_counter() - self._started) * 1000, 1)
+
+    def report(self) -> Dict:
+        """진행 상황 요약"""
+        return {
+            "ready": self.ready,
+            "state": self.state,
+            "total": self.total,
+            "done": self.done,
+            "failed": list(self.failed),
+            "elapsed_ms": self.elapsed_ms,
+        }
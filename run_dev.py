@@ -1,54 +1,19 @@
 #!/usr/bin/env python3
 """개발 서버 실행 스크립트"""
 
+import os
+import shutil
 import subprocess
 import sys
-from pathlib import Path
+from bootstrap import ensure_dependencies
 
 def check_uv_available() -> bool:
-    """UV 사용 가능 여부 확인"""
-    try:
-        result = subprocess.run(["uv", "--version"], capture_output=True, check=True)
-        print(f"✅ UV 사용 가능: {result.stdout.decode().strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("⚠️  UV를 찾을 수 없습니다. pip를 사용합니다.")
-        return False
-
-def install_with_uv() -> bool:
-    """UV로 의존성 설치 (간단한 방법)"""
-    print("📦 UV로 의존성 설치 중...")
-    try:
-        # 직접 패키지 설치 (빌드 문제 우회)
-        packages = [
-            "fastapi>=0.104.1",
-            "jinja2>=3.1.2", 
-            "uvicorn[standard]>=0.24.0",
-            "python-multipart>=0.0.6",
-            "markdown>=3.5.1",
-            "pyyaml>=6.0.1",
-            "python-frontmatter>=1.0.0"
-        ]
-        
-        for package in packages:
-            subprocess.run(["uv", "add", package], check=True, capture_output=True)
-        
-        print("✅ UV 의존성 설치 완료!")
+    """UV 사용 가능 여부 확인 (프로세스 실행 없이 PATH 조회)"""
+    if shutil.which("uv"):
+        print("✅ UV 사용 가능")
         return True
-    except subprocess.CalledProcessError:
-        print("❌ UV 설치 실패")
-        return False
-
-def install_with_pip() -> bool:
-    """pip로 의존성 설치"""
-    print("📦 pip로 의존성 설치 중...")
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
-        print("✅ pip 의존성 설치 완료!")
-        return True
-    except subprocess.CalledProcessError:
-        print("❌ pip 설치 실패")
-        return False
+    print("⚠️  UV를 찾을 수 없습니다. pip를 사용합니다.")
+    return False
 
 def run_server(use_uv: bool):
     """개발 서버 실행"""
@@ -64,8 +29,11 @@ def run_server(use_uv: bool):
     
     cmd.extend(["main:app", "--host", "0.0.0.0", "--port", "8000", "--reload"])
     
+    # 개발 모드: 마크다운/템플릿 변경 시 해당 페이지만 갱신하고 브라우저 자동 새로고침
+    env = {**os.environ, "PORTFOLIO_DEV": "1"}
+    
     try:
-        subprocess.run(cmd)
+        subprocess.run(cmd, env=env)
     except KeyboardInterrupt:
         print("\n👋 서버를 종료합니다.")
     except Exception as e:
@@ -78,20 +46,10 @@ def main():
     
     use_uv = check_uv_available()
     
-    # 의존성 설치
-    success = False
-    if use_uv:
-        success = install_with_uv()
-        if not success:
-            print("🔄 pip로 대체합니다...")
-            success = install_with_pip()
-            use_uv = False
-    else:
-        success = install_with_pip()
-    
-    if not success:
+    # UV는 `uv run` 이 pyproject.toml/uv.lock 기준으로 필요한 경우에만 동기화하므로 별도 설치 불필요
+    if not use_uv and not ensure_dependencies():
         print("❌ 의존성 설치에 실패했습니다.")
-        print("💡 start.py를 사용해보세요: python start.py")
+        print("💡 quick_start.py를 사용해보세요: python quick_start.py")
         sys.exit(1)
     
     run_server(use_uv)
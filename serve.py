@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""운영용 멀티 워커 서버 (pre-fork + 사전 예열된 읽기 전용 데이터 공유)
+
+마스터 프로세스가 포트폴리오 데이터, 렌더링된 마크다운/페이지, 사전 컴파일 템플릿, 검색 인덱스를
+미리 만든 뒤 gc.freeze() 하고 워커를 fork 하므로 워커들은 이 데이터를 copy-on-write 로 공유합니다.
+
+사용법:
+    python serve.py                         # CPU 수만큼 워커, 0.0.0.0:8000
+    python serve.py --workers 4 --port 8080 --backlog 4096 --keep-alive 15
+
+시그널:
+    SIGHUP          콘텐츠/템플릿을 다시 읽고 워커를 하나씩 교체 (무중단 재시작)
+    SIGTERM/SIGINT  워커에 SIGTERM 전달 후 처리 중인 요청이 끝나면 종료
+"""
+
+import argparse
+import gc
+import os
+import select
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional
+
+# 운영 프로필에서는 개발 모드(자동 리로드, 라이브 리로드)를 쓰지 않음
+os.environ.pop("PORTFOLIO_DEV", None)
+
+DEFAULT_BACKLOG = 2048
+DEFAULT_KEEP_ALIVE = 5  # 초
+DEFAULT_GRACEFUL_TIMEOUT = 30  # 초
+WORKER_READY_TIMEOUT = 30  # 교체 워커 준비 대기 시간 (초)
+RESPAWN_DELAY = 1.0  # 워커가 연달아 죽을 때 재시작 간격 (초)
+
+
+def default_workers() -> int:
+    """사용 가능한 CPU 수 (컨테이너/affinity 제한 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def create_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """워커들이 공유할 리스닝 소켓 생성"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    # 실제 대기열 길이는 net.core.somaxconn 으로 제한됨
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload():
+    """fork 전에 앱 import + 캐시 예열 후 GC 추적 대상에서 제외 (워커가 페이지를 공유하도록)"""
+    import main
+
+    status = main.warm_caches()
+    # 예열된 객체를 영구 세대로 옮겨 워커의 GC가 참조 카운트 외에는 페이지를 건드리지 않게 함
+    gc.collect()
+    gc.freeze()
+    print(f"🔥 캐시 예열 완료: 페이지 {status['done']}개, {status['elapsed_ms']}ms")
+    return main
+
+
+def reload_content(main):
+    """SIGHUP 시 콘텐츠/템플릿을 다시 읽고 캐시를 재예열 (코드 변경은 전체 재시작 필요)"""
+    gc.unfreeze()
+    main.invalidate_content()
+    main.page_cache.invalidate()
+    main.content_cache.invalidate()
+    main.templates = main.create_environment()
+    status = main.warm_caches()
+    gc.collect()
+    gc.freeze()
+    print(f"🔄 콘텐츠 다시 로드: 페이지 {status['done']}개, {status['elapsed_ms']}ms")
+
+
+def run_worker(app, sock: socket.socket, args, ready_fd: int):
+    """워커 프로세스 본체 (uvicorn 서버를 공유 소켓으로 실행)"""
+    import uvicorn
+
+    class WorkerServer(uvicorn.Server):
+        """시작이 끝나면 마스터에게 준비 완료를 알리는 uvicorn 서버"""
+
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            if self.started:
+                os.write(ready_fd, b"1")
+            os.close(ready_fd)
+
+    # 마스터의 시그널 처리를 물려받지 않도록 초기화 (SIGTERM/SIGINT 는 uvicorn 이 처리)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        backlog=args.backlog,
+        access_log=args.access_log,
+    )
+    WorkerServer(config).run(sockets=[sock])
+
+
+class Master:
+    """워커 생성/감시/교체를 담당하는 마스터 프로세스"""
+
+    def __init__(self, main, sock: socket.socket, args):
+        self.main = main
+        self.sock = sock
+        self.args = args
+        self.workers: Dict[int, int] = {}  # pid → 슬롯 번호
+        self.signals: List[int] = []
+        self.stopping = False
+
+    def spawn(self, slot: int) -> int:
+        """워커 1개 fork, 준비 완료 알림용 파이프의 읽기 쪽 fd 반환"""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            code = 0
+            try:
+                run_worker(self.main.app, self.sock, self.args, write_fd)
+            except BaseException as e:
+                print(f"❌ 워커 {os.getpid()} 오류: {e}", file=sys.stderr)
+                code = 1
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        self.workers[pid] = slot
+        return read_fd
+
+    def wait_ready(self, read_fd: int) -> bool:
+        """워커가 소켓에서 요청을 받을 준비가 될 때까지 대기"""
+        try:
+            readable, _, _ = select.select([read_fd], [], [], WORKER_READY_TIMEOUT)
+            return bool(readable) and os.read(read_fd, 1) == b"1"
+        finally:
+            os.close(read_fd)
+
+    def reap(self) -> List[int]:
+        """종료된 워커 정리 후 비게 된 슬롯 번호 목록 반환"""
+        freed = []
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            slot = self.workers.pop(pid, None)
+            if slot is not None:
+                freed.append(slot)
+                if not self.stopping and os.waitstatus_to_exitcode(status) != 0:
+                    print(
+                        f"⚠️  워커 {pid} 비정상 종료 (status {status}), 다시 시작합니다"
+                    )
+        return freed
+
+    def rolling_restart(self):
+        """새 워커가 준비되면 기존 워커를 하나씩 정상 종료 (항상 요청을 받는 워커가 남아 있음)"""
+        reload_content(self.main)
+        for old_pid, slot in list(self.workers.items()):
+            if self.stopping:
+                return
+            if not self.wait_ready(self.spawn(slot)):
+                print(
+                    f"⚠️  슬롯 {slot} 교체 워커가 준비되지 않아 기존 워커를 유지합니다"
+                )
+                continue
+            self.workers.pop(old_pid, None)
+            try:
+                os.kill(old_pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        print(f"✅ 무중단 재시작 완료 (워커 {len(self.workers)}개)")
+
+    def shutdown(self):
+        """모든 워커에 SIGTERM 전달 후 종료 대기 (시간 초과 시 SIGKILL)"""
+        self.stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            os.kill(pid, signal.SIGKILL)
+        self.reap()
+
+    def run(self):
+        """워커 시작 후 시그널 처리 루프"""
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD):
+            signal.signal(signum, lambda signum, frame: self.signals.append(signum))
+
+        for slot in range(self.args.workers):
+            self.wait_ready(self.spawn(slot))
+        print(
+            f"🚀 http://{self.args.host}:{self.args.port} - 워커 {len(self.workers)}개 (마스터 pid {os.getpid()})"
+        )
+
+        while True:
+            if not self.signals:
+                time.sleep(0.2)
+            while self.signals:
+                signum = self.signals.pop(0)
+                if signum in (signal.SIGTERM, signal.SIGINT):
+                    print("🛑 종료 중 - 처리 중인 요청을 마무리합니다")
+                    self.shutdown()
+                    return
+                if signum == signal.SIGHUP:
+                    self.rolling_restart()
+            for slot in self.reap():
+                if slot not in self.workers.values():
+                    time.sleep(RESPAWN_DELAY)
+                    self.wait_ready(self.spawn(slot))
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="포트폴리오 운영 서버 (pre-fork 멀티 워커)"
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="바인딩 주소")
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("PORT", "8000")), help="포트"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=default_workers(), help="워커 수 (기본: CPU 수)"
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=DEFAULT_BACKLOG, help="listen 대기열 길이"
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=DEFAULT_KEEP_ALIVE,
+        help="HTTP keep-alive 유지 시간 (초)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=DEFAULT_GRACEFUL_TIMEOUT,
+        help="종료 시 처리 중인 요청 대기 시간 (초)",
+    )
+    parser.add_argument("--access-log", action="store_true", help="요청 로그 출력")
+    return parser.parse_args(argv)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    if not hasattr(os, "fork"):
+        print("❌ serve.py 는 fork 를 지원하는 OS(Linux/macOS)에서만 동작합니다.")
+        sys.exit(1)
+    args.workers = max(1, args.workers)
+    app_module = preload()
+    sock = create_socket(args.host, args.port, args.backlog)
+    Master(app_module, sock, args).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+// 프로젝트 검색 클라이언트
+// - data-search-api: 서버(FastAPI) /search API 사용
+// - data-search-index: 정적 사이트용 샤드(meta.json + shard-N.json) 중 질의 용어가 속한 샤드만 내려받아 BM25 계산
+(() => {
+    const form = document.getElementById("project-search");
+    if (!form) return;
+    const input = form.querySelector("input[type=search]");
+    const list = document.getElementById("project-search-results");
+    const apiUrl = form.dataset.searchApi;
+    const indexUrl = form.dataset.searchIndex;
+    const limit = 10;
+
+    // data/search_index.py 의 tokenize/shard_for 와 동일한 규칙
+    const tokenize = (text) => {
+        const tokens = [];
+        for (const word of text.toLowerCase().match(/[가-힣]+|[a-z0-9]+/g) || []) {
+            if (word[0] >= "가" && word.length > 1) {
+                for (let i = 0; i < word.length - 1; i++) tokens.push(word.slice(i, i + 2));
+            } else {
+                tokens.push(word);
+            }
+        }
+        return tokens;
+    };
+    const shardFor = (term, count) => {
+        let hash = 0x811c9dc5;
+        for (const byte of new TextEncoder().encode(term)) {
+            hash = Math.imul(hash ^ byte, 0x01000193) >>> 0;
+        }
+        return hash % count;
+    };
+
+    const fetchJson = (url) => fetch(url).then((response) => response.json());
+    let meta = null;
+    const shardCache = new Map();
+    const loadShard = (index) => {
+        if (!shardCache.has(index)) shardCache.set(index, fetchJson(`${indexUrl}shard-${index}.json`));
+        return shardCache.get(index);
+    };
+
+    const searchShards = async (query) => {
+        meta = meta || await fetchJson(`${indexUrl}meta.json`);
+        const terms = [...new Set(tokenize(query))];
+        const shards = await Promise.all(terms.map((term) => loadShard(shardFor(term, meta.shards))));
+        const scores = new Map();
+        terms.forEach((term, i) => {
+            const postings = shards[i][term];
+            if (!postings) return;
+            const count = meta.docs.length;
+            const idf = Math.log(1 + (count - postings.length + 0.5) / (postings.length + 0.5));
+            for (const [doc, freq] of postings) {
+                const norm = meta.k1 * (1 - meta.b + meta.b * meta.lengths[doc] / meta.avgdl);
+                scores.set(doc, (scores.get(doc) || 0) + idf * freq * (meta.k1 + 1) / (freq + norm));
+            }
+        });
+        return [...scores.entries()]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([doc]) => {
+                const [id, title, description] = meta.docs[doc];
+                return { id, title, description, url: `/project/${id}` };
+            });
+    };
+
+    const searchApi = async (query) => {
+        const data = await fetchJson(`${apiUrl}?q=${encodeURIComponent(query)}&limit=${limit}`);
+        return data.results;
+    };
+
+    const render = (results) => {
+        list.replaceChildren(...results.map((result) => {
+            const item = document.createElement("li");
+            const link = document.createElement("a");
+            link.href = result.url;
+            link.className = "block p-4 rounded-xl hover:bg-gray-50";
+            const title = document.createElement("p");
+            title.className = "font-semibold text-gray-800";
+            title.textContent = result.title;
+            const description = document.createElement("p");
+            description.className = "text-sm text-gray-500 line-clamp-2";
+            description.textContent = result.description;
+            link.append(title, description);
+            item.append(link);
+            return item;
+        }));
+        list.hidden = results.length === 0;
+    };
+
+    let timer = null;
+    let latest = 0;
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(async () => {
+            const query = input.value.trim();
+            const requestId = ++latest;
+            const results = query ? await (indexUrl ? searchShards(query) : searchApi(query)) : [];
+            if (requestId === latest) render(results);
+        }, 120);
+    });
+    form.addEventListener("submit", (event) => event.preventDefault());
+})();
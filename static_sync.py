@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""정적 자산 동기화 모듈 (변경된 파일만 reflink/하드링크/복사)"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows에는 fcntl이 없으므로 reflink 미지원
+    fcntl = None
+
+from compression import ENCODING_SUFFIXES
+
+# Linux FICLONE ioctl (btrfs/xfs 등 copy-on-write 파일시스템의 reflink)
+FICLONE = 0x40049409
+
+
+@dataclass
+class SyncResult:
+    """동기화 결과 (상대 경로 목록)"""
+    files: List[str] = field(default_factory=list)
+    reflinked: List[str] = field(default_factory=list)
+    linked: List[str] = field(default_factory=list)
+    copied: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """동기화 결과 요약"""
+        return (f"reflink {len(self.reflinked)}개, 하드링크 {len(self.linked)}개, "
+                f"복사 {len(self.copied)}개, 건너뜀 {len(self.skipped)}개, 삭제 {len(self.removed)}개")
+
+
+def _file_hash(path: Path) -> str:
+    """파일 내용 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_unchanged(source: Path, target: Path, compare_hash: bool = False) -> bool:
+    """대상 파일이 원본과 같은지 확인 (기본: size + mtime, 옵션: 내용 해시)"""
+    try:
+        source_stat, target_stat = source.stat(), target.stat()
+    except FileNotFoundError:
+        return False
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino):
+        return True
+    if compare_hash:
+        return _file_hash(source) == _file_hash(target)
+    return source_stat.st_mtime_ns == target_stat.st_mtime_ns
+
+
+def _try_reflink(source: Path, target: Path) -> bool:
+    """copy-on-write reflink 시도 (지원하지 않으면 False)"""
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+def _try_hardlink(source: Path, target: Path) -> bool:
+    """하드링크 시도 (다른 파일시스템이거나 권한이 없으면 False)"""
+    try:
+        os.link(source, target)
+    except OSError as e:
+        if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EACCES):
+            return False
+        raise
+    return True
+
+
+def sync_file(source: Path, target: Path, result: SyncResult, relative: str, link: bool = True):
+    """파일 1개를 reflink → 하드링크 → 복사 순으로 동기화"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    if link and _try_reflink(source, target):
+        result.reflinked.append(relative)
+    elif link and _try_hardlink(source, target):
+        result.linked.append(relative)
+    else:
+        shutil.copy2(source, target)
+        result.copied.append(relative)
+
+
+def _is_precompressed_sibling(path: Path) -> bool:
+    """.gz/.br 사전 압축 사본인지 확인"""
+    return path.suffix in ENCODING_SUFFIXES.values()
+
+
+def sync_tree(
+    source_dir: Path,
+    target_dir: Path,
+    remove_orphans: bool = True,
+    compare_hash: bool = False,
+    link: bool = True,
+    preserve: Optional[Callable[[Path], bool]] = None,
+) -> SyncResult:
+    """source_dir를 target_dir에 동기화 (변경된 파일만 갱신, 원본에 없는 파일은 삭제)"""
+    source_dir, target_dir = Path(source_dir), Path(target_dir)
+    preserve = preserve or _is_precompressed_sibling
+    result = SyncResult()
+
+    for source in sorted(source_dir.rglob("*")):
+        if not source.is_file():
+            continue
+        relative = source.relative_to(source_dir).as_posix()
+        result.files.append(relative)
+        target = target_dir / relative
+        if is_unchanged(source, target, compare_hash):
+            result.skipped.append(relative)
+        else:
+            sync_file(source, target, result, relative, link)
+
+    if remove_orphans and target_dir.exists():
+        expected = set(result.files)
+        for target in sorted(target_dir.rglob("*"), reverse=True):
+            relative = target.relative_to(target_dir).as_posix()
+            if target.is_file() and relative not in expected and not preserve(target):
+                target.unlink()
+                result.removed.append(relative)
+            elif target.is_dir() and not any(target.iterdir()):
+                target.rmdir()
+    return result
+
+
+def main():
+    """메인 함수 (사용법: python static_sync.py [원본] [대상] [--hash] [--copy])"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    source_dir = Path(args[0]) if args else Path("static")
+    target_dir = Path(args[1]) if len(args) > 1 else Path("docs/static")
+    result = sync_tree(source_dir, target_dir, compare_hash="--hash" in sys.argv, link="--copy" not in sys.argv)
+    print(f"🔗 {source_dir} → {target_dir}: {result.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""사용된 유틸리티 클래스만 담은 스타일시트 생성 모듈 (Tailwind CDN 대신 빌드 시점 CSS + critical CSS)
+
+vendor/tailwind/utilities.css (Tailwind v3 기본 테마를 컴파일한 형태)에서 템플릿/JS/콘텐츠 HTML 에 실제로
+쓰인 클래스만 골라 static/css/site.css 로 저장하고, 각 템플릿의 첫 </section> 까지(내비게이션 + 첫 화면)
+쓰인 클래스는 critical_css() 로 <head> 에 인라인합니다. 브라우저에서 CSS 를 컴파일하는 스크립트가 필요 없습니다.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from compression import ENCODING_SUFFIXES
+
+VENDOR_CSS = Path("vendor/tailwind/utilities.css")
+TEMPLATES_DIR = Path("templates")
+SCRIPTS_DIR = Path("static/js")
+STYLESHEET_SUBPATH = Path("css/site.css")  # static 디렉토리 기준
+BASE_MARKER = "/* @base */"
+UTILITIES_MARKER = "/* @utilities */"
+CRITICAL_END = "</section>"  # 첫 화면 구역의 끝 (템플릿 기준)
+
+# 반응형 변형 (Tailwind 기본 breakpoint, 출력 순서)
+SCREENS = {
+    "sm": "640px",
+    "md": "768px",
+    "lg": "1024px",
+    "xl": "1280px",
+    "2xl": "1536px",
+}
+# 상태 변형 선택자 ({} 자리에 유틸리티 클래스 선택자, 출력 순서)
+STATE_VARIANTS = {
+    "hover": "{}:hover",
+    "focus": "{}:focus",
+    "focus-visible": "{}:focus-visible",
+    "active": "{}:active",
+    "disabled": "{}:disabled",
+    "group-hover": ".group:hover {}",
+}
+
+RULE_PATTERN = re.compile(r"^\.((?:\\.|[\w-])+)([^{]*)\{(.*)\}$")
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+OPACITY_COLOR = re.compile(r"rgb\(([\d ]+) / var\((--tw-[\w-]+-opacity)\)\)")
+OPACITY_MODIFIER = re.compile(r"(.+)/(\d{1,3})")
+ARBITRARY_VALUE = re.compile(r"(-?[a-z][\w-]*?)-\[([^\]\s]+)\]")
+# 템플릿/JS 는 Tailwind 처럼 모든 토큰을 후보로 (Jinja 조건문/문자열 안의 클래스 포함)
+TOKEN_SEPARATORS = re.compile(r"[\s\"'`<>={}]+")
+CLASS_ATTRIBUTE = re.compile(r"""class\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+@dataclass(frozen=True)
+class Utility:
+    """유틸리티 규칙 하나 (원본 순서, 클래스 뒤 선택자, 선언부)"""
+
+    index: int
+    suffix: str
+    body: str
+
+
+def css_escape(name: str) -> str:
+    """클래스 이름을 CSS 선택자용으로 이스케이프 (md:flex → md\\:flex)"""
+    return re.sub(r"([^\w-])", r"\\\1", name)
+
+
+def split_variants(token: str) -> List[str]:
+    """md:hover:bg-blue-700 → ['md', 'hover', 'bg-blue-700'] (대괄호 안의 : 는 유지)"""
+    parts, current, depth = [], [], 0
+    for char in token:
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        if char == ":" and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+class UtilitySource:
+    """벤더링한 유틸리티 CSS (@base 는 항상 포함, @utilities 는 사용된 클래스만 선택)"""
+
+    def __init__(self, text: str):
+        head, _, utilities = text.partition(UTILITIES_MARKER)
+        base = COMMENT_PATTERN.sub("", head.partition(BASE_MARKER)[2])
+        self.base = "".join(line.strip() for line in base.splitlines())
+        self.rules: Dict[str, List[Utility]] = {}
+        for index, line in enumerate(COMMENT_PATTERN.sub("", utilities).splitlines()):
+            match = RULE_PATTERN.match(line.strip())
+            if match:
+                name = re.sub(r"\\(.)", r"\1", match.group(1))
+                self.rules.setdefault(name, []).append(
+                    Utility(index, match.group(2), match.group(3))
+                )
+
+    def _with_opacity(self, name: str, percent: int) -> Optional[List[Utility]]:
+        """색상 유틸리티에 투명도 적용 (text-white/80 → rgb(255 255 255 / 0.8))"""
+        utilities = self.rules.get(name)
+        if not utilities or percent > 100:
+            return None
+        alpha = f"{percent / 100:g}"
+        result = []
+        for utility in utilities:
+            match = OPACITY_COLOR.search(utility.body)
+            if match is None:
+                return None
+            body = utility.body.replace(f"{match.group(2)}:1;", "")
+            result.append(
+                Utility(
+                    utility.index,
+                    utility.suffix,
+                    OPACITY_COLOR.sub(rf"rgb(\1 / {alpha})", body),
+                )
+            )
+        return result
+
+    def _with_arbitrary(self, prefix: str, value: str) -> Optional[List[Utility]]:
+        """임의 값 유틸리티 (z-[100] → z-index:100), 같은 접두사의 단일 선언 규칙을 기준으로 생성"""
+        value = value.replace("_", " ")
+        is_color = value.startswith(("#", "rgb", "hsl"))
+        for name, utilities in self.rules.items():
+            if not name.startswith(prefix + "-") or len(utilities) != 1:
+                continue
+            utility = utilities[0]
+            declaration = utility.body.split(":", 1)
+            if (
+                ";" in utility.body
+                or utility.suffix
+                or ("color" in declaration[0]) != is_color
+            ):
+                continue
+            return [Utility(utility.index, "", f"{declaration[0]}:{value}")]
+        return None
+
+    def resolve(self, name: str) -> Optional[List[Utility]]:
+        """변형을 제외한 클래스 이름의 규칙 (투명도/임의 값 포함, 없으면 None)"""
+        if name in self.rules:
+            return self.rules[name]
+        match = OPACITY_MODIFIER.fullmatch(name)
+        if match and match.group(1) in self.rules:
+            return self._with_opacity(match.group(1), int(match.group(2)))
+        match = ARBITRARY_VALUE.fullmatch(name)
+        if match:
+            return self._with_arbitrary(match.group(1), match.group(2))
+        return None
+
+    def expand(
+        self, token: str
+    ) -> List[Tuple[Tuple[int, int, int], Optional[str], str]]:
+        """클래스 토큰의 CSS 규칙 목록 [(정렬 키, media 조건, 규칙)] (유틸리티가 아니면 빈 목록)"""
+        *variants, name = split_variants(token)
+        screen = state = None
+        for variant in variants:
+            if variant in SCREENS and screen is None:
+                screen = variant
+            elif variant in STATE_VARIANTS and state is None:
+                state = variant
+            else:
+                return []
+        utilities = self.resolve(name)
+        if not utilities:
+            return []
+
+        selector = "." + css_escape(token)
+        if state is not None:
+            selector = STATE_VARIANTS[state].format(selector)
+        screen_order = list(SCREENS).index(screen) + 1 if screen else 0
+        state_order = list(STATE_VARIANTS).index(state) + 1 if state else 0
+        media = f"(min-width:{SCREENS[screen]})" if screen else None
+        return [
+            (
+                (screen_order, state_order, utility.index),
+                media,
+                f"{selector}{utility.suffix}{{{utility.body}}}",
+            )
+            for utility in utilities
+        ]
+
+    def build(self, tokens: Iterable[str]) -> str:
+        """사용된 클래스만 담은 최소화 CSS (@base + 유틸리티, 반응형 변형은 breakpoint 별 @media)"""
+        entries = sorted(rule for token in set(tokens) for rule in self.expand(token))
+        css, media_rules = [self.base], {}
+        for _, media, rule in entries:
+            if media is None:
+                css.append(rule)
+            else:
+                media_rules.setdefault(media, []).append(rule)
+        css.extend(
+            f"@media {media}{{{''.join(rules)}}}"
+            for media, rules in media_rules.items()
+        )
+        return "".join(css)
+
+
+_source_lock = threading.Lock()
+_source: Optional[Tuple[Tuple[int, int], UtilitySource]] = None
+_critical: Dict[str, Tuple[tuple, str]] = {}
+
+
+def _signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_source(path: Path = VENDOR_CSS) -> UtilitySource:
+    """벤더 유틸리티 CSS 로드 (파일이 바뀌지 않았으면 파싱 결과 재사용)"""
+    global _source
+    signature = _signature(path)
+    with _source_lock:
+        if _source is None or _source[0] != signature:
+            _source = (signature, UtilitySource(path.read_text(encoding="utf-8")))
+        return _source[1]
+
+
+def source_tokens(text: str) -> Set[str]:
+    """템플릿/JS 소스의 클래스 후보 토큰"""
+    return {token.strip("%,;()") for token in TOKEN_SEPARATORS.split(text)} - {""}
+
+
+def class_tokens(html: str) -> Set[str]:
+    """HTML 의 class 속성에 쓰인 클래스"""
+    tokens = set()
+    for match in CLASS_ATTRIBUTE.finditer(html):
+        tokens.update((match.group(1) or match.group(2) or "").split())
+    return tokens
+
+
+def site_html() -> List[str]:
+    """콘텐츠 HTML (ABOUT_TEXT 소개 + 렌더링된 프로젝트 마크다운)"""
+    import data.portfolio_data as portfolio_data
+
+    html = [portfolio_data.ABOUT_TEXT]
+    for project in portfolio_data.get_projects():
+        detail = portfolio_data.get_project_by_id(project["id"])
+        if detail:
+            html.append(detail["content"])
+    return html
+
+
+def collect_tokens(html: Iterable[str]) -> Set[str]:
+    """템플릿, 정적 JS, 콘텐츠 HTML 에서 사용된 클래스 후보"""
+    tokens = set()
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")) + sorted(
+        SCRIPTS_DIR.rglob("*.js")
+    ):
+        tokens |= source_tokens(path.read_text(encoding="utf-8"))
+    for text in html:
+        tokens |= class_tokens(text)
+    return tokens
+
+
+def critical_css(template_name: str) -> str:
+    """템플릿의 첫 </section> 까지(내비게이션 + 첫 화면)에 쓰인 클래스의 CSS (<head> 인라인용)"""
+    path = TEMPLATES_DIR / template_name
+    signature = (_signature(path), _signature(VENDOR_CSS))
+    cached = _critical.get(template_name)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    above_the_fold = path.read_text(encoding="utf-8").partition(CRITICAL_END)[0]
+    css = load_source().build(source_tokens(above_the_fold))
+    _critical[template_name] = (signature, css)
+    return css
+
+
+def build_stylesheet(static_root: Path, html: Optional[Iterable[str]] = None) -> str:
+    """static_root/css/site.css 생성 후 CSS 반환 (내용이 같으면 파일을 그대로 둠)"""
+    css = load_source().build(collect_tokens(site_html() if html is None else html))
+    path = Path(static_root) / STYLESHEET_SUBPATH
+    try:
+        unchanged = path.read_text(encoding="utf-8") == css
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 정적 동기화가 하드링크한 파일일 수 있으므로 임시 파일에 쓰고 교체
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp.write_text(css, encoding="utf-8")
+        os.replace(temp, path)
+        # 이전 내용의 사전 압축본은 삭제 (다음 압축 단계에서 다시 생성)
+        for suffix in ENCODING_SUFFIXES.values():
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+    return css
+
+
+def main():
+    """메인 함수 (개발 서버용으로 static/css/site.css 생성)"""
+    css = build_stylesheet(Path("static"))
+    print(
+        f"🎨 스타일시트 생성 완료: {Path('static') / STYLESHEET_SUBPATH} ({len(css.encode('utf-8')) / 1024:.1f}KB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Jinja2 템플릿 환경 모듈 (서버/정적 빌드 공용, 바이트코드 캐시 + 사전 컴파일 템플릿)
+
+- 개발 모드: 파일 변경 시 자동 리로드 + 디스크 바이트코드 캐시 (.cache/jinja)
+- 운영/빌드: templates/ 전체를 파이썬 모듈로 사전 컴파일해 (.cache/jinja-compiled/<해시>)
+  워커 시작/첫 요청/빌드 때 템플릿을 다시 파싱·컴파일하지 않음
+- generate_static 용 조각: 템플릿/블록을 자리 표시 값으로 렌더링해 string.Template 로 저장 (render_fragment)
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import jinja2
+from jinja2 import ChoiceLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader, meta
+
+from fonts import font_css, font_preloads
+from styles import critical_css
+
+TEMPLATES_DIR = Path("templates")
+BYTECODE_CACHE_DIR = Path(".cache/jinja")
+COMPILED_DIR = Path(".cache/jinja-compiled")
+PAGE_TEMPLATES = ("index.html", "project.html", "404.html")
+# render_fragment 자리 표시 값 (렌더링 후 string.Template 의 ${이름} 으로 바뀜)
+SLOT_PATTERN = re.compile(r"\x00(\w+)\x00")
+
+
+def templates_digest(directory: Path = TEMPLATES_DIR) -> str:
+    """템플릿 디렉토리 전체(경로 + 내용)와 Jinja2 버전의 해시"""
+    digest = hashlib.sha256(jinja2.__version__.encode())
+    for path in sorted(directory.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(directory).as_posix().encode() + b"\0" + path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """디스크 바이트코드 캐시 (디렉토리를 만들 수 없으면 None)"""
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
+
+
+def _base_environment(loader, auto_reload: bool) -> Environment:
+    """서버와 빌드가 같은 출력을 내도록 공통 옵션으로 환경 생성"""
+    env = Environment(
+        loader=loader,
+        autoescape=True,
+        auto_reload=auto_reload,
+        bytecode_cache=_bytecode_cache(),
+    )
+    # 페이지별 첫 화면 CSS (<head> 인라인)
+    env.globals["critical_css"] = critical_css
+    # 셀프 호스팅 웹폰트 (@font-face + 본문 굵기 preload)
+    env.globals["font_css"] = font_css
+    env.globals["font_preloads"] = font_preloads
+    return env
+
+
+def compile_templates(directory: Path = TEMPLATES_DIR) -> Optional[Path]:
+    """템플릿을 파이썬 모듈로 사전 컴파일 (내용이 같으면 기존 결과 재사용), 실패 시 None"""
+    target = COMPILED_DIR / templates_digest(directory)
+    if target.is_dir():
+        return target
+
+    # 여러 프로세스가 동시에 컴파일해도 안전하도록 임시 디렉토리에 만든 뒤 이름 변경
+    temp = COMPILED_DIR / f"{target.name}.{os.getpid()}.tmp"
+    try:
+        env = _base_environment(FileSystemLoader(str(directory)), auto_reload=False)
+        env.compile_templates(str(temp), zip=None, ignore_errors=False)
+        os.rename(temp, target)
+    except (OSError, jinja2.TemplateError) as e:
+        shutil.rmtree(temp, ignore_errors=True)
+        if not target.is_dir():
+            print(f"⚠️  템플릿 사전 컴파일 실패, 바이트코드 캐시만 사용합니다: {e}")
+            return None
+        # 다른 프로세스가 먼저 같은 결과를 만든 경우
+
+    # 이전 버전 컴파일 결과 정리
+    for stale in COMPILED_DIR.iterdir():
+        if stale != target and not stale.name.endswith(".tmp"):
+            shutil.rmtree(stale, ignore_errors=True)
+    return target
+
+
+def create_environment(dev: bool = False, precompiled: bool = True,
+                       directory: Path = TEMPLATES_DIR) -> Environment:
+    """템플릿 환경 생성 (dev=True면 자동 리로드, 아니면 사전 컴파일 모듈 우선)"""
+    loader = FileSystemLoader(str(directory))
+    if dev or not precompiled:
+        return _base_environment(loader, auto_reload=dev)
+
+    compiled = compile_templates(directory)
+    if compiled is not None:
+        # 컴파일된 모듈을 먼저 찾고, 소스가 필요한 경우(get_source 등)는 파일 로더로 대체
+        loader = ChoiceLoader([ModuleLoader(str(compiled)), loader])
+    return _base_environment(loader, auto_reload=False)
+
+
+def template_files(env: Environment, name: str, directory: Path = TEMPLATES_DIR) -> List[Path]:
+    """템플릿과 그 템플릿이 extends/include/import 하는 템플릿 파일 목록 (사전 컴파일 여부와 무관하게 소스 기준)"""
+    source_loader = FileSystemLoader(str(directory))
+    files, pending, seen = [], [name], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source, filename, _ = source_loader.get_source(env, current)
+        files.append(Path(filename))
+        pending.extend(ref for ref in meta.find_referenced_templates(env.parse(source)) if ref)
+    return sorted(files)
+
+
+def slot(name: str) -> str:
+    """render_fragment 컨텍스트에 넣는 자리 표시 값 (HTML 이스케이프 대상 문자가 없어 그대로 출력됨)"""
+    return f"\x00{name}\x00"
+
+
+def render_fragment(template: jinja2.Template, block: Optional[str] = None, context: Optional[Dict] = None,
+                    slots: Iterable[str] = ()) -> str:
+    """템플릿 전체(또는 블록 하나)를 string.Template 조각으로 렌더링
+
+    context 의 slot() 값과 slots 로 지정한 하위 블록은 ${이름} 자리 표시자가 되고, 나머지 '$' 는 '$$' 로 이스케이프합니다.
+    """
+    ctx = template.new_context(context or {})
+    for name in slots:
+        ctx.blocks[name].insert(0, lambda _context, name=name: iter([slot(name)]))
+    render = ctx.blocks[block][0] if block else template.root_render_func
+    return SLOT_PATTERN.sub(r"${\1}", "".join(render(ctx)).replace("$", "$$"))
@@ -0,0 +1,50 @@
+"""사전 압축 및 Accept-Encoding 협상 테스트"""
+
+import gzip
+import os
+
+import compression
+from compression import negotiate_encoding, parse_accept_encoding
+from page_cache import build_page
+
+
+def test_prefers_brotli_over_gzip():
+    assert negotiate_encoding("gzip, deflate, br", ["gzip", "br"]) == "br"
+    assert negotiate_encoding("gzip, br", ["gzip"]) == "gzip"
+
+
+def test_respects_q_values():
+    assert negotiate_encoding("br;q=0, gzip;q=0.5", ["gzip", "br"]) == "gzip"
+    assert negotiate_encoding("*;q=0.1, br;q=0", ["gzip", "br"]) == "gzip"
+    assert parse_accept_encoding("gzip;q=bad") == {"gzip": 0.0}
+
+
+def test_falls_back_to_identity():
+    assert negotiate_encoding(None, ["gzip", "br"]) is None
+    assert negotiate_encoding("identity", ["gzip", "br"]) is None
+    assert negotiate_encoding("gzip;q=0", ["gzip"]) is None
+
+
+def test_cached_page_selects_encoded_body():
+    page = build_page("<p>포트폴리오</p>" * 100)
+    encoding, body, etag = page.select("gzip")
+    assert encoding == "gzip"
+    assert gzip.decompress(body) == page.body
+    assert etag == page.etag[:-1] + '-gzip"'
+    assert page.select("identity") == (None, page.body, page.etag)
+
+
+def test_precompress_removes_copies_that_no_longer_apply(tmp_path, monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    path = tmp_path / "index.html"
+    path.write_text("<p>본문</p>" * 200, encoding="utf-8")
+
+    assert compression.precompress_file(path) == [tmp_path / "index.html.gz"]
+    assert compression.precompress_file(path) == []
+
+    # 압축 기준보다 작아진 원본에는 이전 내용의 사본이 남지 않아야 함
+    path.write_text("<p>짧음</p>", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    compression.precompress_file(path)
+    assert not (tmp_path / "index.html.gz").exists()
@@ -0,0 +1,52 @@
+"""마크다운 렌더링 캐시 테스트"""
+
+import os
+
+from data.content_cache import ContentCache
+
+
+def test_reuses_render_until_file_changes(tmp_path):
+    path = tmp_path / "project.md"
+    path.write_text("# 제목", encoding="utf-8")
+    renders = []
+
+    def render(source):
+        renders.append(source)
+        return f"<h1>{len(renders)}</h1>"
+
+    cache = ContentCache()
+    assert cache.get_or_render(path, render) == "<h1>1</h1>"
+    assert cache.get_or_render(path, render) == "<h1>1</h1>"
+    assert cache.stats()["hits"] == 1
+
+    # 크기가 같아도 mtime 이 바뀌면 다시 렌더링
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_or_render(path, render) == "<h1>2</h1>"
+
+    path.write_text("# 더 긴 제목", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_or_render(path, render) == "<h1>3</h1>"
+
+
+def test_evicts_least_recently_used(tmp_path):
+    paths = [tmp_path / f"{name}.md" for name in "abc"]
+    for path in paths:
+        path.write_text(path.stem, encoding="utf-8")
+
+    cache = ContentCache(max_entries=2)
+    for path in paths:
+        cache.get_or_render(path, lambda source: source.read_text(encoding="utf-8"))
+
+    assert cache.stats()["entries"] == 2
+    cache.get_or_render(paths[0], lambda source: "다시 렌더링")
+    assert cache.stats()["hits"] == 0
+
+
+def test_invalidate_single_path(tmp_path):
+    path = tmp_path / "project.md"
+    path.write_text("본문", encoding="utf-8")
+    cache = ContentCache()
+    cache.get_or_render(path, lambda source: "이전")
+    cache.invalidate(path)
+    assert cache.get_or_render(path, lambda source: "새 결과") == "새 결과"
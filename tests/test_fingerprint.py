@@ -0,0 +1,61 @@
+"""정적 자산 지문 URL 테스트"""
+
+import hashlib
+
+from fingerprint import AssetFingerprints, rewrite_urls, write_fingerprinted
+
+
+def make_static(root):
+    (root / "css").mkdir(parents=True)
+    (root / "css" / "site.css").write_text("body{margin:0}", encoding="utf-8")
+    (root / "images").mkdir()
+    (root / "images" / "a.png").write_bytes(b"png")
+    (root / "images" / "manifest.json").write_text("{}", encoding="utf-8")
+    (root / "css" / "site.css.gz").write_bytes(b"gz")
+
+
+def test_manifest_uses_content_hash(tmp_path):
+    make_static(tmp_path)
+    digest = hashlib.sha256(b"body{margin:0}").hexdigest()[:10]
+    manifest = AssetFingerprints(tmp_path).manifest()
+    # 서버/빌드가 고정 경로로 읽는 manifest 와 압축 사본은 제외
+    assert manifest == {
+        "/static/css/site.css": f"/static/css/site.{digest}.css",
+        "/static/images/a.png": f"/static/images/a.{hashlib.sha256(b'png').hexdigest()[:10]}.png",
+    }
+
+
+def test_rewrite_urls_in_attributes_and_css(tmp_path):
+    make_static(tmp_path)
+    manifest = AssetFingerprints(tmp_path).manifest()
+    html = (
+        '<link href="/static/css/site.css"><img src="/static/images/a.png" '
+        'srcset="/static/images/a.png 1x, /static/images/b.png 2x">'
+        "<div style=\"background:url('/static/images/a.png')\"></div>"
+    )
+    rewritten = rewrite_urls(html, manifest)
+    assert "/static/css/site.css" not in rewritten
+    assert rewritten.count(manifest["/static/images/a.png"]) == 3
+    assert "/static/images/b.png 2x" in rewritten
+    assert rewrite_urls(html, {}) == html
+
+
+def test_resolve_only_accepts_current_hash(tmp_path):
+    make_static(tmp_path)
+    fingerprints = AssetFingerprints(tmp_path)
+    fingerprinted = fingerprints.url("/static/css/site.css")[len("/static/") :]
+    assert fingerprints.resolve(fingerprinted) == "css/site.css"
+    assert fingerprints.resolve("css/site.0123456789.css") is None
+    assert fingerprints.resolve("css/site.css") is None
+
+
+def test_write_fingerprinted_prunes_old_copies(tmp_path):
+    make_static(tmp_path)
+    old = tmp_path / "css" / "site.0123456789.css"
+    old.write_text("body{}", encoding="utf-8")
+    (tmp_path / "css" / "site.0123456789.css.br").write_bytes(b"br")
+
+    written = write_fingerprinted(tmp_path, AssetFingerprints(tmp_path).manifest())
+    assert all(path.read_bytes() for path in written)
+    assert not old.exists()
+    assert not (tmp_path / "css" / "site.0123456789.css.br").exists()
@@ -0,0 +1,72 @@
+"""증분 정적 빌드 테스트"""
+
+import contextlib
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+import build_static
+from data.portfolio_data import invalidate_content
+from incremental import BuildState
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """저장소 입력(content/templates/static/vendor)을 복사한 빌드 작업 공간"""
+    for name in ("content", "templates", "static", "vendor"):
+        shutil.copytree(ROOT_DIR / name, tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    invalidate_content()
+    yield tmp_path
+    invalidate_content()
+
+
+def build(**options) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build_static.build_static_site(**options)
+
+
+def test_unchanged_input_rebuilds_nothing(workspace):
+    first = build()
+    assert first["built"] > 0
+    assert (workspace / "docs" / "index.html").exists()
+
+    rerun = build(incremental=True)
+    assert rerun["built"] == 0
+    assert rerun["removed"] == 0
+    assert rerun["skipped"] == first["built"]
+
+
+def test_changed_markdown_rebuilds_its_page(workspace):
+    build()
+    content = next((workspace / "content" / "projects").glob("*.md"))
+    content.write_text(
+        content.read_text(encoding="utf-8") + "\n추가 문단\n", encoding="utf-8"
+    )
+    invalidate_content()
+
+    rerun = build(incremental=True)
+    assert rerun["built"] > 0
+    assert rerun["skipped"] > 0
+    page = workspace / "docs" / "project" / f"{content.stem}.html"
+    assert "추가 문단" in page.read_text(encoding="utf-8")
+
+
+def test_build_state_skips_recorded_outputs(tmp_path):
+    state = BuildState(tmp_path)
+    assert state.needs_build("page.html", {"data": "1"})
+    (tmp_path / "page.html").write_text("v1", encoding="utf-8")
+    (tmp_path / "stale.html").write_text("old", encoding="utf-8")
+    state.finalize()
+    assert not (tmp_path / "stale.html").exists()
+
+    state = BuildState(tmp_path, incremental=True)
+    assert not state.needs_build("page.html", {"data": "1"})
+    assert state.needs_build("other.html", {"data": "1"})
+    assert BuildState(tmp_path, incremental=True).needs_build(
+        "page.html", {"data": "2"}
+    )
@@ -0,0 +1,80 @@
+"""FastAPI 라우트 테스트 (페이지 캐시 ETag/304, 페이지네이션)"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from data.portfolio_data import PROJECTS_PER_PAGE, get_projects
+from page_cache import etag_matches, make_etag
+
+
+@pytest.fixture(scope="module")
+def client():
+    # lifespan(워밍업/파일 감시)은 실행하지 않고 요청 시 렌더링
+    return TestClient(main.app)
+
+
+def test_etag_revalidation_returns_304(client):
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    cached = client.get(
+        "/", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    stale = client.get(
+        "/", headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'}
+    )
+    assert stale.status_code == 200
+
+
+def test_not_found_is_never_304(client):
+    response = client.get("/project/missing")
+    assert response.status_code == 404
+    again = client.get(
+        "/project/missing", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert again.status_code == 404
+
+
+def test_etag_matches():
+    etag = make_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_page_past_the_end_is_404(client):
+    last_page = -(-len(get_projects()) // PROJECTS_PER_PAGE)
+    assert client.get("/", params={"page": last_page}).status_code == 200
+    assert client.get("/", params={"page": last_page + 1}).status_code == 404
+    assert client.get("/", params={"page": 2, "tech": "없는 기술"}).status_code == 404
+    assert client.get("/", params={"page": 0}).status_code == 422
+
+
+def test_projects_api_paginates_summaries(client):
+    projects = get_projects()
+    response = client.get("/api/projects", params={"page": 2, "per_page": 3})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == len(projects)
+    assert payload["pages"] == -(-len(projects) // 3)
+    assert [item["id"] for item in payload["items"]] == [
+        project["id"] for project in projects[3:6]
+    ]
+    assert all(len(item["tech_stack"]) <= 4 for item in payload["items"])
+
+
+def test_projects_api_filters_by_tech(client):
+    payload = client.get("/api/projects", params={"tech": "python"}).json()
+    expected = [
+        project["id"] for project in get_projects() if "Python" in project["tech_stack"]
+    ]
+    assert [item["id"] for item in payload["items"]] == expected
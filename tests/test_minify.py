@@ -0,0 +1,51 @@
+"""HTML 최소화 테스트"""
+
+from minify import minify_css, minify_html
+
+
+def test_keeps_single_space_between_inline_elements():
+    html = '<ul>\n  <li><a href="/a">A</a></li>\n  <li><a href="/b">B</a></li>\n</ul>\n<div>x</div>  <div>y</div>'
+    assert (
+        minify_html(html)
+        == '<ul> <li><a href="/a">A</a></li> <li><a href="/b">B</a></li> </ul> <div>x</div> <div>y</div>'
+    )
+
+
+def test_strips_whitespace_around_document_structure():
+    html = "<!DOCTYPE html>\n<html>\n  <head>\n    <meta charset='utf-8'>\n    <title>제목</title>\n  </head>\n  <body>\n    <p>본문</p>\n  </body>\n</html>\n"
+    assert (
+        minify_html(html)
+        == "<!DOCTYPE html><html><head><meta charset='utf-8'><title>제목</title></head><body><p>본문</p></body></html>"
+    )
+
+
+def test_removes_comments_but_keeps_conditional_comments():
+    assert minify_html("<p>a</p><!-- 메모 --><p>b</p>") == "<p>a</p><p>b</p>"
+    assert (
+        minify_html("<!--[if IE]><p>ie</p><![endif]-->")
+        == "<!--[if IE]><p>ie</p><![endif]-->"
+    )
+
+
+def test_preserves_pre_textarea_and_script():
+    html = "<pre>  줄 1\n    줄 2</pre>\n<textarea>\n a  b</textarea>\n<script>\n  let a  = 1;\n</script>\n<p>끝</p>"
+    assert (
+        minify_html(html)
+        == "<pre>  줄 1\n    줄 2</pre> <textarea>\n a  b</textarea><script>\n  let a  = 1;\n</script><p>끝</p>"
+    )
+
+
+def test_minifies_style_without_breaking_empty_custom_properties():
+    assert (
+        minify_css("/* 주석 */\n.a {\n  color: red;\n  --tw-pan-x: ;\n}\n")
+        == ".a{color:red;--tw-pan-x: ;}"
+    )
+    assert (
+        minify_html("<style>\n  .a { color: red; }\n</style>\n<p>x</p>")
+        == "<style>.a{color:red;}</style><p>x</p>"
+    )
+
+
+def test_is_idempotent():
+    html = "<div>\n  <a href='/'>홈</a>\n  <span>이동</span>\n</div>"
+    assert minify_html(minify_html(html)) == minify_html(html)
@@ -0,0 +1,80 @@
+"""프로젝트 레지스트리(id/기술/연도/키워드 인덱스) 테스트"""
+
+from data.project_registry import ProjectRegistry, period_years
+
+PROJECTS = [
+    {
+        "id": "kafka-pipeline",
+        "title": "스트리밍 파이프라인",
+        "period": "2021.03 - 2022.02",
+        "tech_stack": ["Apache Kafka", "Python"],
+        "highlights": ["지연 시간 80% 감소"],
+    },
+    {
+        "id": "trino-platform",
+        "title": "Trino 플랫폼",
+        "period": "2022.06 - 2023.01",
+        "tech_stack": ["Trino", "Terraform", "Python"],
+        "highlights": ["쿼리 비용 절감"],
+    },
+    {
+        "id": "text-to-sql",
+        "title": "Text-to-SQL",
+        "period": "2023.05 - 2023.12",
+        "tech_stack": ["FastAPI", "PostgreSQL", "Python", "LangChain", "Docker"],
+        "highlights": ["응답 시간 단축", "정확도 개선", "비용 절감"],
+    },
+]
+
+
+def test_get_by_id():
+    registry = ProjectRegistry(PROJECTS)
+    assert registry.get("trino-platform") is PROJECTS[1]
+    assert registry.get("missing") is None
+    assert len(registry) == 3
+
+
+def test_find_by_tech_is_case_insensitive():
+    registry = ProjectRegistry(PROJECTS)
+    assert [project["id"] for project in registry.find(tech="  python ")] == [
+        "kafka-pipeline",
+        "trino-platform",
+        "text-to-sql",
+    ]
+    assert registry.find(tech="Rust") == []
+
+
+def test_find_combines_filters_in_catalog_order():
+    registry = ProjectRegistry(PROJECTS)
+    assert [project["id"] for project in registry.find(year=2022)] == [
+        "kafka-pipeline",
+        "trino-platform",
+    ]
+    assert [
+        project["id"]
+        for project in registry.find(tech="Python", year=2022, keyword="비용")
+    ] == ["trino-platform"]
+    assert registry.find(tech="Apache Kafka", year=2023) == []
+
+
+def test_page_returns_summaries():
+    registry = ProjectRegistry(PROJECTS)
+    page = registry.page(page=1, per_page=2)
+    assert [item["id"] for item in page.items] == ["kafka-pipeline", "trino-platform"]
+    assert page.meta() == {"page": 1, "per_page": 2, "total": 3, "pages": 2}
+
+    summary = registry.page(page=2, per_page=2).items[0]
+    assert summary["tech_stack"] == ["FastAPI", "PostgreSQL", "Python", "LangChain"]
+    assert summary["tech_count"] == 5
+    assert summary["highlights"] == ["응답 시간 단축", "정확도 개선"]
+
+
+def test_has_filters():
+    registry = ProjectRegistry(PROJECTS)
+    assert registry.has_filters(tech="trino", year=2023)
+    assert not registry.has_filters(year=2019)
+
+
+def test_period_years():
+    assert period_years("2021.11 - 2023.02") == [2021, 2022, 2023]
+    assert period_years("") == []
@@ -0,0 +1,81 @@
+"""검색 인덱스(2-gram 토큰화 + BM25) 테스트"""
+
+import json
+
+from data.search_index import SearchIndex, shard_for, tokenize
+
+PROJECTS = [
+    {
+        "id": "warehouse",
+        "title": "데이터 웨어하우스 구축",
+        "description": "Redshift 기반 분석 환경",
+        "tech_stack": ["Redshift"],
+        "highlights": [],
+    },
+    {
+        "id": "streaming",
+        "title": "스트리밍 데이터 수집",
+        "description": "Kafka 로 실시간 이벤트 처리",
+        "tech_stack": ["Apache Kafka", "Python"],
+        "highlights": ["지연 시간 80% 감소"],
+    },
+    {
+        "id": "monitoring",
+        "title": "모니터링 시스템",
+        "description": "지표 수집과 알림",
+        "tech_stack": ["Grafana"],
+        "highlights": [],
+    },
+]
+BODIES = {
+    "monitoring": "Kafka 컨슈머 지연을 [대시보드](https://example.com/kafka)로 확인"
+}
+
+
+def test_tokenize_uses_hangul_bigrams_and_words():
+    assert tokenize("스트리밍 Kafka-Connect 2024") == [
+        "스트",
+        "트리",
+        "리밍",
+        "kafka",
+        "connect",
+        "2024",
+    ]
+    assert tokenize("한") == ["한"]
+
+
+def test_korean_query_ranks_title_match_first():
+    index = SearchIndex(PROJECTS, BODIES)
+    results = index.search("스트리밍 수집")
+    assert [result["id"] for result in results][:2] == ["streaming", "monitoring"]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_english_query_ranks_tech_stack_over_body():
+    index = SearchIndex(PROJECTS, BODIES)
+    assert [result["id"] for result in index.search("KAFKA")] == [
+        "streaming",
+        "monitoring",
+    ]
+    # 링크 URL 은 색인하지 않음
+    assert index.search("example") == []
+    assert index.search("없는단어") == []
+
+
+def test_write_shards_removes_shards_from_a_larger_index(tmp_path):
+    stale = tmp_path / "shard-7.json"
+    stale.write_text("{}", encoding="utf-8")
+    (tmp_path / "shard-7.json.gz").write_bytes(b"")
+
+    written = SearchIndex(PROJECTS, BODIES).write_shards(tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        path.name for path in written
+    )
+
+    meta = json.loads((tmp_path / "meta.json").read_text(encoding="utf-8"))
+    shard = json.loads(
+        (tmp_path / f"shard-{shard_for('kafka', meta['shards'])}.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert "kafka" in shard
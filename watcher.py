@@ -0,0 +1,111 @@
+"""파일 변경 감시 모듈 (watchfiles/inotify 우선, 없으면 폴링)"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Set, Tuple
+
+try:
+    import watchfiles
+except ImportError:  # uvicorn[standard]에 포함되지만 없으면 폴링으로 대체
+    watchfiles = None
+
+# 감시 기본 설정
+DEFAULT_WATCH_PATHS = ("content", "templates", "static", "data", "vendor")
+POLL_INTERVAL = 0.05  # 폴링 간격 (초)
+DEBOUNCE_MS = 30  # 연속 저장을 묶는 시간 (밀리초)
+IGNORED_SUFFIXES = {".gz", ".br", ".pyc", ".swp", ".tmp"}
+IGNORED_PARTS = {"__pycache__", "variants", ".git"}
+
+
+def is_ignored(path: Path) -> bool:
+    """빌드 산출물/에디터 임시 파일 등 감시 제외 대상인지 확인"""
+    return (
+        path.suffix in IGNORED_SUFFIXES
+        or path.name.startswith(".")
+        or path.name.endswith("~")
+        or any(part in IGNORED_PARTS for part in path.parts)
+    )
+
+
+class FileWatcher:
+    """파일 변경을 감지해 변경된 경로 집합으로 콜백을 호출하는 백그라운드 감시자"""
+
+    def __init__(self, paths: Iterable[Path], callback: Callable[[Set[Path]], None],
+                 interval: float = POLL_INTERVAL):
+        self.paths = [Path(path) for path in paths if Path(path).exists()]
+        self.callback = callback
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """감시 대상 파일의 (mtime, size) 스냅샷"""
+        snapshot = {}
+        for root in self.paths:
+            candidates = root.rglob("*") if root.is_dir() else [root]
+            for path in candidates:
+                if is_ignored(path):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if not path.is_dir():
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll_loop(self):
+        """폴링 방식 감시 루프"""
+        previous = self._snapshot()
+        while not self._stop.wait(self.interval):
+            current = self._snapshot()
+            if current != previous:
+                changed = {path for path in current.keys() | previous.keys()
+                           if current.get(path) != previous.get(path)}
+                previous = current
+                self._emit(changed)
+
+    def _watchfiles_loop(self):
+        """watchfiles(inotify 등 OS 이벤트) 방식 감시 루프"""
+        for changes in watchfiles.watch(*self.paths, stop_event=self._stop, debounce=DEBOUNCE_MS,
+                                        step=10, yield_on_timeout=False):
+            changed = {Path(os.path.relpath(path)) for _, path in changes}
+            self._emit({path for path in changed if not is_ignored(path)})
+
+    def _emit(self, changed: Set[Path]):
+        """변경 콜백 호출 (콜백 오류가 감시를 멈추지 않도록 보호)"""
+        if not changed:
+            return
+        try:
+            self.callback(changed)
+        except Exception as e:
+            print(f"⚠️  변경 처리 중 오류: {e}")
+
+    @property
+    def backend(self) -> str:
+        """사용 중인 감시 방식"""
+        return "watchfiles" if watchfiles is not None else "polling"
+
+    def start(self) -> "FileWatcher":
+        """백그라운드 스레드에서 감시 시작"""
+        target = self._watchfiles_loop if watchfiles is not None else self._poll_loop
+        self._thread = threading.Thread(target=target, name="file-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """감시 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def run_forever(self):
+        """현재 스레드를 막고 감시 (Ctrl+C로 종료)"""
+        self.start()
+        try:
+            while self._thread.is_alive():
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            self.stop()